@@ -1,14 +1,15 @@
 # Prüft, ob ein User mit einer bestimmten E-Mail existiert (über Query-Parameter 'email')
-from django.contrib.auth.models import User
 from rest_framework import permissions
 
+from authentication_app.lookups import email_in_use
+
 class EmailExistsPermission(permissions.BasePermission):
 	"""
     Permission-Klasse, die prüft, ob ein User mit einer bestimmten E-Mail existiert.
 
     Verwendung:
         - Erwartet den Query-Parameter 'email' in der Anfrage.
-        - Gibt Zugriff nur frei, wenn ein User mit dieser E-Mail existiert.
+        - Gibt Zugriff nur frei, wenn ein User mit dieser E-Mail existiert (Groß-/Kleinschreibung egal).
         - Setzt eine verständliche Fehlermeldung, falls die E-Mail fehlt oder nicht gefunden wird.
     """
 	message = 'Die E-Mail-Adresse existiert nicht.'
@@ -18,7 +19,7 @@ class EmailExistsPermission(permissions.BasePermission):
 		if not email:
 			self.message = 'E-Mail-Parameter fehlt.'
 			return False
-		if not User.objects.filter(email=email).exists():
+		if not email_in_use(email):
 			self.message = 'Die E-Mail-Adresse existiert nicht.'
 			return False
 		return True
@@ -6,6 +6,7 @@ Serializers für das authentication_app API.
 """
 
 from rest_framework import serializers
+from authentication_app.lookups import email_in_use
 from authentication_app.models import UserProfile
 from django.contrib.auth.models import User
 
@@ -44,7 +45,7 @@ class RegistrationSerializer(serializers.ModelSerializer):
 
     Validierung:
         - Prüft, ob die Passwörter übereinstimmen.
-        - Prüft, ob die E-Mail bereits vergeben ist.
+        - Prüft, ob die E-Mail bereits vergeben ist (Groß-/Kleinschreibung egal).
 
     Speicherung:
         - Erstellt einen neuen User mit verschlüsseltem Passwort.
@@ -78,6 +79,6 @@ class RegistrationSerializer(serializers.ModelSerializer):
         return account
 
     def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
+        if email_in_use(value):
             raise serializers.ValidationError("Email is already in use.")
         return value
\ No newline at end of file
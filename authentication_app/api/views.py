@@ -1,7 +1,5 @@
-from django.contrib.auth import authenticate, get_user_model
-from django.contrib.auth.models import User
+from django.contrib.auth import authenticate
 from rest_framework.authtoken.models import Token
-from rest_framework.authtoken.views import ObtainAuthToken
 
 from rest_framework.response import Response
 from rest_framework import generics
@@ -71,8 +69,23 @@ class RegistrationView(APIView):
             data = {'detail': 'Interner Serverfehler.'}
             status_code = 500
         return Response(data, status=status_code)
+
   
 
+class LogoutView(APIView):
+    """
+    API-Endpoint für den Logout.
+
+    POST:
+        Löscht das Auth-Token des Users. Das Token ist danach sofort ungültig.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        Token.objects.filter(user=request.user).delete()
+        return Response(status=204)
+
+
 class LoginView(APIView):
     """
     API-Endpoint für den Login.
@@ -80,6 +93,9 @@ class LoginView(APIView):
     POST:
         Erwartet email und password.
         Gibt bei Erfolg ein Auth-Token und Userdaten zurück.
+
+    Der User wird vom EmailBackend samt Token in einer Query geladen; nur wenn noch
+    kein Token existiert, folgt ein INSERT.
     """
     permission_classes = [AllowAny]
 
@@ -91,14 +107,9 @@ class LoginView(APIView):
             if serializer.is_valid():
                 email = serializer.validated_data['email']
                 password = serializer.validated_data['password']
-                User = get_user_model()
-                try:
-                    user_obj = User.objects.get(email=email)
-                except User.DoesNotExist:
-                    return Response({'detail': 'Ungültige Zugangsdaten.'}, status=400)
-                user = authenticate(username=user_obj.username, password=password)
+                user = authenticate(request, email=email, password=password)
                 if user:
-                    token, _ = Token.objects.get_or_create(user=user)
+                    token = self._get_or_create_token(user)
                     data = {
                         'token': token.key,
                         'fullname': user.username,
@@ -116,4 +127,10 @@ class LoginView(APIView):
             data = {'detail': 'Interner Serverfehler.'}
             status_code = 500
 
-        return Response(data, status=status_code)
\ No newline at end of file
+        return Response(data, status=status_code)
+
+    def _get_or_create_token(self, user):
+        try:
+            return user.auth_token
+        except Token.DoesNotExist:
+            return Token.objects.create(user=user)
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Authentifizierung für das KanMind API.
+
+- TokenUserCache: Prozesslokaler LRU-Cache mit TTL für Token -> (User, Token).
+- CachedTokenAuthentication: TokenAuthentication, die vor der Datenbank im Cache nachsieht.
+  Mit aauthenticate steht dieselbe Prüfung für asynchrone Views bereit.
+
+Konfiguration (settings.TOKEN_AUTH_CACHE):
+    - ENABLED: Cache ein-/ausschalten (Standard: True)
+    - MAX_SIZE: Maximale Anzahl gecachter Tokens (Standard: 10000)
+    - TTL: Lebensdauer eines Eintrags in Sekunden (Standard: 60)
+
+Invalidiert wird sofort beim Logout, bei Token-Rotation (Löschen des alten Tokens) und bei jeder
+Änderung am User (z.B. Deaktivierung), siehe authentication_app/signals.py. Da der Cache pro
+Prozess gehalten wird, begrenzt die TTL, wie lange andere Worker einen alten Stand sehen können.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+
+DEFAULTS = {
+    'ENABLED': True,
+    'MAX_SIZE': 10000,
+    'TTL': 60,
+}
+
+
+def _config(name):
+    return getattr(settings, 'TOKEN_AUTH_CACHE', {}).get(name, DEFAULTS[name])
+
+
+class TokenUserCache:
+    """
+    Threadsicherer LRU-Cache mit Ablaufzeit für Token-Lookups.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def set(self, key, user, token):
+        expires = time.monotonic() + _config('TTL')
+        with self._lock:
+            self._entries[key] = (expires, user, token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > _config('MAX_SIZE'):
+                self._entries.popitem(last=False)
+
+    def invalidate_key(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[1].pk == user_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+token_cache = TokenUserCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication mit vorgeschaltetem Cache.
+
+    Bei einem Treffer entfällt die Token-/User-Query vollständig. Jede Anfrage erhält eine
+    Kopie des gecachten Users, damit Änderungen am request.user nicht in den Cache durchschlagen.
+    """
+
+    def authenticate_credentials(self, key):
+        if not _config('ENABLED'):
+            return super().authenticate_credentials(key)
+        cached = token_cache.get(key)
+        if cached is not None:
+            user, token = cached
+            return (copy.copy(user), token)
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(key, copy.copy(user), token)
+        return (user, token)
+
+    async def aauthenticate(self, request):
+        """
+        Asynchrone Variante von authenticate() für Django-Requests in async Views.
+        Gibt (user, token) oder None zurück und wirft dieselben Fehler wie TokenAuthentication.
+        """
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) == 1:
+            raise exceptions.AuthenticationFailed(_('Invalid token header. No credentials provided.'))
+        if len(auth) > 2:
+            raise exceptions.AuthenticationFailed(_('Invalid token header. Token string should not contain spaces.'))
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed(
+                _('Invalid token header. Token string should not contain invalid characters.')
+            )
+        return await self.aauthenticate_credentials(key)
+
+    async def aauthenticate_credentials(self, key):
+        cached = token_cache.get(key) if _config('ENABLED') else None
+        if cached is not None:
+            user, token = cached
+            return (copy.copy(user), token)
+        model = self.get_model()
+        try:
+            token = await model.objects.select_related('user').aget(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        if _config('ENABLED'):
+            token_cache.set(key, copy.copy(token.user), token)
+        return (token.user, token)
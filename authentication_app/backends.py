@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from authentication_app.lookups import users_by_email
+
+
+class EmailBackend(ModelBackend):
+    """
+    Authentifizierungs-Backend für den Login per E-Mail und Passwort.
+
+    Der User wird mit einer einzigen Query über den Index auf LOWER(email) geladen,
+    sein Auth-Token wird per select_related gleich mitgeladen (user.auth_token).
+    Das Passwort wird direkt am geladenen User geprüft, ein zweiter Lookup entfällt.
+    """
+
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        if email is None or password is None:
+            return None
+        user = users_by_email(email).select_related('auth_token').first()
+        if user is None:
+            # Hashing trotzdem ausführen, damit die Antwortzeit nicht verrät, ob die E-Mail existiert.
+            get_user_model()().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
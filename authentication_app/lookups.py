@@ -0,0 +1,118 @@
+"""
+E-Mail-Lookups auf dem User-Modell.
+
+Alle Abfragen über die E-Mail-Adresse laufen über diese Funktionen, damit sie den
+case-insensitiven Unique-Index auf LOWER(email) nutzen (Migration 0003_user_email_ci_unique).
+Der Index ist partiell (WHERE email > ''), deshalb enthält jede Abfrage dieselbe Bedingung.
+
+resolve_emails löst viele Adressen mit einer IN-Query auf und merkt sich nicht gefundene
+Adressen kurz im Django-Cache (negativer Cache), damit wiederholte Anfragen beim Tippen einer
+Adresse die Datenbank nicht erreichen. Legt sich ein User mit der Adresse an oder ändert seine
+Adresse, wird der Eintrag sofort gelöscht (authentication_app/signals.py).
+
+Konfiguration (settings.EMAIL_LOOKUP):
+    - MISS_TTL: Lebensdauer eines negativen Eintrags in Sekunden, 0 = kein Cache (Standard: 30)
+    - CACHE_ALIAS: Alias aus settings.CACHES (Standard: 'default')
+    - KEY_PREFIX: Präfix der Cache-Keys (Standard: 'email-miss')
+"""
+
+import hashlib
+import string
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models.functions import Lower
+
+DEFAULTS = {
+    'MISS_TTL': 30,
+    'CACHE_ALIAS': 'default',
+    'KEY_PREFIX': 'email-miss',
+}
+
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _config(name):
+    return getattr(settings, 'EMAIL_LOOKUP', {}).get(name, DEFAULTS[name])
+
+
+def _cache():
+    return caches[_config('CACHE_ALIAS')]
+
+
+def _miss_key(email):
+    # Gehasht, damit beliebige Eingaben gültige Cache-Keys ergeben.
+    return f"{_config('KEY_PREFIX')}:{hashlib.sha1(email.encode()).hexdigest()}"
+
+
+def normalize_email(email):
+    """
+    Normalisiert eine E-Mail-Adresse für den Vergleich (ohne Leerzeichen, A-Z kleingeschrieben).
+
+    Wie LOWER() in SQLite, auf dem Index und Filter beruhen, werden nur ASCII-Buchstaben
+    umgewandelt: Mit str.lower() würde 'JÖRG@x.de' zu 'jörg@x.de', in der Datenbank aber zu
+    'jÖrg@x.de', und der gespeicherte User würde nie gefunden. Laut Unique-Index sind
+    'JÖRG@x.de' und 'jörg@x.de' verschiedene Adressen.
+    """
+    return (email or '').strip().translate(_ASCII_LOWER)
+
+
+def users_by_email(email, queryset=None):
+    """
+    Gibt ein Queryset der User mit dieser E-Mail-Adresse zurück (Groß-/Kleinschreibung egal).
+    """
+    if queryset is None:
+        queryset = get_user_model().objects.all()
+    return queryset.alias(email_lower=Lower('email')).filter(
+        email_lower=normalize_email(email), email__gt=''
+    )
+
+
+def email_in_use(email):
+    return users_by_email(email).exists()
+
+
+def users_by_emails(emails, queryset=None):
+    """
+    Wie users_by_email für mehrere Adressen, mit einer Query (LOWER(email) IN (...)).
+    """
+    if queryset is None:
+        queryset = get_user_model().objects.all()
+    return queryset.alias(email_lower=Lower('email')).filter(
+        email_lower__in={normalize_email(email) for email in emails}, email__gt=''
+    )
+
+
+def resolve_emails(emails):
+    """
+    Gibt {normalisierte Adresse: User oder None} für alle Adressen zurück.
+
+    Adressen mit negativem Cache-Eintrag werden nicht abgefragt, alle übrigen mit einer Query.
+    Die geladenen User enthalten nur id, email und username.
+    """
+    emails = {normalize_email(email) for email in emails} - {''}
+    result = dict.fromkeys(emails)
+    ttl = _config('MISS_TTL')
+    if ttl:
+        keys = {_miss_key(email): email for email in emails}
+        cached = _cache().get_many(list(keys))
+        emails -= {keys[key] for key in cached}
+    if emails:
+        for user in users_by_emails(emails).only('id', 'email', 'username'):
+            result[normalize_email(user.email)] = user
+        if ttl:
+            misses = {_miss_key(email): True for email in emails if result[email] is None}
+            if misses:
+                _cache().set_many(misses, timeout=ttl)
+    return result
+
+
+def forget_email_miss(email):
+    """
+    Löscht den negativen Cache-Eintrag einer Adresse (nach Registrierung oder Adressänderung).
+    """
+    email = normalize_email(email)
+    if email:
+        _cache().delete(_miss_key(email))
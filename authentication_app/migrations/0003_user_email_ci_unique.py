@@ -0,0 +1,40 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_duplicate_emails(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    duplicates = list(
+        User.objects.exclude(email='')
+        .annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Doppelte E-Mail-Adressen (Groß-/Kleinschreibung ignoriert) müssen vor der Migration '
+            'bereinigt werden: ' + ', '.join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+    """
+    Case-insensitiver Unique-Index auf auth_user.email für den Login und alle E-Mail-Lookups
+    (siehe authentication_app/lookups.py). Leere E-Mail-Adressen sind ausgenommen.
+    """
+
+    dependencies = [
+        ('authentication_app', '0002_alter_userprofile_options_alter_userprofile_bio_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql="CREATE UNIQUE INDEX auth_user_email_ci_uniq ON auth_user (LOWER(email)) WHERE email > ''",
+            reverse_sql='DROP INDEX auth_user_email_ci_uniq',
+        ),
+    ]
@@ -0,0 +1,34 @@
+"""
+Signal-Handler des authentication_app.
+
+Halten den Token-Cache (authentication_app.authentication.token_cache) und den negativen Cache
+der E-Mail-Lookups (authentication_app.lookups) aktuell.
+"""
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from authentication_app.authentication import token_cache
+from authentication_app.lookups import forget_email_miss
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    token_cache.invalidate_key(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    token_cache.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def user_email_saved(sender, instance, **kwargs):
+    # Neue User und geänderte Adressen dürfen nicht mehr als 'nicht gefunden' gelten. Gelöscht wird
+    # nach dem Commit, vorher würde eine gleichzeitige Abfrage den User noch nicht sehen.
+    email = instance.email
+    transaction.on_commit(lambda: forget_email_miss(email))
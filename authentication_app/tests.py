@@ -1,3 +1,159 @@
-from django.test import TestCase
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from authentication_app.authentication import token_cache
+from authentication_app.lookups import resolve_emails, users_by_email, users_by_emails
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """
+    Tests für CachedTokenAuthentication.
+    """
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('email-check') + '?email=lisa@example.com'
+
+    def test_second_request_skips_token_query(self):
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(token_cache.stats(), {'size': 1, 'hits': 1, 'misses': 1})
+
+    def test_logout_invalidates_token(self):
+        self.client.get(self.url)
+        self.assertEqual(self.client.post(reverse('logout')).status_code, 204)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_rotation_invalidates_token(self):
+        self.client.get(self.url)
+        self.token.delete()
+        Token.objects.create(user=self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_deactivation_invalidates_user(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+
+class LoginTests(APITestCase):
+    """
+    Tests für POST /api/login/ mit dem EmailBackend.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='lisa', email='Lisa@Example.com', password='geheim123')
+        self.url = reverse('login')
+
+    def _login(self, email, password='geheim123'):
+        return self.client.post(self.url, {'email': email, 'password': password}, format='json')
+
+    def test_login_is_case_insensitive(self):
+        response = self._login('lisa@example.COM')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['user_id'], self.user.id)
+        self.assertEqual(response.json()['token'], Token.objects.get(user=self.user).key)
+
+    def test_wrong_password_or_email(self):
+        self.assertEqual(self._login('lisa@example.com', 'falsch').status_code, 400)
+        self.assertEqual(self._login('niemand@example.com').status_code, 400)
+
+    def test_existing_token_needs_single_query(self):
+        token = Token.objects.create(user=self.user)
+        with self.assertNumQueries(1):
+            response = self._login('lisa@example.com')
+        self.assertEqual(response.json()['token'], token.key)
+
+    def test_registration_rejects_email_in_other_case(self):
+        response = self.client.post(reverse('registration'), {
+            'fullname': 'Lisa Zwei', 'email': 'LISA@example.com',
+            'password': 'geheim123', 'repeated_password': 'geheim123',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_email_lookup_uses_index(self):
+        sql, params = users_by_email('lisa@example.com').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+        self.assertIn('auth_user_email_ci_uniq', plan)
+
+    def test_email_check_uses_same_lookup(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse('email-check') + '?email=LISA@example.com')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], self.user.pk)
+
+    def test_non_ascii_email_matches_sqlite_lower(self):
+        # LOWER() in SQLite faltet nur A-Z; die Normalisierung muss dasselbe tun.
+        user = User.objects.create_user(username='joerg', email='JÖRG@example.de', password='geheim123')
+        self.assertEqual(authenticate(email='jÖrg@EXAMPLE.de', password='geheim123'), user)
+        self.assertEqual(list(users_by_emails(['JÖRG@Example.de'])), [user])
+        self.assertEqual(resolve_emails(['JÖRG@EXAMPLE.DE']), {'jÖrg@example.de': user})
+        # Für SQLite (und den Unique-Index) ist 'jörg' eine andere Adresse.
+        self.assertFalse(users_by_email('jörg@example.de').exists())
+
+
+
+class EmailBatchCheckTests(APITestCase):
+    """
+    Tests für POST /api/email-check/batch/ und den negativen Cache der E-Mail-Lookups.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='Lisa', email='Lisa@Example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.url = reverse('email-check-batch')
+
+    def _check(self, emails):
+        return self.client.post(self.url, {'emails': emails}, format='json')
+
+    def test_resolves_all_addresses_with_one_query(self):
+        with self.assertNumQueries(1):
+            response = self._check(['lisa@example.com', 'max@example.com', 'kaputt', 'LISA@example.com'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [
+            {'email': self.user.email, 'status': 'found', 'id': self.user.pk, 'fullname': 'Lisa'},
+            {'email': 'max@example.com', 'status': 'not_found'},
+            {'email': 'kaputt', 'status': 'invalid'},
+        ])
+
+    def test_misses_are_cached_until_registration(self):
+        self._check(['max@example.com'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self._check(['max@example.com']).json()['results'][0]['status'], 'not_found')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username='Max', email='Max@example.com', password='pw')
+        self.assertEqual(self._check(['max@example.com']).json()['results'][0]['status'], 'found')
+
+    def test_single_check_uses_negative_cache(self):
+        url = reverse('email-check') + '?email=max@example.com'
+        self.assertEqual(self.client.get(url).status_code, 404)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_rejects_invalid_payload(self):
+        self.assertEqual(self._check('lisa@example.com').status_code, 400)
+        self.assertEqual(self._check([]).status_code, 400)
+        self.assertEqual(self._check([f'user{index}@example.com' for index in range(301)]).status_code, 400)
+
+    def test_lookup_uses_index(self):
+        sql, params = users_by_emails(['lisa@example.com', 'max@example.com']).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+        self.assertIn('auth_user_email_ci_uniq', plan)
+        self.assertNotIn('SCAN', plan)
@@ -0,0 +1,9 @@
+"""
+Benchmarks für das KanMind Backend.
+
+Jedes Modul ist direkt ausführbar, z.B.:
+
+    python -m benchmarks.token_auth
+
+Die Benchmarks laufen gegen eine temporäre Testdatenbank und verändern db.sqlite3 nicht.
+"""
@@ -0,0 +1,62 @@
+"""
+Gemeinsame Hilfsfunktionen der Benchmarks.
+"""
+
+import contextlib
+import os
+import statistics
+import time
+
+
+def setup_django(database_name=None):
+    """
+    Initialisiert Django mit core.settings und legt eine temporäre Testdatenbank an.
+    Ohne database_name liegt sie (bei SQLite) im Speicher, sonst in dieser Datei.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    import django
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    if database_name is not None:
+        connection.settings_dict['TEST']['NAME'] = database_name
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+@contextlib.contextmanager
+def count_queries():
+    """
+    Zählt die ausgeführten Queries; das Ergebnis steht nach dem Block in result['queries'].
+    """
+    from django.db import connection
+
+    result = {'queries': 0}
+
+    def wrapper(execute, sql, params, many, context):
+        result['queries'] += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        yield result
+
+
+def measure(func, iterations):
+    """
+    Führt func iterations-mal aus und gibt Laufzeitstatistiken in Millisekunden zurück.
+    """
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+    return {
+        'iterations': iterations,
+        'total_ms': round(sum(durations), 2),
+        'mean_ms': round(statistics.fmean(durations), 4),
+        'p50_ms': round(durations[len(durations) // 2], 4),
+        'p95_ms': round(durations[int(len(durations) * 0.95) - 1], 4),
+    }
@@ -0,0 +1,177 @@
+"""
+Vergleicht den Durchsatz der lesenden Endpunkte unter ASGI (async Views) und WSGI (DRF-Views).
+
+    python -m benchmarks.asgi_vs_wsgi [--requests 400] [--concurrency 1 8 32] [--wsgi-workers 8] [--client-delay 5]
+
+Beide Handler laufen im Prozess, ohne Server davor:
+    - WSGI: ein Thread-Pool mit --wsgi-workers Threads (wie gunicorn --threads).
+    - ASGI: eine Event-Loop mit --concurrency gleichzeitigen Clients.
+--client-delay simuliert langsame Clients: so viele Millisekunden dauert das Ausliefern des
+Response-Bodys. Unter WSGI blockiert das den Worker-Thread, unter ASGI nur den Request selbst.
+Für Absolutwerte sollte zusätzlich mit einem echten Server (uvicorn / gunicorn) gemessen werden.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+
+def _summary(durations, total_seconds):
+    durations = sorted(durations)
+    return {
+        'requests': len(durations),
+        'requests_per_second': round(len(durations) / total_seconds, 1),
+        'p50_ms': round(durations[len(durations) // 2], 3),
+        'p95_ms': round(durations[int(len(durations) * 0.95) - 1], 3),
+        'p99_ms': round(durations[int(len(durations) * 0.99) - 1], 3),
+        'mean_ms': round(statistics.fmean(durations), 3),
+    }
+
+
+def run_wsgi(handler, requests, workers, concurrency, delay):
+    """
+    Führt die Requests mit einem Thread-Pool gegen den WSGIHandler aus. 'concurrency' Clients
+    stellen ihre Requests gleichzeitig; mehr als 'workers' werden aber nicht parallel bearbeitet.
+    """
+    def call(request):
+        path, token = request
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SERVER_NAME': 'testserver',
+            'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1', 'HTTP_HOST': 'testserver',
+            'HTTP_AUTHORIZATION': f'Token {token}', 'wsgi.input': BytesIO(), 'wsgi.url_scheme': 'http',
+            'wsgi.errors': BytesIO(),
+        }
+        start = time.perf_counter()
+        status = []
+        body = b''.join(handler(environ, lambda code, headers: status.append(code)))
+        time.sleep(delay)  # Der Worker liefert den Body an einen langsamen Client aus.
+        assert status[0].startswith('200'), (path, status[0], body[:200])
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(workers, concurrency)) as pool:
+        durations = list(pool.map(call, requests))
+    return _summary(durations, time.perf_counter() - start)
+
+
+def run_asgi(application, requests, concurrency, delay):
+    """
+    Führt die Requests mit 'concurrency' gleichzeitigen Clients in einer Event-Loop aus.
+    """
+    async def call(path, token):
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+            'headers': [(b'host', b'testserver'), (b'authorization', f'Token {token}'.encode())],
+            'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+        }
+        received = asyncio.get_running_loop().create_future()
+        messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+        result = {}
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await received  # Kein Disconnect während des Requests.
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                result['status'] = message['status']
+            elif message['type'] == 'http.response.body':
+                await asyncio.sleep(delay)  # Langsamer Client: nur dieser Request wartet.
+
+        start = time.perf_counter()
+        await application(scope, receive, send)
+        received.cancel()
+        assert result['status'] == 200, (path, result)
+        return (time.perf_counter() - start) * 1000
+
+    async def main():
+        queue = list(requests)
+        durations = []
+
+        async def client():
+            while queue:
+                durations.append(await call(*queue.pop()))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return _summary(durations, time.perf_counter() - start)
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--wsgi-workers', type=int, default=8)
+    parser.add_argument('--client-delay', type=float, default=5.0, help='Millisekunden pro Response.')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--tasks', type=int, default=2000)
+    args = parser.parse_args()
+
+    from benchmarks._setup import setup_django
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.core.handlers.wsgi import WSGIHandler
+    from rest_framework.authtoken.models import Token
+
+    from boards_app.models import Board
+    from core.asgi import KanMindASGIHandler
+    from tasks_app.models import Comment, Task
+
+    users = User.objects.bulk_create([
+        User(username=f'user{index}', email=f'user{index}@example.com') for index in range(args.users)
+    ])
+    tokens = {token.user_id: token.key for token in Token.objects.bulk_create(
+        [Token(user=user, key=Token.generate_key()) for user in users]
+    )}
+    boards = Board.objects.bulk_create([Board(title=f'Board {index}', owner=users[index]) for index in range(len(users))])
+    Board.members.through.objects.bulk_create([
+        Board.members.through(board_id=board.pk, user_id=user.pk)
+        for board in boards for user in random.sample(users, 5)
+    ], ignore_conflicts=True)
+    tasks = Task.objects.bulk_create([
+        Task(
+            board=random.choice(boards), title=f'Task {index}', created_by=random.choice(users),
+            assignee=random.choice(users), reviewer=random.choice(users + [None]),
+        )
+        for index in range(args.tasks)
+    ], batch_size=500)
+    Comment.objects.bulk_create([
+        Comment(task=task, author=random.choice(users), content='Kommentar') for task in tasks[:200]
+    ])
+
+    requests = []
+    for _ in range(args.requests):
+        board = random.choice(boards)
+        task = random.choice(tasks[:200])
+        requests.append(random.choice([
+            ('/api/boards/', tokens[board.owner_id]),
+            (f'/api/boards/{board.pk}/', tokens[board.owner_id]),
+            ('/api/tasks/assigned-to-me/', random.choice(list(tokens.values()))),
+            ('/api/tasks/reviewing/', random.choice(list(tokens.values()))),
+            (f'/api/tasks/{task.pk}/comments/', tokens[task.board.owner_id]),
+        ]))
+
+    wsgi, asgi = WSGIHandler(), KanMindASGIHandler()
+    delay = args.client_delay / 1000
+    results = {}
+    for concurrency in args.concurrency:
+        results[f'concurrency_{concurrency}'] = {
+            'wsgi': run_wsgi(wsgi, requests, args.wsgi_workers, concurrency, delay),
+            'asgi': run_asgi(asgi, requests, concurrency, delay),
+        }
+    print(json.dumps({
+        'wsgi_workers': args.wsgi_workers, 'client_delay_ms': args.client_delay, **results,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
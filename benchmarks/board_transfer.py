@@ -0,0 +1,91 @@
+"""
+Misst Laufzeit und Spitzen-Speicherbedarf von NDJSON-Export und -Import eines großen Boards.
+
+    python -m benchmarks.board_transfer [--tasks 100000] [--comments 50000]
+
+Der Speicher wird mit tracemalloc gemessen (Python-Allokationen während Export bzw. Import).
+Zum Vergleich wird der Speicherbedarf des vollständig gerenderten BoardDetailSerializer ausgegeben.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {'seconds': round(seconds, 2), 'peak_mb': round(peak / 1e6, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=100000)
+    parser.add_argument('--comments', type=int, default=50000)
+    args = parser.parse_args()
+
+    from benchmarks._setup import setup_django
+    setup_django()
+    from django.contrib.auth.models import User
+    from rest_framework.renderers import JSONRenderer
+
+    from boards_app.api.serializers import BoardDetailSerializer
+    from boards_app.api.views import BoardDetailView
+    from boards_app.models import Board
+    from boards_app.transfer import export_board_lines, import_board_lines
+    from tasks_app.models import Comment, Task
+
+    users = User.objects.bulk_create([
+        User(username=f'user{index}', email=f'user{index}@example.com') for index in range(20)
+    ])
+    board = Board.objects.create(title='Groß', owner=users[0])
+    board.members.add(*users[1:])
+    tasks = Task.objects.bulk_create([
+        Task(
+            board=board, title=f'Task {index}', description='Beschreibung ' * 10, created_by=users[0],
+            assignee=random.choice(users), position=index * 1024,
+        )
+        for index in range(args.tasks)
+    ], batch_size=5000)
+    Comment.objects.bulk_create([
+        Comment(task=random.choice(tasks), author=random.choice(users), content='Kommentar ' * 5)
+        for _ in range(args.comments)
+    ], batch_size=5000)
+    del tasks
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'board.ndjson')
+
+        def export():
+            with open(path, 'w', encoding='utf-8') as output:
+                output.writelines(export_board_lines(board))
+            return os.path.getsize(path)
+
+        def import_():
+            with open(path, encoding='utf-8') as source:
+                return import_board_lines(source, users[1])[1]
+
+        def materialize():
+            board_with_tasks = BoardDetailView().get_detail_queryset().get(pk=board.pk)
+            return len(JSONRenderer().render(BoardDetailSerializer(board_with_tasks).data))
+
+        size, exported = _measure(export)
+        counts, imported = _measure(import_)
+        _, detail = _measure(materialize)
+
+    print(json.dumps({
+        'tasks': args.tasks, 'comments': args.comments, 'export_bytes': size,
+        'export': exported, 'import': dict(imported, **counts), 'board_detail_serializer': detail,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
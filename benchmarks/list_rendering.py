@@ -0,0 +1,82 @@
+"""
+Vergleicht den regulären Serializer mit dem schnellen Lesepfad für Task- und Board-Listen.
+
+    python -m benchmarks.list_rendering [--tasks 5000] [--boards 500] [--iterations 20]
+
+Gemessen wird Laden plus Rendern bis zum fertigen JSON. Vorher wird geprüft, dass beide
+Pfade byte-identisches JSON erzeugen.
+"""
+
+import argparse
+import datetime
+import json
+import random
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=5000)
+    parser.add_argument('--boards', type=int, default=500)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    from benchmarks._setup import measure, setup_django
+    setup_django()
+    from django.contrib.auth.models import User
+    from rest_framework.renderers import JSONRenderer
+
+    from boards_app.api.serializers import BoardListSerializer
+    from boards_app.api.views import BoardListCreateView
+    from boards_app.models import Board
+    from tasks_app.api.serializers import TaskListSerializer
+    from tasks_app.models import Task
+
+    users = User.objects.bulk_create([
+        User(username=f'user{index}', email=f'user{index}@example.com') for index in range(50)
+    ])
+    boards = Board.objects.bulk_create([
+        Board(title=f'Board {index}', owner=random.choice(users)) for index in range(args.boards)
+    ])
+    Task.objects.bulk_create([
+        Task(
+            board=random.choice(boards), title=f'Task {index}', description='Beschreibung',
+            status=random.choice(['to-do', 'in-progress', 'review', 'done']),
+            priority=random.choice(['low', 'medium', 'high']),
+            assignee=random.choice(users + [None]), reviewer=random.choice(users + [None]),
+            due_date=random.choice([None, datetime.date(2025, 1, 1) + datetime.timedelta(days=index % 300)]),
+            created_by=random.choice(users),
+        )
+        for index in range(args.tasks)
+    ], batch_size=500)
+
+    renderer = JSONRenderer()
+    task_queryset = Task.objects.all()
+    board_queryset = BoardListCreateView()._annotate_counts(Board.objects.all())
+    cases = {
+        'task_list': (
+            lambda: TaskListSerializer(TaskListSerializer.prepare_queryset(task_queryset), many=True).data,
+            lambda: TaskListSerializer.fast_render(TaskListSerializer.fast_queryset(task_queryset)),
+            args.tasks,
+        ),
+        'board_list': (
+            lambda: BoardListSerializer(board_queryset, many=True).data,
+            lambda: BoardListSerializer.fast_render(BoardListSerializer.fast_queryset(board_queryset)),
+            args.boards,
+        ),
+    }
+
+    results = {}
+    for name, (serializer_path, fast_path, rows) in cases.items():
+        assert renderer.render(serializer_path()) == renderer.render(fast_path()), f'{name}: JSON weicht ab'
+        result = {}
+        for label, func in [('serializer', serializer_path), ('fast', fast_path)]:
+            stats = measure(lambda: renderer.render(func()), args.iterations)
+            stats['rows_per_second'] = round(rows * args.iterations / (stats['total_ms'] / 1000))
+            result[label] = stats
+        result['speedup'] = round(result['serializer']['mean_ms'] / result['fast']['mean_ms'], 2)
+        results[name] = result
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
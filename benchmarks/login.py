@@ -0,0 +1,87 @@
+"""
+Vergleicht den bisherigen Login-Ablauf mit dem EmailBackend.
+
+    python -m benchmarks.login [--users 2000] [--iterations 500] [--hasher md5|default]
+
+Standardmäßig wird der MD5-Hasher verwendet, damit die Datenbankzugriffe sichtbar werden;
+mit '--hasher default' dominiert das Passwort-Hashing (PBKDF2) die Laufzeit.
+"""
+
+import argparse
+import json
+import random
+
+
+def legacy_login(email, password):
+    """
+    Der frühere Ablauf von LoginView.post: Lookup per E-Mail, authenticate() per Username,
+    anschließend Token.objects.get_or_create.
+    """
+    from django.contrib.auth import authenticate
+    from django.contrib.auth.models import User
+    from rest_framework.authtoken.models import Token
+
+    user_obj = User.objects.filter(email=email).first()
+    if user_obj is None:
+        return None
+    user = authenticate(username=user_obj.username, password=password)
+    if user is None:
+        return None
+    token, _ = Token.objects.get_or_create(user=user)
+    return token.key
+
+
+def email_backend_login(email, password):
+    """
+    Der neue Ablauf von LoginView.post: EmailBackend lädt User und Token in einer Query.
+    """
+    from django.contrib.auth import authenticate
+
+    from authentication_app.api.views import LoginView
+
+    user = authenticate(None, email=email, password=password)
+    if user is None:
+        return None
+    return LoginView()._get_or_create_token(user).key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--hasher', choices=['md5', 'default'], default='md5')
+    args = parser.parse_args()
+
+    from benchmarks._setup import count_queries, measure, setup_django
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+    from rest_framework.authtoken.models import Token
+
+    if args.hasher == 'md5':
+        settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    password = make_password('geheim123')
+    users = User.objects.bulk_create([
+        User(username=f'user{index}', email=f'user{index}@example.com', password=password)
+        for index in range(args.users)
+    ])
+    Token.objects.bulk_create([Token(user=user, key=Token.generate_key()) for user in users])
+
+    emails = [user.email for user in users]
+
+    results = {}
+    for name, login in [('legacy', legacy_login), ('email_backend', email_backend_login)]:
+        def func():
+            assert login(random.choice(emails), 'geheim123')
+
+        with count_queries() as queries:
+            stats = measure(func, args.iterations)
+        stats['queries_per_login'] = queries['queries'] / args.iterations
+        stats['logins_per_second'] = round(args.iterations / (stats['total_ms'] / 1000), 1)
+        results[name] = stats
+    print(json.dumps({'hasher': args.hasher, 'users': args.users, **results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Misst den Lesedurchsatz der GET-Endpunkte mit 0, 1, 2 und 4 Lesereplikaten (core/replicas.py).
+
+    python -m benchmarks.read_replicas [--replicas 0 1 2 4] [--requests 600] [--clients 32]
+                                       [--db-slots 2] [--query-latency 4]
+
+Primärdatenbank und Replikate sind SQLite-Dateien in einem temporären Verzeichnis; die Replikate
+werden vor dem Lauf mit sync_sqlite_replicas gefüllt. Die Requests laufen ohne Server direkt
+durch den WSGIHandler (inkl. ReplicaRoutingMiddleware), --clients Threads gleichzeitig.
+
+Alle Datenbanken teilen sich hier Prozess und CPU. Damit trotzdem sichtbar wird, was ein weiterer
+Datenbankserver bringt, wird jede Datenbank als Server mit begrenzter Kapazität modelliert:
+höchstens --db-slots Queries gleichzeitig (Kerne bzw. Verbindungen des Servers), jede Query
+belegt ihren Slot zusätzlich --query-latency Millisekunden (Netzwerk, I/O). Die Zahlen zeigen
+die Skalierung dieses Modells, für Absolutwerte muss gegen echte Replikate gemessen werden.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from io import BytesIO
+
+MAX_REPLICAS = 4
+
+
+class _DatabaseServer:
+    """
+    execute_wrapper, der eine Datenbank als Server mit 'slots' parallelen Queries und fester
+    Zusatzlatenz pro Query nachbildet und die Queries zählt.
+    """
+
+    def __init__(self, alias, slots, latency, counter):
+        self.alias = alias
+        self.slots = threading.BoundedSemaphore(slots)
+        self.latency = latency
+        self.counter = counter
+
+    def __call__(self, execute, sql, params, many, context):
+        with self.slots:
+            time.sleep(self.latency)
+            self.counter[self.alias] += 1
+            return execute(sql, params, many, context)
+
+
+def run(handler, requests, aliases, args):
+    from django.db import connections
+
+    counter = Counter()
+    servers = {alias: _DatabaseServer(alias, args.db_slots, args.query_latency / 1000, counter) for alias in aliases}
+    queue = list(requests)
+    durations = []
+    lock = threading.Lock()
+
+    def call(path, token):
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SERVER_NAME': 'testserver',
+            'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1', 'HTTP_HOST': 'testserver',
+            'REMOTE_ADDR': '127.0.0.1', 'HTTP_AUTHORIZATION': f'Token {token}', 'wsgi.input': BytesIO(),
+            'wsgi.url_scheme': 'http', 'wsgi.errors': BytesIO(),
+        }
+        status = []
+        body = b''.join(handler(environ, lambda code, headers: status.append(code)))
+        assert status[0].startswith('200'), (path, status[0], body[:200])
+
+    def client():
+        with contextlib.ExitStack() as stack:
+            for alias, server in servers.items():
+                stack.enter_context(connections[alias].execute_wrapper(server))
+            while True:
+                with lock:
+                    if not queue:
+                        break
+                    request = queue.pop()
+                start = time.perf_counter()
+                call(*request)
+                with lock:
+                    durations.append((time.perf_counter() - start) * 1000)
+        connections.close_all()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total = time.perf_counter() - start
+
+    durations.sort()
+    return {
+        'requests_per_second': round(len(durations) / total, 1),
+        'p50_ms': round(durations[len(durations) // 2], 2),
+        'p95_ms': round(durations[int(len(durations) * 0.95) - 1], 2),
+        'queries': dict(sorted(counter.items())),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--replicas', type=int, nargs='+', default=[0, 1, 2, 4])
+    parser.add_argument('--requests', type=int, default=600)
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--db-slots', type=int, default=2)
+    parser.add_argument('--query-latency', type=float, default=4.0, help='Millisekunden pro Query.')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--tasks', type=int, default=2000)
+    args = parser.parse_args()
+    if max(args.replicas) > MAX_REPLICAS:
+        parser.error(f'Höchstens {MAX_REPLICAS} Replikate.')
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['KANMIND_REPLICA_DATABASES'] = ','.join(
+            os.path.join(directory, f'replica_{index}.sqlite3') for index in range(1, MAX_REPLICAS + 1)
+        )
+        from benchmarks._setup import setup_django
+        setup_django(database_name=os.path.join(directory, 'primary.sqlite3'))
+        from django.contrib.auth.models import User
+        from django.core.cache import cache
+        from django.core.handlers.wsgi import WSGIHandler
+        from django.db import connections
+        from django.test import override_settings
+        from rest_framework.authtoken.models import Token
+
+        from boards_app.models import Board
+        from core.replicas import sync_sqlite_replicas
+        from tasks_app.models import Task
+
+        users = User.objects.bulk_create([
+            User(username=f'user{index}', email=f'user{index}@example.com') for index in range(args.users)
+        ])
+        tokens = {token.user_id: token.key for token in Token.objects.bulk_create(
+            [Token(user=user, key=Token.generate_key()) for user in users]
+        )}
+        boards = Board.objects.bulk_create([Board(title=f'Board {index}', owner=users[index]) for index in range(len(users))])
+        Board.members.through.objects.bulk_create([
+            Board.members.through(board_id=board.pk, user_id=user.pk)
+            for board in boards for user in random.sample(users, 5)
+        ], ignore_conflicts=True)
+        Task.objects.bulk_create([
+            Task(
+                board=random.choice(boards), title=f'Task {index}', created_by=random.choice(users),
+                assignee=random.choice(users), reviewer=random.choice(users + [None]),
+            )
+            for index in range(args.tasks)
+        ], batch_size=500)
+        replicas = [f'replica_{index}' for index in range(1, MAX_REPLICAS + 1)]
+        sync_sqlite_replicas(replicas)
+
+        requests = []
+        for _ in range(args.requests):
+            board = random.choice(boards)
+            requests.append(random.choice([
+                ('/api/boards/', tokens[board.owner_id]),
+                (f'/api/boards/{board.pk}/', tokens[board.owner_id]),
+                ('/api/tasks/assigned-to-me/', random.choice(list(tokens.values()))),
+                ('/api/tasks/reviewing/', random.choice(list(tokens.values()))),
+            ]))
+
+        results = {}
+        for count in args.replicas:
+            aliases = replicas[:count]
+            with override_settings(REPLICA_ROUTING={'ALIASES': aliases}):
+                cache.clear()
+                # Die Middleware liest die Konfiguration beim Erzeugen des Handlers.
+                handler = WSGIHandler()
+                results[f'replicas_{count}'] = run(handler, requests, ['default', *aliases], args)
+        print(json.dumps({
+            'clients': args.clients, 'db_slots': args.db_slots, 'query_latency_ms': args.query_latency, **results,
+        }, indent=2))
+        connections.close_all()
+
+
+if __name__ == '__main__':
+    main()
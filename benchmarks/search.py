@@ -0,0 +1,79 @@
+"""
+Misst die Volltextsuche (tasks_app/search.py) auf einem großen Korpus.
+
+    python -m benchmarks.search [--tasks 1000000] [--boards 2000] [--user-boards 20] [--iterations 50]
+
+Die Tasks werden per bulk_create angelegt und mit rebuild_search_index indiziert. Gemessen
+wird die Suche eines Users mit --user-boards Boards, einmal mit einem häufigen und einmal mit
+einem seltenen Begriff, jeweils eine Seite mit 20 Treffern inklusive Laden der Tasks.
+"""
+
+import argparse
+import io
+import json
+import random
+import time
+
+WORDS = [
+    'release', 'deployment', 'datenbank', 'frontend', 'backend', 'review', 'meeting', 'budget',
+    'kunde', 'rechnung', 'server', 'migration', 'test', 'fehler', 'design', 'konzept',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=1000000)
+    parser.add_argument('--boards', type=int, default=2000)
+    parser.add_argument('--user-boards', type=int, default=20)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    from benchmarks._setup import measure, setup_django
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+
+    from boards_app.models import Board
+    from tasks_app.api.serializers import TaskListSerializer
+    from tasks_app.models import Task
+    from tasks_app.search import get_search_backend
+
+    rng = random.Random(1)
+    user = User.objects.create(username='lisa', email='lisa@example.com')
+    boards = Board.objects.bulk_create([Board(title=f'Board {index}', owner=user) for index in range(args.boards)])
+    board_ids = [board.pk for board in boards]
+    start = time.perf_counter()
+    for offset in range(0, args.tasks, 50000):
+        Task.objects.bulk_create([
+            Task(
+                board_id=rng.choice(board_ids), created_by=user,
+                title=' '.join(rng.sample(WORDS, 3)) + f' {index}',
+                description=' '.join(rng.choices(WORDS, k=20)) + (' seltenheit' if index % 10000 == 0 else ''),
+            )
+            for index in range(offset, min(offset + 50000, args.tasks))
+        ], batch_size=5000)
+    created = time.perf_counter() - start
+    start = time.perf_counter()
+    call_command('rebuild_search_index', stdout=io.StringIO())
+    indexed = time.perf_counter() - start
+
+    backend = get_search_backend()
+    user_boards = rng.sample(board_ids, args.user_boards)
+
+    def search(terms):
+        task_ids = backend.search(terms, user_boards, 21)[:20]
+        rows = TaskListSerializer.fast_queryset(Task.objects.filter(pk__in=task_ids))
+        return TaskListSerializer.fast_render(rows)
+
+    print(json.dumps({
+        'tasks': args.tasks,
+        'create_seconds': round(created, 1),
+        'rebuild_index_seconds': round(indexed, 1),
+        'common_term': measure(lambda: search(['release']), args.iterations),
+        'two_terms': measure(lambda: search(['datenbank', 'mig']), args.iterations),
+        'rare_term': measure(lambda: search(['seltenheit']), args.iterations),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Vergleicht gleichzeitige Lese- und Schreibzugriffe mit SQLite-Standardeinstellungen und mit dem
+Profil aus core/sqlite.py.
+
+    python -m benchmarks.sqlite_concurrency [--writers 8] [--readers 8] [--seconds 10]
+
+Die Datenbank liegt in einer temporären Datei. Schreiber legen Tasks an wie TaskCreateView
+(Position lesen, Task anlegen, Zähler und Änderungsprotokoll schreiben, alles in einer
+Transaktion), Leser laden Tasks eines Boards über den schnellen Lesepfad. Nach jeder Operation
+wird wie am Ende eines Requests close_old_connections() aufgerufen. Fehlgeschlagene Operationen
+werden nicht wiederholt, sondern als Fehler gezählt.
+
+Modi:
+    - default: journal_mode=DELETE, synchronous=FULL, Busy-Timeout 5 s (Standard von Pythons
+      sqlite3), DEFERRED-Transaktionen, neue Verbindung pro Request
+    - tuned: SQLITE_PROFILE aus den Settings, IMMEDIATE-Transaktionen, persistente Verbindungen
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+MODES = {
+    'default': {
+        'profile': {
+            'JOURNAL_MODE': 'DELETE', 'SYNCHRONOUS': 'FULL', 'BUSY_TIMEOUT_MS': 5000,
+            'CACHE_SIZE_KB': 2000, 'MMAP_SIZE': 0, 'TEMP_STORE': 'DEFAULT',
+        },
+        'transaction_mode': None,
+        'conn_max_age': 0,
+    },
+    'tuned': {
+        'profile': None,
+        'transaction_mode': 'IMMEDIATE',
+        'conn_max_age': 600,
+    },
+}
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return round(values[max(0, int(len(values) * percent) - 1)], 2) if values else None
+
+
+def run(mode, boards, user_id, args):
+    from django.conf import settings
+    from django.db import OperationalError, close_old_connections, connection, transaction
+    from django.test import override_settings
+
+    from boards_app.changelog import record_changes
+    from boards_app.models import BoardChange
+    from boards_app.stats import apply_task_transition, task_state
+    from tasks_app.api.serializers import TaskListSerializer
+    from tasks_app.models import Task
+    from tasks_app.positions import next_position
+
+    config = MODES[mode]
+    connection.close()
+    connection.settings_dict['CONN_MAX_AGE'] = config['conn_max_age']
+    connection.settings_dict['OPTIONS']['transaction_mode'] = config['transaction_mode']
+    profile = config['profile'] or getattr(settings, 'SQLITE_PROFILE', {})
+
+    deadline = time.perf_counter() + args.seconds
+    results = {'write': [], 'read': [], 'errors': 0}
+    lock = threading.Lock()
+
+    def write():
+        board_id = random.choice(boards)
+        with transaction.atomic():
+            position = next_position(board_id, 'to-do')
+            task = Task.objects.create(board_id=board_id, title='Neu', created_by_id=user_id, position=position)
+            apply_task_transition(None, task_state(task))
+            record_changes([(board_id, BoardChange.KIND_TASK, task.pk, False)])
+
+    def read():
+        rows = TaskListSerializer.fast_queryset(Task.objects.filter(board_id=random.choice(boards))[:50])
+        TaskListSerializer.fast_render(rows)
+
+    def worker(kind, operation):
+        durations, errors = [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                operation()
+                durations.append((time.perf_counter() - start) * 1000)
+            except OperationalError:
+                errors += 1
+            close_old_connections()
+        connection.close()
+        with lock:
+            results[kind] += durations
+            results['errors'] += errors
+
+    with override_settings(SQLITE_PROFILE=dict(profile, ENABLED=True)):
+        threads = [threading.Thread(target=worker, args=('write', write)) for _ in range(args.writers)]
+        threads += [threading.Thread(target=worker, args=('read', read)) for _ in range(args.readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        connection.close()
+
+    return {
+        'writes_per_second': round(len(results['write']) / args.seconds, 1),
+        'reads_per_second': round(len(results['read']) / args.seconds, 1),
+        'lock_errors': results['errors'],
+        'write_p50_ms': _percentile(results['write'], 0.5),
+        'write_p95_ms': _percentile(results['write'], 0.95),
+        'read_p95_ms': _percentile(results['read'], 0.95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--boards', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        from benchmarks._setup import setup_django
+        setup_django(database_name=os.path.join(directory, 'bench.sqlite3'))
+        from django.contrib.auth.models import User
+        from django.db import connections
+
+        from boards_app.models import Board, BoardStats
+
+        user = User.objects.create(username='lisa', email='lisa@example.com')
+        boards = Board.objects.bulk_create([Board(title=f'Board {index}', owner=user) for index in range(args.boards)])
+        BoardStats.objects.bulk_create([BoardStats(board=board) for board in boards])
+        board_ids = [board.pk for board in boards]
+
+        results = {mode: run(mode, board_ids, user.pk, args) for mode in MODES}
+        print(json.dumps({'writers': args.writers, 'readers': args.readers, 'seconds': args.seconds, **results}, indent=2))
+        connections.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Vergleicht TokenAuthentication mit CachedTokenAuthentication.
+
+    python -m benchmarks.token_auth [--iterations 5000]
+
+Gemessen wird nur die Authentifizierung einer Anfrage, also der Teil, der vor jeder View läuft.
+"""
+
+import argparse
+import json
+
+from benchmarks._setup import count_queries, measure, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.authtoken.models import Token
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from authentication_app.authentication import CachedTokenAuthentication, token_cache
+
+    user = User.objects.create_user(username='bench', email='bench@example.com', password='pw')
+    token = Token.objects.create(user=user)
+    factory = APIRequestFactory()
+
+    def run(authentication):
+        def authenticate():
+            request = Request(factory.get('/api/boards/', HTTP_AUTHORIZATION=f'Token {token.key}'))
+            authentication.authenticate(request)
+        with count_queries() as queries:
+            stats = measure(authenticate, args.iterations)
+        stats['queries_per_request'] = queries['queries'] / args.iterations
+        return stats
+
+    token_cache.clear()
+    results = {
+        'TokenAuthentication': run(TokenAuthentication()),
+        'CachedTokenAuthentication': run(CachedTokenAuthentication()),
+    }
+    baseline = results['TokenAuthentication']['mean_ms']
+    cached = results['CachedTokenAuthentication']['mean_ms']
+    results['saved_ms_per_request'] = round(baseline - cached, 4)
+    results['speedup'] = round(baseline / cached, 2) if cached else None
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+"""
+Cache der Board-Zugriffsrechte pro User.
+
+- get_board_roles: Liefert {board_id: 'owner' | 'member'} aller Boards, auf die ein User zugreifen darf.
+- aget_board_roles: Dasselbe für asynchrone Views (async Cache-API und async ORM).
+- invalidate_board: Erhöht die Version eines Boards und verwirft die Einträge betroffener User.
+- get_access_cache_stats: Hit-/Miss-Zähler für das Monitoring.
+
+Aufbau:
+    Pro User wird ein Eintrag {'roles': {...}, 'versions': {...}} im Django-Cache abgelegt.
+    'versions' enthält die Versionsnummer jedes enthaltenen Boards zum Zeitpunkt des Aufbaus.
+    Beim Lesen werden die aktuellen Versionen mit einem get_many geprüft; weicht eine ab,
+    wird der Eintrag neu aus der Datenbank aufgebaut. Versionen werden bei Mitgliederänderungen
+    und beim Löschen eines Boards erhöht, neu hinzugekommene Mitglieder verlieren ihren Eintrag.
+
+    Beim Aufbau werden die Versionen der bisher bekannten Boards und die Generation des Users
+    (wechselt bei jeder Invalidierung, die ihn betrifft) vor und nach dem Laden gelesen. Hat sich
+    dazwischen etwas geändert, ist das Ergebnis womöglich schon veraltet und wird nicht gecacht.
+
+Konfiguration (settings.BOARD_ACCESS_CACHE):
+    - CACHE_ALIAS: Alias aus settings.CACHES (Standard: 'default', lokal LocMemCache)
+    - TIMEOUT: Lebensdauer der Einträge in Sekunden (Standard: 300)
+    - KEY_PREFIX: Präfix der Cache-Keys (Standard: 'board-access')
+"""
+
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.db.models import Q
+
+from boards_app.models import Board
+
+ROLE_OWNER = 'owner'
+ROLE_MEMBER = 'member'
+
+DEFAULTS = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+    'KEY_PREFIX': 'board-access',
+}
+
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def _config(name):
+    return getattr(settings, 'BOARD_ACCESS_CACHE', {}).get(name, DEFAULTS[name])
+
+
+def _cache():
+    return caches[_config('CACHE_ALIAS')]
+
+
+def _user_key(user_id):
+    return f"{_config('KEY_PREFIX')}:user:{user_id}"
+
+
+def _version_key(board_id):
+    return f"{_config('KEY_PREFIX')}:board-version:{board_id}"
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get_access_cache_stats():
+    """
+    Gibt eine Kopie der Hit-/Miss-Zähler dieses Prozesses zurück.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_access_cache_stats():
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def _user_generation_key(user_id):
+    return f"{_config('KEY_PREFIX')}:user-generation:{user_id}"
+
+
+def _read_versions(keys):
+    """
+    Liest Versionszähler per get_many; fehlende werden mit einem Zeitstempel initialisiert,
+    damit ein verdrängter Zähler nie auf einen bereits vergebenen Wert zurückfällt.
+    """
+    cache = _cache()
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        initial = time.time_ns()
+        for key in missing:
+            cache.add(key, initial, timeout=None)
+        found.update(cache.get_many(missing))
+    return found
+
+
+def _current_versions(board_ids):
+    """
+    Gibt {board_id: Version} der Boards zurück.
+    """
+    keys = {_version_key(board_id): board_id for board_id in board_ids}
+    return {keys[key]: version for key, version in _read_versions(list(keys)).items()}
+
+
+def _snapshot_keys(user_id, board_ids):
+    return [_user_generation_key(user_id), *(_version_key(board_id) for board_id in board_ids)]
+
+
+def _roles_query(user_id):
+    # Immer von der primären Datenbank: Ein Replikat, das eine Mitgliederänderung noch nicht
+    # kennt, würde den alten Stand unter der neuen Version für TIMEOUT Sekunden cachen.
+    member_boards = Board.members.through.objects.using(DEFAULT_DB_ALIAS).filter(user_id=user_id).values('board_id')
+    return (
+        Board.objects.using(DEFAULT_DB_ALIAS).filter(Q(owner_id=user_id) | Q(pk__in=member_boards))
+        .values_list('pk', 'owner_id')
+    )
+
+
+def _load_roles(user_id):
+    rows = _roles_query(user_id)
+    return {
+        board_id: ROLE_OWNER if owner_id == user_id else ROLE_MEMBER
+        for board_id, owner_id in rows
+    }
+
+
+def _build_entry(roles, before, after):
+    """
+    Cache-Eintrag für 'roles' oder None, wenn sich zwischen den Momentaufnahmen 'before'
+    (vor dem Laden) und 'after' (danach) eine Version geändert hat.
+    """
+    if any(after.get(key) != version for key, version in before.items()):
+        return None
+    return {'roles': roles, 'versions': {board_id: after[_version_key(board_id)] for board_id in roles}}
+
+
+def get_board_roles(user):
+    """
+    Gibt {board_id: Rolle} für alle Boards zurück, bei denen der User Owner oder Mitglied ist.
+    'user' darf ein User-Objekt oder eine User-ID sein.
+    """
+    user_id = getattr(user, 'pk', user)
+    cache = _cache()
+    entry = cache.get(_user_key(user_id))
+    if entry is not None and _current_versions(entry['roles']) == entry['versions']:
+        _count('hits')
+        return entry['roles']
+
+    _count('misses')
+    known = entry['roles'] if entry is not None else {}
+    before = _read_versions(_snapshot_keys(user_id, known))
+    roles = _load_roles(user_id)
+    after = _read_versions(_snapshot_keys(user_id, {**known, **roles}))
+    entry = _build_entry(roles, before, after)
+    if entry is not None:
+        cache.set(_user_key(user_id), entry, timeout=_config('TIMEOUT'))
+    return roles
+
+
+async def _aread_versions(keys):
+    cache = _cache()
+    found = await cache.aget_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        initial = time.time_ns()
+        for key in missing:
+            await cache.aadd(key, initial, timeout=None)
+        found.update(await cache.aget_many(missing))
+    return found
+
+
+async def _acurrent_versions(board_ids):
+    keys = {_version_key(board_id): board_id for board_id in board_ids}
+    return {keys[key]: version for key, version in (await _aread_versions(list(keys))).items()}
+
+
+async def aget_board_roles(user):
+    """
+    Asynchrone Variante von get_board_roles; nutzt denselben Cache-Eintrag.
+    """
+    user_id = getattr(user, 'pk', user)
+    cache = _cache()
+    entry = await cache.aget(_user_key(user_id))
+    if entry is not None and await _acurrent_versions(entry['roles']) == entry['versions']:
+        _count('hits')
+        return entry['roles']
+
+    _count('misses')
+    known = entry['roles'] if entry is not None else {}
+    before = await _aread_versions(_snapshot_keys(user_id, known))
+    rows = _roles_query(user_id)
+    roles = {
+        board_id: ROLE_OWNER if owner_id == user_id else ROLE_MEMBER
+        async for board_id, owner_id in rows
+    }
+    after = await _aread_versions(_snapshot_keys(user_id, {**known, **roles}))
+    entry = _build_entry(roles, before, after)
+    if entry is not None:
+        await cache.aset(_user_key(user_id), entry, timeout=_config('TIMEOUT'))
+    return roles
+
+
+def get_accessible_board_ids(user):
+    return list(get_board_roles(user))
+
+
+def invalidate_board(board_id, user_ids=()):
+    """
+    Erhöht die Version des Boards, löscht die Einträge der angegebenen User und wechselt deren
+    Generation. Innerhalb einer Transaktion wird nach dem Commit ein zweites Mal invalidiert;
+    zusammen mit der Prüfung vor und nach dem Laden in get_board_roles speichert ein paralleler
+    Leser den alten Stand so nicht erneut zwischen.
+    """
+    def invalidate():
+        cache = _cache()
+        key = _version_key(board_id)
+        if not cache.add(key, time.time_ns(), timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+        if user_ids:
+            cache.delete_many([_user_key(user_id) for user_id in user_ids])
+            cache.set_many({_user_generation_key(user_id): uuid.uuid4().hex for user_id in user_ids}, timeout=None)
+
+    invalidate()
+    if connection.in_atomic_block:
+        transaction.on_commit(invalidate)
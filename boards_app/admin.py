@@ -1,4 +1,5 @@
 from django.contrib import admin
-from .models import Board
+from .models import Board, BoardStats
 
-admin.site.register(Board)
\ No newline at end of file
+admin.site.register(Board)
+admin.site.register(BoardStats)
@@ -0,0 +1,146 @@
+"""
+Asynchrone Lese-Views für den Betrieb unter ASGI (siehe core/asgi.py und core/urls_asgi.py).
+
+- AsyncReadView: Basisklasse mit Token-Authentifizierung, Fehlerbehandlung und Rendering wie DRF.
+- AsyncBoardListView: GET /api/boards/ (async Variante von BoardListCreateView).
+- AsyncBoardDetailView: GET /api/boards/<id>/ (async Variante von BoardDetailView).
+
+Die Views nutzen das async ORM und die async Varianten von Zugriffs-Cache und Token-Cache, ein
+Request belegt also keinen Worker-Thread, während er auf die Datenbank wartet. Antworten (Status,
+Header, JSON) entsprechen denen der synchronen DRF-Views. Alle anderen Methoden (POST, PATCH,
+DELETE, ...) werden an die synchrone View weitergereicht.
+"""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.renderers import JSONRenderer
+
+from authentication_app.authentication import CachedTokenAuthentication
+from boards_app.access_cache import aget_board_roles
+from boards_app.api.conditional import hashed_etag, parse_etags
+from boards_app.api.serializers import BoardDetailSerializer, BoardListSerializer
+from boards_app.api.views import BoardDetailView, BoardErrorResponsesMixin, BoardListCreateView
+from boards_app.membership import get_membership_resolver
+from boards_app.models import Board
+
+
+class AsyncReadView(View):
+    """
+    Basisklasse der async Lese-Views.
+
+    Unterklassen setzen sync_view_class (die DRF-View mit gleichem Verhalten) und implementieren
+    'async def get'. initial() authentifiziert per Token; Unterklassen können davor eigene Schritte
+    einfügen (wie DRF-Views, die initial() überschreiben). APIExceptions werden wie vom
+    DRF-exception_handler als {'detail': ...} gerendert.
+    """
+    sync_view_class = None
+    sync_view = None
+    renderer = JSONRenderer()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        initkwargs.setdefault('sync_view', cls.sync_view_class.as_view())
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+        try:
+            await self.initial(request, *args, **kwargs)
+            response = await self.get(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            response = self.render({'detail': exc.detail}, status=exc.status_code)
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                response['WWW-Authenticate'] = CachedTokenAuthentication().authenticate_header(request)
+        return self.finalize_response(request, response)
+
+    async def initial(self, request, *args, **kwargs):
+        request.user, request.auth = AnonymousUser(), None
+        result = await CachedTokenAuthentication().aauthenticate(request)
+        if result is None:
+            raise exceptions.NotAuthenticated()
+        request.user, request.auth = result
+
+    def render(self, data, status=200, etag=None):
+        if data is None:
+            # Wie DRF: eine Antwort ohne Daten (z.B. 304) hat keinen Content-Type.
+            response = HttpResponse(status=status)
+            del response['Content-Type']
+        else:
+            response = HttpResponse(self.renderer.render(data), status=status, content_type=self.renderer.media_type)
+        if etag is not None:
+            response['ETag'] = etag
+        return response
+
+    def not_modified(self, request, etag):
+        """
+        Gibt eine 304-Antwort zurück, wenn der If-None-Match-Header zum ETag passt, sonst None.
+        """
+        if etag is None:
+            return None
+        if_none_match = parse_etags(request.headers.get('If-None-Match'))
+        if etag in if_none_match or '*' in if_none_match:
+            return self.render(None, status=304, etag=etag)
+        return None
+
+    def finalize_response(self, request, response):
+        # Header wie APIView.finalize_response; setup() ergänzt HEAD wie bei der DRF-View.
+        sync_view = self.sync_view_class()
+        sync_view.setup(request)
+        response['Allow'] = ', '.join(sync_view.allowed_methods)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+
+
+class AsyncBoardListView(AsyncReadView):
+    """
+    GET: Alle Boards des Users mit Zählern (ETag, schneller Lesepfad).
+    """
+    sync_view_class = BoardListCreateView
+
+    async def get(self, request, *args, **kwargs):
+        board_ids = list(await aget_board_roles(request.user))
+        versions = Board.objects.filter(pk__in=board_ids).order_by('pk').values_list('pk', 'version')
+        etag = hashed_etag('boards', request.user.pk, [row async for row in versions])
+        response = self.not_modified(request, etag)
+        if response is not None:
+            return response
+
+        boards = BoardListCreateView()._annotate_counts(Board.objects.filter(pk__in=board_ids))
+        rows = [row async for row in BoardListSerializer.fast_queryset(boards)]
+        return self.render(BoardListSerializer.fast_render(rows), etag=etag)
+
+
+
+class AsyncBoardDetailView(BoardErrorResponsesMixin, AsyncReadView):
+    """
+    GET: Board mit Mitgliedern und Tasks, nur für Owner oder Mitglieder (ETag).
+    """
+    sync_view_class = BoardDetailView
+
+    async def get(self, request, *args, **kwargs):
+        board_id = kwargs.get('pk')
+        resolver = get_membership_resolver(request)
+        version = await Board.objects.filter(pk=board_id).order_by().values_list('version', flat=True).afirst()
+        # Existenz und Mitgliedschaft werden geprüft, bevor Mitglieder und Tasks geladen werden.
+        if version is None:
+            return self.render(self._not_found().data, status=404)
+        if not await resolver.ais_member_or_owner(request.user, board_id):
+            return self.render(self._forbidden().data, status=403)
+        etag = f'"board-{board_id}-{version}"'
+        response = self.not_modified(request, etag)
+        if response is not None:
+            return response
+
+        try:
+            # aget lädt auch die Prefetches (Mitglieder, Tasks) im selben Datenbank-Thread.
+            board = await BoardDetailView().get_detail_queryset().aget(pk=board_id)
+        except Board.DoesNotExist:
+            return self.render(self._not_found().data, status=404)
+        return self.render(BoardDetailSerializer(board).data, etag=etag)
@@ -0,0 +1,57 @@
+"""
+Conditional GET (ETag / If-None-Match) für Board- und Task-Endpunkte.
+
+Die ETags werden aus Board.version abgeleitet (siehe boards_app/versioning.py). Stimmt der
+vom Client gesendete If-None-Match-Header, antwortet die View mit 304, ohne das Queryset
+zu laden oder zu serialisieren.
+"""
+
+import hashlib
+
+from rest_framework.response import Response
+
+
+def parse_etags(header):
+    """
+    Zerlegt einen If-None-Match-Header in eine Menge von ETags (schwache ETags werden wie starke behandelt).
+    """
+    etags = set()
+    for value in (header or '').split(','):
+        value = value.strip()
+        if value.startswith('W/'):
+            value = value[2:]
+        if value:
+            etags.add(value)
+    return etags
+
+
+def hashed_etag(*parts):
+    """
+    Bildet aus beliebigen Teilen (z.B. Liste von (board_id, version)) einen starken ETag.
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+class ConditionalGetMixin:
+    """
+    Mixin für GET-Views mit ETag-Unterstützung.
+
+    Unterklassen implementieren get_etag(). Liefert sie None (z.B. weil das Objekt nicht existiert
+    oder der User keinen Zugriff hat), läuft die Anfrage unverändert weiter, damit die bestehende
+    Fehlerbehandlung (403/404) greift.
+    """
+
+    def get_etag(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        etag = self.get_etag(request, *args, **kwargs)
+        if etag is not None:
+            if_none_match = parse_etags(request.headers.get('If-None-Match'))
+            if etag in if_none_match or '*' in if_none_match:
+                return Response(status=304, headers={'ETag': etag})
+        response = super().get(request, *args, **kwargs)
+        if etag is not None and response.status_code == 200:
+            response['ETag'] = etag
+        return response
@@ -0,0 +1,49 @@
+"""
+Schneller Lesepfad für Listen-Endpunkte.
+
+Statt für jedes Objekt einen ModelSerializer samt verschachtelter Serializer aufzubauen, lädt
+der schnelle Pfad die Zeilen per .values() (inklusive der per JOIN gelesenen User-Daten) und
+baut die Dicts direkt. Das Ergebnis ist feldgleich und in derselben Reihenfolge wie beim
+regulären Serializer, das gerenderte JSON also byte-identisch.
+
+Ein Serializer unterstützt den schnellen Pfad, wenn er zwei statische Methoden anbietet:
+    - fast_queryset(queryset): Gibt ein .values()-Queryset mit allen benötigten Spalten zurück.
+    - fast_render(rows): Wandelt die Zeilen in die Ausgabe-Dicts um.
+"""
+
+from rest_framework.response import Response
+
+
+def render_user(user_id, email, username):
+    """
+    Ausgabe wie UserShortSerializer, oder None für einen leeren Fremdschlüssel.
+    """
+    if user_id is None:
+        return None
+    return {'id': user_id, 'email': email, 'fullname': username}
+
+
+def render_date(value):
+    """
+    Ausgabe wie serializers.DateField (ISO-Format).
+    """
+    return None if value is None else value.isoformat()
+
+
+class FastListMixin:
+    """
+    Mixin für ListAPIViews; mit fast_rendering = True wird der schnelle Pfad genutzt.
+    Pagination funktioniert weiter, sofern sie mit Dict-Zeilen umgehen kann (wie TaskKeysetPagination).
+    """
+    fast_rendering = False
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        if not self.fast_rendering or not hasattr(serializer_class, 'fast_render'):
+            return super().list(request, *args, **kwargs)
+
+        queryset = serializer_class.fast_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer_class.fast_render(page))
+        return Response(serializer_class.fast_render(queryset))
@@ -1,11 +1,13 @@
 from rest_framework import permissions
 
+from boards_app.membership import get_membership_resolver
+
 class IsBoardOwner(permissions.BasePermission):
     """
     Permission-Klasse, die prüft, ob der aktuelle Benutzer der Owner des Boards ist.
     """
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
     
 
     
@@ -14,4 +16,4 @@ class IsBoardOwnerOrMember(permissions.BasePermission):
     Permission-Klasse, die prüft, ob der aktuelle Benutzer Owner oder Mitglied des Boards ist.
     """
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user or request.user in obj.members.all()
\ No newline at end of file
+        return get_membership_resolver(request).is_member_or_owner(request.user, obj)
\ No newline at end of file
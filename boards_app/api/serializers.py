@@ -1,10 +1,68 @@
 from django.contrib.auth.models import User
 
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 
-from tasks_app.models import Task
+from boards_app.membership import set_board_members
 from boards_app.models import Board
 
+
+class MemberIdsField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField für User-IDs, das mit many=True alle IDs zusammen prüft.
+
+    Statt einer Query pro ID wird die gesamte Liste mit einer IN-Query validiert. Ergebnis ist
+    die Liste der IDs (ohne Duplikate, Reihenfolge der Eingabe), nicht die User-Objekte.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return _MemberIdListField(**list_kwargs)
+
+    def to_representation(self, value):
+        return getattr(value, 'pk', value)
+
+    def to_internal_value_many(self, data):
+        ids = []
+        for value in data:
+            if isinstance(value, bool) or not isinstance(value, (int, str)):
+                self.fail('incorrect_type', data_type=type(value).__name__)
+            try:
+                ids.append(int(value))
+            except ValueError:
+                self.fail('incorrect_type', data_type=type(value).__name__)
+        ids = list(dict.fromkeys(ids))
+        found = set(self.get_queryset().filter(pk__in=ids).values_list('pk', flat=True)) if ids else set()
+        for pk in ids:
+            if pk not in found:
+                self.fail('does_not_exist', pk_value=pk)
+        return ids
+
+
+class _MemberIdListField(serializers.ManyRelatedField):
+    """
+    ManyRelatedField zu MemberIdsField: validiert die Liste als Ganzes und liest beim
+    Ausgeben nur die IDs.
+    """
+
+    def get_attribute(self, instance):
+        if not instance.pk:
+            return []
+        return getattr(instance, self.source).values_list('pk', flat=True)
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        return self.child_relation.to_internal_value_many(data)
+
+
+
 class BoardSerializer(serializers.ModelSerializer):
     """
     Serializer für das Erstellen und Bearbeiten von Boards.
@@ -13,15 +71,37 @@ class BoardSerializer(serializers.ModelSerializer):
         - id: Board-ID
         - title: Titel des Boards
         - owner: Eigentümer des Boards (read_only)
-        - members: Liste der Mitglieder (User-IDs)
+        - members: Liste der Mitglieder (User-IDs, mit einer Query geprüft)
+
+    Mitglieder werden per set_board_members gesetzt (nur die Differenz wird geschrieben);
+    nach update() enthält member_changes die Listen (hinzugefügt, entfernt).
     """
-    members = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), many=True)
+    members = MemberIdsField(queryset=User.objects.all(), many=True)
     owner = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
         model = Board
         fields = ['id', 'title', 'owner', 'members']
 
+    member_changes = None
+
+    def create(self, validated_data):
+        members = validated_data.pop('members', [])
+        board = Board.objects.create(**validated_data)
+        self.member_changes = set_board_members(board, members)
+        return board
+
+    def update(self, instance, validated_data):
+        # Nur die geänderten Spalten speichern, damit Board.version nicht überschrieben wird.
+        members = validated_data.pop('members', None)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
+        if members is not None:
+            self.member_changes = set_board_members(instance, members)
+        return instance
+
 
 
 class BoardListSerializer(serializers.ModelSerializer):
@@ -33,16 +113,20 @@ class BoardListSerializer(serializers.ModelSerializer):
         - title: Titel des Boards
         - owner_id: User-ID des Eigentümers
         - member_count: Anzahl der Mitglieder
-        - ticket_count: Anzahl der Tickets (Platzhalter)
-        - tasks_to_do_count: Anzahl offener Tasks (Platzhalter)
-        - tasks_high_prio_count: Anzahl Tasks mit hoher Priorität (Platzhalter)
+        - ticket_count: Anzahl der Tickets
+        - tasks_to_do_count: Anzahl offener Tasks
+        - tasks_high_prio_count: Anzahl Tasks mit hoher Priorität
+
+    Die Zähler werden nicht pro Board abgefragt, sondern müssen als Annotationen
+    am Queryset vorliegen (siehe BoardListCreateView.get_queryset).
+    fast_queryset/fast_render bilden denselben Output ohne Serializer-Instanzen.
     """
         
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
+    owner_id = serializers.IntegerField(read_only=True)
+    member_count = serializers.IntegerField(read_only=True)
+    ticket_count = serializers.IntegerField(read_only=True)
+    tasks_to_do_count = serializers.IntegerField(read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -51,17 +135,13 @@ class BoardListSerializer(serializers.ModelSerializer):
             'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count', 'owner_id'
         ]
 
-    def get_member_count(self, obj):
-        return obj.members.count() + 1  # Owner zählt als Mitglied
-
-    def get_ticket_count(self, obj):
-        return obj.tasks.count()
+    @classmethod
+    def fast_queryset(cls, queryset):
+        return queryset.values(*cls.Meta.fields)
 
-    def get_tasks_to_do_count(self, obj):
-        return obj.tasks.filter(status='to-do').count()
-
-    def get_tasks_high_prio_count(self, obj):
-        return obj.tasks.filter(priority='high').count()
+    @classmethod
+    def fast_render(cls, rows):
+        return [{field: row[field] for field in cls.Meta.fields} for row in rows]
 
 
 
@@ -92,8 +172,11 @@ class BoardDetailSerializer(serializers.ModelSerializer):
         - owner_id: User-ID des Eigentümers
         - members: Liste der Mitglieder (als UserShortSerializer)
         - tasks: Liste der Tasks
+
+    Mitglieder und Tasks werden aus dem Prefetch-Cache gelesen, wenn das Board
+    über BoardDetailView.get_detail_queryset geladen wurde.
     """
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     members = UserShortSerializer(many=True, read_only=True)
     tasks = serializers.SerializerMethodField()
 
@@ -103,8 +186,7 @@ class BoardDetailSerializer(serializers.ModelSerializer):
 
     def get_tasks(self, obj):
         from tasks_app.api.serializers import TaskListSerializer  
-        tasks = Task.objects.filter(board=obj)
-        return TaskListSerializer(tasks, many=True).data
+        return TaskListSerializer(obj.tasks.all(), many=True).data
 
 
 class BoardPatchSerializer(serializers.ModelSerializer):
@@ -4,13 +4,24 @@ URL-Konfiguration für das boards_app API.
 Enthält folgende Endpunkte:
 - /api/boards/                : Liste aller Boards und Erstellen eines neuen Boards (GET, POST)
 - /api/boards/<int:pk>/       : Details, Aktualisieren und Löschen eines einzelnen Boards (GET, PATCH/PUT, DELETE)
+- /api/boards/<int:pk>/changes/ : Änderungen eines Boards seit einer Sequenznummer (GET, Query-Parameter: since)
+- /api/boards/<int:pk>/export/  : Export eines Boards als NDJSON-Stream (GET)
+- /api/boards/import/          : Import eines NDJSON-Exports als neues Board (POST)
 - /api/boards/email-check/    : Prüft, ob eine E-Mail einem registrierten Benutzer zugeordnet ist (GET, Query-Parameter: email)
+- /api/boards/email-check/batch/ : Prüft bis zu 300 E-Mail-Adressen auf einmal (POST, Body: {"emails": [...]})
 """
 from django.urls import path
-from .views import BoardDetailView, BoardListCreateView, EmailCheckView
+from .views import (
+    BoardChangesView, BoardDetailView, BoardExportView, BoardImportView, BoardListCreateView, EmailBatchCheckView,
+    EmailCheckView,
+)
 
 urlpatterns = [
     path('', BoardListCreateView.as_view(), name='board-list-create'),
     path('<int:pk>/', BoardDetailView.as_view(), name='board-detail'),   
+    path('<int:pk>/changes/', BoardChangesView.as_view(), name='board-changes'),
+    path('<int:pk>/export/', BoardExportView.as_view(), name='board-export'),
+    path('import/', BoardImportView.as_view(), name='board-import'),
     path('email-check/', EmailCheckView.as_view(), name='email-check'),
+    path('email-check/batch/', EmailBatchCheckView.as_view(), name='email-check-batch'),
 ]
\ No newline at end of file
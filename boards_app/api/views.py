@@ -1,29 +1,99 @@
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
 
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
-from rest_framework.authentication import TokenAuthentication
 from rest_framework import generics, permissions, status
 
+from authentication_app.lookups import normalize_email, resolve_emails
+from boards_app.access_cache import get_accessible_board_ids
+from boards_app.api.conditional import ConditionalGetMixin, hashed_etag
+from boards_app.api.fast_render import FastListMixin, render_user
 from boards_app.api.permissions import IsBoardOwner, IsBoardOwnerOrMember
-from boards_app.models import Board
+from boards_app.membership import get_membership_resolver
+from boards_app.changelog import changes_since, first_seq_after, record_changes
+from boards_app.models import Board, BoardChange, BoardStats
+from boards_app.stats import refresh_member_count
+from boards_app.transfer import BoardImportError, chunked, export_board_lines, import_board_lines
+from tasks_app.models import Task
 from .serializers import BoardDetailSerializer, BoardListSerializer, BoardPatchSerializer, BoardSerializer
 
 
-class BoardListCreateView(generics.ListCreateAPIView):
+class BoardErrorResponsesMixin:
+    """
+    Einheitliche Fehlerantworten der Board-Views.
+    """
+
+    def _unauthorized(self):
+        return Response(
+            {'detail': 'Nicht autorisiert. Der Benutzer muss eingeloggt sein, um auf die Ressource zuzugreifen.'},
+            status=401
+        )
+
+    def _not_found(self):
+        return Response(
+            {'detail': 'Board nicht gefunden. Die angegebene Board-ID existiert nicht.'},
+            status=404
+        )
+
+    def _forbidden(self):
+        return Response(
+            {'detail': 'Verboten. Der Benutzer muss entweder Mitglied des Boards oder der Eigentümer des Boards sein.'},
+            status=403
+        )
+
+    def _bad_request(self):
+        return Response(
+            {'detail': 'Ungültige Anfragedaten. Möglicherweise sind einige Benutzer ungültig.'},
+            status=400
+        )
+
+    def _server_error(self):
+        return Response({'detail': 'Interner Serverfehler.'}, status=500)
+
+
+
+class BoardListCreateView(ConditionalGetMixin, FastListMixin, generics.ListCreateAPIView):
     """
     API-Endpoint zum Auflisten und Erstellen von Boards.
-    GET: Gibt alle Boards zurück, bei denen der User Owner oder Member ist.
+    GET: Gibt alle Boards zurück, bei denen der User Owner oder Member ist (mit ETag, schneller Lesepfad).
     POST: Erstellt ein neues Board mit dem aktuellen User als Owner.
     """
-    authentication_classes = [TokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    fast_rendering = True
+
+    def get_etag(self, request, *args, **kwargs):
+        versions = Board.objects.filter(pk__in=get_accessible_board_ids(request.user)).order_by('pk')
+        return hashed_etag('boards', request.user.pk, list(versions.values_list('pk', 'version')))
 
     def get_queryset(self):
-        user = self.request.user
-        return Board.objects.filter(Q(owner=user) | Q(members=user)).distinct()
+        boards = Board.objects.filter(pk__in=get_accessible_board_ids(self.request.user))
+        return self._annotate_counts(boards)
+
+    def _annotate_counts(self, queryset):
+        """
+        Ergänzt die Boards um alle Zähler der Listenansicht.
+        Gelesen wird aus BoardStats; fehlt die Zeile (z.B. im Admin angelegtes Board),
+        wird in SQL per korrelierter Subquery gezählt. So bleibt es bei einer Query.
+        """
+        tasks = Task.objects.filter(board=OuterRef('pk'))
+        members = Board.members.through.objects.filter(board=OuterRef('pk'))
+        return queryset.annotate(
+            member_count=Coalesce(F('stats__member_count'), self._count(members) + 1),  # Owner zählt als Mitglied
+            ticket_count=Coalesce(F('stats__task_count'), self._count(tasks)),
+            tasks_to_do_count=Coalesce(F('stats__tasks_to_do_count'), self._count(tasks.filter(status='to-do'))),
+            tasks_high_prio_count=Coalesce(F('stats__tasks_high_prio_count'), self._count(tasks.filter(priority='high'))),
+        )
+
+    @staticmethod
+    def _count(queryset):
+        counted = queryset.order_by().values('board').annotate(count=Count('pk')).values('count')
+        return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -31,7 +101,10 @@ class BoardListCreateView(generics.ListCreateAPIView):
         return BoardSerializer
     
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+        with transaction.atomic():
+            board = serializer.save(owner=self.request.user)
+            added, _ = serializer.member_changes
+            BoardStats.objects.create(board=board, member_count=len(added) + 1)
 
     def create(self, request, *args, **kwargs):
         if not request.user or not request.user.is_authenticated:
@@ -63,18 +136,16 @@ class BoardListCreateView(generics.ListCreateAPIView):
                 status=401
             )
         try:
-            queryset = self.filter_queryset(self.get_queryset())
-            serializer = BoardListSerializer(queryset, many=True)
-            return Response(serializer.data, status=200)
+            return super().list(request, *args, **kwargs)
         except Exception:
             return Response({'detail': 'Interner Serverfehler.'}, status=500)
 
 
 
-class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BoardDetailView(BoardErrorResponsesMixin, ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API-Endpoint für Details, Bearbeiten und Löschen eines Boards.
-    GET/PATCH: Owner oder Member.
+    GET/PATCH: Owner oder Member (GET mit ETag).
     DELETE: Nur Owner.
     """
     queryset = Board.objects.all()
@@ -93,21 +164,39 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
         return [permission() for permission in permission_classes]
 
     def get_queryset(self):
-        user = self.request.user
-        return Board.objects.filter(Q(owner=user) | Q(members=user)).distinct()
+        return Board.objects.filter(pk__in=get_accessible_board_ids(self.request.user))
+
+    def get_etag(self, request, *args, **kwargs):
+        board_id = kwargs.get('pk')
+        version = Board.objects.filter(pk=board_id).order_by().values_list('version', flat=True).first()
+        if version is None or not get_membership_resolver(request).is_member_or_owner(request.user, board_id):
+            return None
+        return f'"board-{board_id}-{version}"'
+
+    def get_detail_queryset(self):
+        """
+        Lädt Board, Mitglieder und alle Tasks (inkl. Bearbeiter, Prüfer und
+        Kommentaranzahl) mit einer festen Anzahl an Queries.
+        """
+        from tasks_app.api.serializers import TaskListSerializer
+        tasks = TaskListSerializer.prepare_queryset(Task.objects.order_by('status', 'position', 'id'))
+        return Board.objects.prefetch_related('members', Prefetch('tasks', queryset=tasks))
 
     def retrieve(self, request, *args, **kwargs):
         if not request.user or not request.user.is_authenticated:
             return self._unauthorized()
         try:
             board_id = kwargs.get('pk')
+            # Mitgliedschaft zuerst über die ID prüfen (wie get_etag), damit Nicht-Mitglieder nicht
+            # das Laden aller Tasks eines Boards auslösen; nur für sie wird die Existenz abgefragt.
+            if not get_membership_resolver(request).is_member_or_owner(request.user, board_id):
+                if not Board.objects.filter(pk=board_id).exists():
+                    return self._not_found()
+                return self._forbidden()
             try:
-                instance = Board.objects.get(pk=board_id)
+                instance = self.get_detail_queryset().get(pk=board_id)
             except Board.DoesNotExist:
                 return self._not_found()
-            user = request.user
-            if not (user == instance.owner or user in instance.members.all()):
-                return self._forbidden()
             serializer = self.get_serializer(instance)
             return Response(serializer.data, status=200)
         except Exception:
@@ -121,12 +210,21 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
             board_id = kwargs.get('pk')
             board = Board.objects.get(pk=board_id)
             user = request.user
-            if not (user == board.owner or user in board.members.all()):
+            if not get_membership_resolver(request).is_member_or_owner(user, board):
                 return self._forbidden()
             # Nutze den richtigen Serializer für PATCH
             serializer = self.get_serializer(board, data=request.data, partial=True)
             if serializer.is_valid():
-                serializer.save()
+                with transaction.atomic():
+                    serializer.save()
+                    changes = [(board.pk, BoardChange.KIND_BOARD, board.pk, False)]
+                    if serializer.member_changes is not None:
+                        added, removed = serializer.member_changes
+                        if added or removed:
+                            refresh_member_count(board)
+                        changes += [(board.pk, BoardChange.KIND_MEMBER, pk, False) for pk in added]
+                        changes += [(board.pk, BoardChange.KIND_MEMBER, pk, True) for pk in removed]
+                    record_changes(changes)
                 # Board neu laden, damit Änderungen an Members sichtbar sind
                 board.refresh_from_db()
                 patch_serializer = BoardPatchSerializer(board)
@@ -146,7 +244,7 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
             board_id = kwargs.get('pk')
             board = Board.objects.get(pk=board_id)
             user = request.user
-            if user != board.owner:
+            if user.id != board.owner_id:
                 return self._forbidden()
             self.perform_destroy(board)
             return Response({'detail': 'Das Board wurde erfolgreich gelöscht.'}, status=204)
@@ -155,32 +253,146 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
         except Exception:
             return self._server_error()
 
-    def _unauthorized(self):
-        return Response(
-            {'detail': 'Nicht autorisiert. Der Benutzer muss eingeloggt sein, um auf die Ressource zuzugreifen.'},
-            status=401
-        )
 
-    def _not_found(self):
-        return Response(
-            {'detail': 'Board nicht gefunden. Die angegebene Board-ID existiert nicht.'},
-            status=404
-        )
 
-    def _forbidden(self):
-        return Response(
-            {'detail': 'Verboten. Der Benutzer muss entweder Mitglied des Boards oder der Eigentümer des Boards sein.'},
-            status=403
-        )
+class BoardChangesView(BoardErrorResponsesMixin, generics.GenericAPIView):
+    """
+    GET /api/boards/<id>/changes/?since=<seq>: Änderungen eines Boards seit der Sequenznummer
+    'since' (nur für Owner oder Mitglieder).
 
-    def _bad_request(self):
-        return Response(
-            {'detail': 'Ungültige Anfragedaten. Möglicherweise sind einige Benutzer ungültig.'},
-            status=400
-        )
+    Antwort:
+        {"seq": 42, "reset": false, "changes": [
+            {"seq": 41, "type": "task", "id": 5, "deleted": false, "data": {...}},
+            {"seq": 42, "type": "comment", "id": 9, "deleted": true}
+        ]}
+        - seq: aktuelle Sequenznummer des Boards, beim nächsten Aufruf als 'since' senden
+        - changes: pro Objekt nur die letzte Änderung; 'data' enthält den aktuellen Stand
+          (Task wie TaskListSerializer, Kommentar wie CommentSerializer plus 'task',
+          Mitglied wie UserShortSerializer, Board mit id/title/owner_id)
+        - reset: true, wenn sich die Änderungen nicht vollständig aus dem Protokoll ableiten
+          lassen (z.B. 'since' älter als das Protokoll oder zu viele Änderungen). Der Client lädt
+          dann GET /api/boards/<id>/ neu und macht mit 'seq' weiter.
 
-    def _server_error(self):
-        return Response({'detail': 'Interner Serverfehler.'}, status=500)
+    Alle Einträge sind idempotent (aktueller Stand bzw. Tombstone); ein Client darf dieselben
+    Änderungen also mehrfach anwenden.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    max_changes = 1000
+
+    def get(self, request, *args, **kwargs):
+        board_id = kwargs.get('pk')
+        version = Board.objects.filter(pk=board_id).order_by().values_list('version', flat=True).first()
+        if version is None:
+            return self._not_found()
+        if not get_membership_resolver(request).is_member_or_owner(request.user, board_id):
+            return self._forbidden()
+        try:
+            since = int(request.query_params.get('since', ''))
+        except ValueError:
+            since = -1
+        if since < 0:
+            return Response({'detail': "Ungültige Anfrage. Der Parameter 'since' fehlt oder ist ungültig."}, status=400)
+
+        if since >= version:
+            return Response({'seq': version, 'reset': since > version, 'changes': []})
+        first = first_seq_after(board_id, since)
+        changes = changes_since(board_id, since) if first == since + 1 else None
+        if changes is None or len(changes) > self.max_changes:
+            return Response({'seq': version, 'reset': True, 'changes': []})
+        return Response({'seq': version, 'reset': False, 'changes': self._render(board_id, changes)})
+
+    def _render(self, board_id, changes):
+        """
+        Lädt den aktuellen Stand aller geänderten Objekte mit einer Query pro Objektart.
+        Objekte, die nicht mehr zum Board gehören, werden als Tombstone ausgegeben.
+        """
+        from tasks_app.api.serializers import CommentSerializer, TaskListSerializer
+        from tasks_app.models import Comment
+
+        wanted = {}
+        for _, kind, object_id, deleted in changes:
+            if not deleted:
+                wanted.setdefault(kind, set()).add(object_id)
+        data = {}
+        if BoardChange.KIND_TASK in wanted:
+            rows = TaskListSerializer.fast_queryset(
+                Task.objects.filter(board_id=board_id, pk__in=wanted[BoardChange.KIND_TASK]).order_by()
+            )
+            data.update(((BoardChange.KIND_TASK, task['id']), task) for task in TaskListSerializer.fast_render(rows))
+        if BoardChange.KIND_COMMENT in wanted:
+            comments = Comment.objects.filter(
+                task__board_id=board_id, pk__in=wanted[BoardChange.KIND_COMMENT]
+            ).select_related('author')
+            data.update(
+                ((BoardChange.KIND_COMMENT, comment.pk), dict(CommentSerializer(comment).data, task=comment.task_id))
+                for comment in comments
+            )
+        if BoardChange.KIND_MEMBER in wanted:
+            members = Board.members.through.objects.filter(
+                board_id=board_id, user_id__in=wanted[BoardChange.KIND_MEMBER]
+            ).values_list('user_id', 'user__email', 'user__username')
+            data.update(((BoardChange.KIND_MEMBER, row[0]), render_user(*row)) for row in members)
+        if BoardChange.KIND_BOARD in wanted:
+            board = Board.objects.filter(pk=board_id).values('id', 'title', 'owner_id').first()
+            data[(BoardChange.KIND_BOARD, board_id)] = board
+
+        rendered = []
+        for seq, kind, object_id, deleted in changes:
+            item = {'seq': seq, 'type': kind, 'id': object_id, 'deleted': deleted}
+            if not deleted:
+                if (kind, object_id) in data:
+                    item['data'] = data[(kind, object_id)]
+                else:
+                    item['deleted'] = True
+            rendered.append(item)
+        return rendered
+
+
+
+class BoardExportView(BoardErrorResponsesMixin, generics.GenericAPIView):
+    """
+    GET /api/boards/<id>/export/: Board mit Mitgliedern, Tasks und Kommentaren als NDJSON
+    (Format siehe boards_app/transfer.py), nur für Owner oder Mitglieder.
+
+    Die Antwort wird gestreamt; Tasks und Kommentare werden blockweise gelesen, der
+    Speicherbedarf hängt also nicht von der Größe des Boards ab.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        board = Board.objects.filter(pk=kwargs.get('pk')).only('id', 'title', 'owner_id').first()
+        if board is None:
+            return self._not_found()
+        if not get_membership_resolver(request).is_member_or_owner(request.user, board):
+            return self._forbidden()
+        response = StreamingHttpResponse(chunked(export_board_lines(board)), content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="board-{board.pk}.ndjson"'
+        return response
+
+
+
+class BoardImportView(generics.GenericAPIView):
+    """
+    POST /api/boards/import/: Legt aus einem NDJSON-Export (Request-Body, Content-Type
+    application/x-ndjson) ein neues Board mit dem aktuellen User als Owner an.
+
+    Der Body wird zeilenweise gelesen und blockweise geschrieben (boards_app/transfer.py).
+    Antwort 201: {"id": .., "title": .., "members": .., "tasks": .., "comments": ..}
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        stream = request.stream
+        if stream is None:
+            return Response({'detail': 'Ungültige Anfrage. Der Export fehlt.'}, status=400)
+        try:
+            board, counts = import_board_lines(iter(stream.readline, b''), request.user)
+        except BoardImportError as exc:
+            return Response({'detail': f'Ungültige Importdaten. {exc}'}, status=400)
+        return Response({
+            'id': board.pk, 'title': board.title, 'members': counts.get('members', 0),
+            'tasks': counts.get('tasks', 0), 'comments': counts.get('comments', 0),
+        }, status=201)
 
 
 
@@ -208,7 +420,9 @@ class EmailCheckView(generics.GenericAPIView):
                 status=400
             )
         try:
-            user = User.objects.get(email=email)
+            user = resolve_emails([email]).get(normalize_email(email))
+            if user is None:
+                raise User.DoesNotExist
             return Response({
                 'id': user.id,
                 'email': user.email,
@@ -220,4 +434,53 @@ class EmailCheckView(generics.GenericAPIView):
                 status=404
             )
         except Exception:
-            return Response({'detail': 'Interner Serverfehler.'}, status=500)
\ No newline at end of file
+            return Response({'detail': 'Interner Serverfehler.'}, status=500)
+
+
+
+class EmailBatchCheckView(generics.GenericAPIView):
+    """
+    API-Endpoint zur Prüfung vieler E-Mail-Adressen auf einmal (z.B. beim Einladen eines Teams).
+    POST: {"emails": ["lisa@example.com", ...]} mit höchstens max_emails Adressen.
+
+    Alle gültigen Adressen werden mit einer Query aufgelöst, kürzlich nicht gefundene kommen aus
+    dem negativen Cache (authentication_app/lookups.py, resolve_emails).
+
+    Antwort (Reihenfolge der Eingabe, doppelte Adressen nur einmal):
+        {"results": [
+            {"email": "lisa@example.com", "status": "found", "id": 3, "fullname": "Lisa"},
+            {"email": "max@example.com", "status": "not_found"},
+            {"email": "kaputt", "status": "invalid"}
+        ]}
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    max_emails = 300
+
+    def post(self, request, *args, **kwargs):
+        emails = request.data.get('emails') if isinstance(request.data, dict) else None
+        if not isinstance(emails, list) or not emails or not all(isinstance(email, str) for email in emails):
+            return Response({'detail': "Ungültige Anfrage. 'emails' muss eine Liste von E-Mail-Adressen sein."}, status=400)
+        if len(emails) > self.max_emails:
+            return Response({'detail': f'Ungültige Anfrage. Höchstens {self.max_emails} E-Mail-Adressen.'}, status=400)
+
+        entries = {}
+        for email in emails:
+            normalized = normalize_email(email)
+            if normalized not in entries:
+                try:
+                    validate_email(normalized)
+                    entries[normalized] = (email, True)
+                except ValidationError:
+                    entries[normalized] = (email, False)
+        users = resolve_emails([normalized for normalized, (_, valid) in entries.items() if valid])
+
+        results = []
+        for normalized, (email, valid) in entries.items():
+            user = users.get(normalized) if valid else None
+            if not valid:
+                results.append({'email': email, 'status': 'invalid'})
+            elif user is None:
+                results.append({'email': email, 'status': 'not_found'})
+            else:
+                results.append({'email': user.email, 'status': 'found', 'id': user.id, 'fullname': user.username})
+        return Response({'results': results}, status=200)
\ No newline at end of file
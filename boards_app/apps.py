@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BoardsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'boards_app'
+
+    def ready(self):
+        from boards_app import signals  # noqa: F401
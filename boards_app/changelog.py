@@ -0,0 +1,99 @@
+"""
+Änderungsprotokoll der Boards (Modell BoardChange).
+
+Jede Schreiboperation an Tasks, Kommentaren, Mitgliedern oder dem Board selbst trägt ihre
+Änderungen mit record_changes ein. Die Sequenznummer eines Eintrags ist die Board.version nach
+der Änderung, sie steigt pro Board also monoton und passt zu den ETags. Gelöschte bzw. entfernte
+Objekte werden als Tombstone (deleted=True) eingetragen.
+
+Die Einträge enthalten nur Art und ID des Objekts; der Endpunkt /api/boards/<id>/changes/
+liefert den jeweils aktuellen Stand (siehe boards_app/api/views.py, BoardChangesView).
+
+Das Protokoll wächst mit jeder Änderung. prune_changes (Command prune_board_changes, z.B. per
+Cron) behält pro Board nur die letzten KEEP_VERSIONS Versionen; Clients mit älterem 'since'
+erhalten von /changes/ ein Reset und laden das Board neu.
+
+Nach dem Schreiben sendet record_changes das Signal 'changes_recorded' (noch innerhalb der
+Transaktion); darüber hält z.B. die Suche ihren Index aktuell (tasks_app/signals.py).
+"""
+
+from django.conf import settings
+from django.db.models import F
+from django.dispatch import Signal
+
+from boards_app.models import Board, BoardChange
+from boards_app.versioning import touch_boards
+
+# Argument 'changes': die geschriebenen Einträge [(board_id, kind, object_id, deleted), ...]
+changes_recorded = Signal()
+
+DEFAULTS = {
+    'KEEP_VERSIONS': 5000,
+}
+
+
+def _config(name):
+    return getattr(settings, 'BOARD_CHANGELOG', {}).get(name, DEFAULTS[name])
+
+
+def record_changes(changes):
+    """
+    'changes' ist eine Liste von Einträgen (board_id, kind, object_id, deleted), kind ist eine
+    der BoardChange.KIND_*-Konstanten.
+
+    Erhöht die Version aller betroffenen Boards und schreibt die Einträge mit der neuen Version
+    als Sequenznummer. Kostet drei Queries (ab ca. 200 Einträgen teilt Django das INSERT nach
+    dem Parameterlimit von SQLite auf) und muss in derselben Transaktion wie die Änderung laufen.
+    """
+    changes = [entry for entry in changes if entry[0] is not None]
+    if not changes:
+        return
+    board_ids = {board_id for board_id, _, _, _ in changes}
+    touch_boards(*board_ids)
+    versions = dict(Board.objects.filter(pk__in=board_ids).order_by().values_list('pk', 'version'))
+    BoardChange.objects.bulk_create([
+        BoardChange(board_id=board_id, seq=versions[board_id], kind=kind, object_id=object_id, deleted=deleted)
+        for board_id, kind, object_id, deleted in dict.fromkeys(changes)
+        if board_id in versions
+    ])
+    changes_recorded.send(sender=BoardChange, changes=changes)
+
+
+def changes_since(board_id, since):
+    """
+    Gibt die Änderungen eines Boards nach Sequenznummer 'since' zurück, pro Objekt nur die
+    letzte: [(seq, kind, object_id, deleted), ...] aufsteigend nach seq.
+    """
+    latest = {}
+    rows = (
+        BoardChange.objects.filter(board_id=board_id, seq__gt=since).order_by('seq', 'id')
+        .values_list('seq', 'kind', 'object_id', 'deleted')
+    )
+    for seq, kind, object_id, deleted in rows:
+        latest.pop((kind, object_id), None)
+        latest[(kind, object_id)] = (seq, kind, object_id, deleted)
+    return list(latest.values())
+
+
+def first_seq_after(board_id, since):
+    """
+    Kleinste protokollierte Sequenznummer nach 'since' oder None.
+    """
+    return (
+        BoardChange.objects.filter(board_id=board_id, seq__gt=since).order_by('seq')
+        .values_list('seq', flat=True).first()
+    )
+
+
+def prune_changes(board_ids=None, keep_versions=None):
+    """
+    Löscht die Einträge, deren Sequenznummer mehr als 'keep_versions' (Standard: KEEP_VERSIONS)
+    hinter der aktuellen Version ihres Boards liegt. Gibt die Anzahl gelöschter Einträge zurück.
+    """
+    if keep_versions is None:
+        keep_versions = _config('KEEP_VERSIONS')
+    changes = BoardChange.objects.filter(seq__lte=F('board__version') - keep_versions)
+    if board_ids is not None:
+        changes = changes.filter(board_id__in=board_ids)
+    deleted, _ = changes.delete()
+    return deleted
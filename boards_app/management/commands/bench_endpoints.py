@@ -0,0 +1,229 @@
+import json
+import math
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from rest_framework.authtoken.models import Token
+
+from boards_app.models import Board
+from tasks_app.models import Task
+
+
+def percentile(sorted_values, percent):
+    """
+    Perzentil nach der Nearest-Rank-Methode; sorted_values muss aufsteigend sortiert sein.
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples):
+    """
+    Fasst [(Dauer in ms, Queries, Bytes, Status), ...] eines Endpoints zusammen.
+    """
+    durations = sorted(sample[0] for sample in samples)
+    queries = [sample[1] for sample in samples]
+    statuses = {}
+    for sample in samples:
+        statuses[str(sample[3])] = statuses.get(str(sample[3]), 0) + 1
+    return {
+        'requests': len(samples),
+        'p50_ms': round(percentile(durations, 50), 3),
+        'p95_ms': round(percentile(durations, 95), 3),
+        'p99_ms': round(percentile(durations, 99), 3),
+        'mean_ms': round(statistics.fmean(durations), 3),
+        'queries_mean': round(statistics.fmean(queries), 2),
+        'queries_max': max(queries),
+        'bytes_mean': round(statistics.fmean(sample[2] for sample in samples)),
+        'status': statuses,
+    }
+
+
+class Command(BaseCommand):
+    """
+    Misst die API-Endpunkte über den Django-Test-Client gegen die aktuelle Datenbank.
+
+    Erwartet Daten aus seed_scale_data (gleiches --prefix). Pro Endpoint werden zufällige,
+    aber für den jeweiligen User gültige Anfragen erzeugt; große Boards werden bevorzugt
+    gewählt, damit die teuren Pfade sichtbar werden. Ausgegeben wird JSON mit p50/p95/p99,
+    Mittelwert, Query-Anzahl, Antwortgröße und Statuscodes pro Endpoint.
+
+    Aufruf:
+        python manage.py seed_scale_data
+        python manage.py bench_endpoints --requests 200 --output bench.json
+        python manage.py bench_endpoints --writes   # zusätzlich schreibende Endpunkte (Rollback am Ende)
+
+    Nur die schreibenden Endpunkte laufen in einer Transaktion, die am Ende zurückgerollt wird;
+    die lesenden werden im Autocommit gemessen.
+    """
+    help = 'Misst Latenz und Query-Anzahl der API-Endpunkte und gibt das Ergebnis als JSON aus.'
+
+    READ_ENDPOINTS = [
+        'board-list', 'board-detail', 'task-detail', 'assigned-to-me', 'reviewing',
+        'task-comments-list', 'email-check', 'login',
+    ]
+    WRITE_ENDPOINTS = ['task-create', 'task-bulk', 'task-update', 'comment-create']
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='Gemessene Requests pro Endpoint.')
+        parser.add_argument('--warmup', type=int, default=5, help='Ungemessene Requests pro Endpoint.')
+        parser.add_argument('--endpoints', nargs='+', choices=self.READ_ENDPOINTS + self.WRITE_ENDPOINTS)
+        parser.add_argument('--writes', action='store_true', help='Schreibende Endpunkte mitmessen.')
+        parser.add_argument('--prefix', default='seed')
+        parser.add_argument('--password', default='kanmind-seed')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--output', help='Datei für das JSON-Ergebnis (Standard: stdout).')
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.password = options['password']
+        self._load_fixtures(options['prefix'])
+
+        endpoints = options['endpoints'] or (
+            self.READ_ENDPOINTS + (self.WRITE_ENDPOINTS if options['writes'] else [])
+        )
+        reads = [name for name in endpoints if name not in self.WRITE_ENDPOINTS]
+        writes = [name for name in endpoints if name in self.WRITE_ENDPOINTS]
+        results = {}
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            # Lesende Requests laufen wie im Betrieb im Autocommit; eine umschließende Transaktion
+            # würde u.a. das Replica-Routing abschalten und Locks über den ganzen Lauf halten.
+            for name in reads:
+                results[name] = self._run(name, options['warmup'], options['requests'])
+            # Schreibende Requests werden am Ende zurückgerollt, damit die Daten reproduzierbar bleiben.
+            if writes:
+                with transaction.atomic():
+                    for name in writes:
+                        results[name] = self._run(name, options['warmup'], options['requests'])
+                    transaction.set_rollback(True)
+        results = {name: results[name] for name in endpoints}
+
+        report = json.dumps({
+            'database': connection.vendor,
+            'users': len(self.tokens),
+            'boards': len(self.boards),
+            'tasks': len(self.tasks),
+            'endpoints': results,
+        }, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                handle.write(report + '\n')
+        else:
+            self.stdout.write(report)
+
+    def _load_fixtures(self, prefix):
+        self.tokens = dict(
+            Token.objects.filter(user__username__startswith=f'{prefix}-user-').values_list('user_id', 'key')
+        )
+        if not self.tokens:
+            raise CommandError(f"Keine Seed-Daten mit Präfix '{prefix}' gefunden. Erst seed_scale_data ausführen.")
+        self.emails = dict(
+            Token.objects.filter(user_id__in=self.tokens).values_list('user_id', 'user__email')
+        )
+        self.boards = list(
+            Board.objects.filter(owner_id__in=self.tokens)
+            .values_list('id', 'owner_id', 'stats__task_count')
+            .order_by('-stats__task_count')
+        )
+        self.tasks = list(
+            Task.objects.filter(board__owner_id__in=self.tokens).values_list('id', 'board_id', 'board__owner_id')
+        )
+        if not self.boards or not self.tasks:
+            raise CommandError('Die Seed-Daten enthalten keine Boards oder Tasks.')
+        self.huge_boards = self.boards[:max(1, len(self.boards) // 50)]
+        self.tasks_by_board = {}
+        for task_id, board_id, owner_id in self.tasks:
+            self.tasks_by_board.setdefault(board_id, []).append((task_id, owner_id))
+
+    def _pick_board(self):
+        """
+        Jede zweite Anfrage trifft eines der größten Boards.
+        """
+        pool = self.huge_boards if self.random.random() < 0.5 else self.boards
+        return self.random.choice(pool)
+
+    def _pick_task(self):
+        for _ in range(10):
+            board_id, owner_id, _ = self._pick_board()
+            if board_id in self.tasks_by_board:
+                return self.random.choice(self.tasks_by_board[board_id])
+        task_id, _, owner_id = self.random.choice(self.tasks)
+        return task_id, owner_id
+
+    def _build_request(self, name):
+        """
+        Gibt (user_id, Methode, Pfad, Daten) für einen Request auf den Endpoint zurück.
+        """
+        user_id = self.random.choice(list(self.tokens))
+        if name == 'board-list':
+            return user_id, 'get', '/api/boards/', None
+        if name == 'board-detail':
+            board_id, owner_id, _ = self._pick_board()
+            return owner_id, 'get', f'/api/boards/{board_id}/', None
+        if name == 'task-detail':
+            task_id, owner_id = self._pick_task()
+            return owner_id, 'get', f'/api/tasks/{task_id}/', None
+        if name == 'assigned-to-me':
+            return user_id, 'get', '/api/tasks/assigned-to-me/', None
+        if name == 'reviewing':
+            return user_id, 'get', '/api/tasks/reviewing/', None
+        if name == 'task-comments-list':
+            task_id, owner_id = self._pick_task()
+            return owner_id, 'get', f'/api/tasks/{task_id}/comments/', None
+        if name == 'email-check':
+            email = self.emails[self.random.choice(list(self.emails))]
+            return user_id, 'get', '/api/email-check/', {'email': email}
+        if name == 'login':
+            return None, 'post', '/api/login/', {'email': self.emails[user_id], 'password': self.password}
+        if name == 'task-create':
+            board_id, owner_id, _ = self._pick_board()
+            data = {'board': board_id, 'title': 'Benchmark-Task', 'status': 'to-do', 'priority': 'medium'}
+            return owner_id, 'post', '/api/tasks/', data
+        if name == 'task-bulk':
+            board_id, owner_id, _ = self._pick_board()
+            items = [
+                {'board': board_id, 'title': f'Benchmark-Task {index}', 'status': 'to-do', 'priority': 'medium'}
+                for index in range(100)
+            ]
+            return owner_id, 'post', '/api/tasks/bulk/', {'create': items}
+        if name == 'task-update':
+            task_id, owner_id = self._pick_task()
+            data = {'status': self.random.choice(['to-do', 'in-progress', 'review', 'done'])}
+            return owner_id, 'patch', f'/api/tasks/{task_id}/', data
+        if name == 'comment-create':
+            task_id, owner_id = self._pick_task()
+            return owner_id, 'post', f'/api/tasks/{task_id}/comments/', {'content': 'Benchmark-Kommentar'}
+        raise CommandError(f'Unbekannter Endpoint: {name}')
+
+    def _run(self, name, warmup, iterations):
+        client = Client()
+        samples = []
+        for index in range(warmup + iterations):
+            user_id, method, path, data = self._build_request(name)
+            headers = {'HTTP_AUTHORIZATION': f'Token {self.tokens[user_id]}'} if user_id else {}
+            if method == 'get':
+                call = lambda: client.get(path, data, **headers)
+            else:
+                call = lambda: getattr(client, method)(path, data, content_type='application/json', **headers)
+
+            query_count = [0]
+
+            def counter(execute, sql, params, many, context):
+                query_count[0] += 1
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(counter):
+                start = time.perf_counter()
+                response = call()
+                duration = (time.perf_counter() - start) * 1000
+            if index >= warmup:
+                size = 0 if response.streaming else len(response.content)
+                samples.append((duration, query_count[0], size, response.status_code))
+        return summarize(samples)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from boards_app.models import Board
+from boards_app.transfer import export_board_lines
+
+
+class Command(BaseCommand):
+    """
+    Exportiert ein Board mit Mitgliedern, Tasks und Kommentaren als NDJSON
+    (Format siehe boards_app/transfer.py). Die Zeilen werden blockweise gelesen und geschrieben.
+
+    Aufruf:
+        python manage.py export_board 12 > board-12.ndjson
+        python manage.py export_board 12 --output board-12.ndjson
+    """
+    help = 'Exportiert ein Board als NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_id', type=int)
+        parser.add_argument('--output', help='Zieldatei (Standard: stdout).')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Zeilen pro Datenbank-Abruf.')
+
+    def handle(self, *args, **options):
+        board = Board.objects.filter(pk=options['board_id']).first()
+        if board is None:
+            raise CommandError(f"Board {options['board_id']} existiert nicht.")
+        lines = export_board_lines(board, chunk_size=options['chunk_size'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
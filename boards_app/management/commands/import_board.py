@@ -0,0 +1,40 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication_app.lookups import users_by_email
+from boards_app.transfer import BoardImportError, import_board_lines
+
+
+class Command(BaseCommand):
+    """
+    Importiert einen NDJSON-Export (siehe export_board) als neues Board. Die Datei wird zeilenweise
+    gelesen und blockweise per bulk_create geschrieben; alles läuft in einer Transaktion.
+
+    Aufruf:
+        python manage.py import_board board-12.ndjson --owner lisa@example.com
+        python manage.py import_board - --owner lisa@example.com < board-12.ndjson
+    """
+    help = 'Importiert einen NDJSON-Export als neues Board.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Pfad zur NDJSON-Datei oder '-' für stdin.")
+        parser.add_argument('--owner', required=True, help='E-Mail des Owners des neuen Boards.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        owner = users_by_email(options['owner']).first()
+        if owner is None:
+            raise CommandError(f"Kein User mit der E-Mail {options['owner']}.")
+        try:
+            if options['path'] == '-':
+                board, counts = import_board_lines(sys.stdin, owner, options['batch_size'])
+            else:
+                with open(options['path'], encoding='utf-8') as source:
+                    board, counts = import_board_lines(source, owner, options['batch_size'])
+        except BoardImportError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(
+            f"Board {board.pk} ('{board.title}') importiert: {counts.get('members', 0)} Mitglieder, "
+            f"{counts.get('tasks', 0)} Tasks, {counts.get('comments', 0)} Kommentare."
+        ))
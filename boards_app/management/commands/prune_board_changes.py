@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from boards_app.changelog import prune_changes
+
+
+class Command(BaseCommand):
+    """
+    Kürzt das Änderungsprotokoll der Boards (BoardChange) auf die letzten Versionen pro Board.
+
+    Aufruf:
+        python manage.py prune_board_changes                  # KEEP_VERSIONS aus settings.BOARD_CHANGELOG
+        python manage.py prune_board_changes --keep-versions 1000 --board 3
+    """
+    help = 'Löscht alte Einträge des Änderungsprotokolls der Boards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keep-versions', type=int, help='Anzahl Versionen, die pro Board erhalten bleiben.')
+        parser.add_argument('--board', type=int, action='append', dest='boards', help='Nur dieses Board (mehrfach möglich).')
+
+    def handle(self, *args, **options):
+        keep_versions = options['keep_versions']
+        if keep_versions is not None and keep_versions < 0:
+            raise CommandError('--keep-versions darf nicht negativ sein.')
+        deleted = prune_changes(options['boards'], keep_versions)
+        self.stdout.write(self.style.SUCCESS(f'{deleted} Protokolleinträge gelöscht.'))
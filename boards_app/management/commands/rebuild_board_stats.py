@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from boards_app.stats import find_drift, rebuild_board_stats
+
+
+class Command(BaseCommand):
+    """
+    Prüft oder repariert die denormalisierten Board-Zähler (BoardStats).
+
+    Aufruf:
+        python manage.py rebuild_board_stats            # alle Zähler neu berechnen und korrigieren
+        python manage.py rebuild_board_stats --verify   # nur Abweichungen melden (Exit-Code 1 bei Drift)
+        python manage.py rebuild_board_stats --board 3 --board 7
+    """
+    help = 'Berechnet die BoardStats-Zähler neu oder prüft sie auf Abweichungen.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help='Nur prüfen, nichts schreiben.')
+        parser.add_argument('--board', type=int, action='append', dest='boards', help='Nur dieses Board (mehrfach möglich).')
+
+    def handle(self, *args, **options):
+        board_ids = options['boards']
+        if options['verify']:
+            drift = find_drift(board_ids)
+            for board_id, (current, expected) in sorted(drift.items()):
+                self.stdout.write(f'Board {board_id}: gespeichert={current} erwartet={expected}')
+            if drift:
+                raise CommandError(f'{len(drift)} Board(s) mit abweichenden Zählern.')
+            self.stdout.write(self.style.SUCCESS('Alle Zähler sind korrekt.'))
+            return
+
+        with transaction.atomic():
+            repaired = rebuild_board_stats(board_ids)
+        self.stdout.write(self.style.SUCCESS(f'{repaired} Board(s) korrigiert.'))
@@ -0,0 +1,151 @@
+import datetime
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+from boards_app.models import Board
+from boards_app.stats import rebuild_board_stats
+from tasks_app.comment_counts import rebuild_comment_counts
+from tasks_app.search import get_search_backend
+from tasks_app.models import Comment, Task
+from tasks_app.positions import POSITION_STEP
+
+
+class Command(BaseCommand):
+    """
+    Erzeugt Testdaten in großem Umfang für Lasttests und Benchmarks.
+
+    Die Verteilung ist bewusst schief: wenige sehr große Boards (viele Mitglieder und Tasks)
+    und viele kleine Boards, deren Task-Anzahl einer Pareto-Verteilung folgt. Auch die
+    Kommentare pro Task sind ungleich verteilt.
+
+    Aufruf:
+        python manage.py seed_scale_data --users 1000 --boards 300 --huge-boards 3 --huge-board-tasks 5000
+        python manage.py seed_scale_data --flush   # vorher erzeugte Seed-Daten entfernen
+
+    Alle User erhalten das Passwort aus --password und ein Auth-Token.
+    """
+    help = 'Erzeugt skalierte Testdaten (User, Boards, Mitgliedschaften, Tasks, Kommentare).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500)
+        parser.add_argument('--boards', type=int, default=200, help='Anzahl kleiner Boards.')
+        parser.add_argument('--huge-boards', type=int, default=3)
+        parser.add_argument('--huge-board-members', type=int, default=100)
+        parser.add_argument('--huge-board-tasks', type=int, default=2000)
+        parser.add_argument('--max-small-board-tasks', type=int, default=200)
+        parser.add_argument('--comments-per-task', type=float, default=1.5, help='Mittelwert.')
+        parser.add_argument('--prefix', default='seed')
+        parser.add_argument('--password', default='kanmind-seed')
+        parser.add_argument('--seed', type=int, default=42, help='Zufallsstartwert für reproduzierbare Daten.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--flush', action='store_true', help='Vorhandene Seed-Daten löschen und beenden.')
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        prefix = options['prefix']
+        existing = User.objects.filter(username__startswith=f'{prefix}-user-')
+
+        if options['flush']:
+            deleted, _ = existing.delete()
+            self.stdout.write(self.style.SUCCESS(f'{deleted} Objekte gelöscht.'))
+            return
+        if existing.exists():
+            raise CommandError(f"Es existieren bereits Seed-Daten mit Präfix '{prefix}'. Erst --flush ausführen.")
+        if options['users'] < 2:
+            raise CommandError('Es werden mindestens 2 User benötigt.')
+
+        with transaction.atomic():
+            users = self._create_users(prefix, options['users'], options['password'])
+            boards = self._create_boards(users, options)
+            tasks = self._create_tasks(boards, options)
+            comments = self._create_comments(tasks, options['comments_per_task'])
+            rebuild_board_stats([board.pk for board, _ in boards])
+            rebuild_comment_counts([task.pk for task in tasks])
+            get_search_backend().rebuild()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(users)} User, {len(boards)} Boards, {len(tasks)} Tasks, {comments} Kommentare erzeugt.'
+        ))
+
+    def _create_users(self, prefix, count, password):
+        hashed = make_password(password)
+        users = User.objects.bulk_create([
+            User(username=f'{prefix}-user-{index}', email=f'{prefix}-user-{index}@example.com', password=hashed)
+            for index in range(count)
+        ], batch_size=self.batch_size)
+        Token.objects.bulk_create(
+            [Token(user=user, key=Token.generate_key()) for user in users], batch_size=self.batch_size
+        )
+        return users
+
+    def _create_boards(self, users, options):
+        """
+        Gibt [(Board, [Mitglieder]), ...] zurück; die großen Boards stehen am Anfang.
+        """
+        specs = []
+        for index in range(options['huge_boards']):
+            members = self.random.sample(users, min(options['huge_board_members'], len(users)))
+            specs.append((f'Großes Board {index + 1}', members, options['huge_board_tasks']))
+        for index in range(options['boards']):
+            members = self.random.sample(users, self.random.randint(1, min(8, len(users))))
+            tasks = min(options['max_small_board_tasks'], int(self.random.paretovariate(1.2) * 3) - 3)
+            specs.append((f'Board {index + 1}', members, tasks))
+
+        boards = Board.objects.bulk_create([
+            Board(title=title, owner=members[0]) for title, members, _ in specs
+        ], batch_size=self.batch_size)
+        Board.members.through.objects.bulk_create([
+            Board.members.through(board_id=board.pk, user_id=member.pk)
+            for board, (_, members, _) in zip(boards, specs)
+            for member in members
+        ], batch_size=self.batch_size)
+        self.task_counts = [task_count for _, _, task_count in specs]
+        return [(board, members) for board, (_, members, _) in zip(boards, specs)]
+
+    def _create_tasks(self, boards, options):
+        statuses = ['to-do', 'in-progress', 'review', 'done']
+        priorities = ['low', 'medium', 'high']
+        today = datetime.date.today()
+        tasks = []
+        positions = {}
+        for (board, members), task_count in zip(boards, self.task_counts):
+            for index in range(task_count):
+                due_date = None
+                if self.random.random() < 0.7:
+                    due_date = today + datetime.timedelta(days=self.random.randint(-90, 180))
+                status = self.random.choices(statuses, weights=[4, 2, 1, 3])[0]
+                positions[(board.pk, status)] = positions.get((board.pk, status), 0) + POSITION_STEP
+                tasks.append(Task(
+                    board=board,
+                    title=f'Task {index + 1} auf {board.title}',
+                    description='Beschreibung ' * self.random.randint(0, 20),
+                    status=status,
+                    position=positions[(board.pk, status)],
+                    priority=self.random.choices(priorities, weights=[3, 5, 2])[0],
+                    assignee=self.random.choice(members) if self.random.random() < 0.8 else None,
+                    reviewer=self.random.choice(members) if self.random.random() < 0.5 else None,
+                    due_date=due_date,
+                    created_by=self.random.choice(members),
+                ))
+        return Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+
+    def _create_comments(self, tasks, mean):
+        authors = list(User.objects.filter(pk__in={task.created_by_id for task in tasks}))
+        created = 0
+        batch = []
+        for task in tasks:
+            # Exponentialverteilt: die meisten Tasks haben wenige, einige sehr viele Kommentare.
+            for _ in range(int(self.random.expovariate(1 / mean)) if mean > 0 else 0):
+                batch.append(Comment(task=task, author=self.random.choice(authors), content='Kommentar'))
+            if len(batch) >= self.batch_size:
+                Comment.objects.bulk_create(batch, batch_size=self.batch_size)
+                created += len(batch)
+                batch = []
+        Comment.objects.bulk_create(batch, batch_size=self.batch_size)
+        return created + len(batch)
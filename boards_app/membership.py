@@ -0,0 +1,153 @@
+"""
+Zentrale Prüfung der Board-Mitgliedschaft.
+
+- BoardMembershipResolver: Beantwortet "ist User Owner oder Mitglied des Boards?" über den
+  Zugriffs-Cache und merkt sich die Antwort pro (user, board)-Paar. Mit prime() lassen sich
+  viele Paare auf einmal vorab laden.
+- get_membership_resolver: Liefert den Resolver der aktuellen Anfrage (einer pro Request).
+- set_board_members: Setzt die Mitglieder eines Boards und schreibt dabei nur die Differenz.
+"""
+
+from django.contrib.auth.models import User
+from django.db import router
+from django.db.models.signals import m2m_changed
+
+from boards_app.access_cache import aget_board_roles, get_board_roles
+from boards_app.models import Board
+
+
+def _pk(value):
+    return getattr(value, 'pk', value)
+
+
+class BoardMembershipResolver:
+    """
+    Prüft Mitgliedschaften ohne die Mitgliederliste eines Boards zu laden.
+
+    'user' und 'board' dürfen jeweils als Objekt oder als ID übergeben werden:
+        - Board-Objekt: Der Owner wird über owner_id geprüft. Sind die Mitglieder bereits
+          per prefetch_related geladen, wird ohne Query geantwortet.
+        - Sonst wird im Zugriffs-Cache (boards_app.access_cache) nachgesehen, der bei einem
+          Miss alle Boards des Users mit einer Query lädt.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def is_member_or_owner(self, user, board):
+        user_id, board_id = _pk(user), _pk(board)
+        if user_id is None or board_id is None:
+            return False
+        key = (user_id, board_id)
+        if key not in self._cache:
+            self._cache[key] = self._lookup(user_id, board)
+        return self._cache[key]
+
+    async def ais_member_or_owner(self, user, board):
+        """
+        Asynchrone Variante von is_member_or_owner für async Views.
+        """
+        user_id, board_id = _pk(user), _pk(board)
+        if user_id is None or board_id is None:
+            return False
+        key = (user_id, board_id)
+        if key not in self._cache:
+            is_member = self._lookup_loaded(user_id, board)
+            if is_member is None:
+                is_member = board_id in await aget_board_roles(user_id)
+            self._cache[key] = is_member
+        return self._cache[key]
+
+    def remember(self, user, board, is_member):
+        """
+        Übernimmt ein anderweitig ermitteltes Ergebnis in den Cache.
+        """
+        self._cache[(_pk(user), _pk(board))] = is_member
+
+    def prime(self, user_ids, boards):
+        """
+        Ermittelt die Mitgliedschaft aller Kombinationen aus user_ids und boards mit einer Query
+        und übernimmt sie in den Cache. 'boards' müssen Board-Objekte sein (für owner_id).
+        """
+        user_ids = {user_id for user_id in user_ids if user_id is not None}
+        boards = list(boards)
+        if not user_ids or not boards:
+            return
+        pairs = set(
+            Board.members.through.objects
+            .filter(board_id__in=[board.pk for board in boards], user_id__in=user_ids)
+            .values_list('user_id', 'board_id')
+        )
+        for board in boards:
+            for user_id in user_ids:
+                is_member = board.owner_id == user_id or (user_id, board.pk) in pairs
+                self._cache[(user_id, board.pk)] = is_member
+
+    def _lookup(self, user_id, board):
+        is_member = self._lookup_loaded(user_id, board)
+        if is_member is None:
+            is_member = _pk(board) in get_board_roles(user_id)
+        return is_member
+
+    @staticmethod
+    def _lookup_loaded(user_id, board):
+        """
+        Antwortet ohne Query aus einem bereits geladenen Board, sonst None.
+        """
+        if isinstance(board, Board):
+            if board.owner_id == user_id:
+                return True
+            prefetched = getattr(board, '_prefetched_objects_cache', {}).get('members')
+            if prefetched is not None:
+                return any(member.pk == user_id for member in prefetched)
+        return None
+
+
+def get_membership_resolver(request=None):
+    """
+    Gibt den Resolver der Anfrage zurück und legt ihn beim ersten Zugriff an.
+    Ohne Request wird ein neuer, nicht geteilter Resolver geliefert.
+    """
+    if request is None:
+        return BoardMembershipResolver()
+    request = getattr(request, '_request', request)
+    resolver = getattr(request, '_board_membership_resolver', None)
+    if resolver is None:
+        resolver = BoardMembershipResolver()
+        request._board_membership_resolver = resolver
+    return resolver
+
+
+def set_board_members(board, user_ids, batch_size=500):
+    """
+    Setzt die Mitglieder von 'board' auf 'user_ids' (IDs bereits validiert).
+
+    Liest die bisherigen Mitglieder-IDs mit einer Query und löscht bzw. ergänzt nur die
+    geänderten Zeilen der Zwischentabelle (ein DELETE ... IN, bulk_create in Batches). Anders als
+    members.set() werden dafür keine User-Objekte gebraucht. m2m_changed wird wie von members.set()
+    gesendet, Zugriffs-Cache und andere Empfänger bleiben so aktuell.
+
+    Gibt (hinzugefügt, entfernt) als sortierte Listen von User-IDs zurück.
+    """
+    through = Board.members.through
+    db = router.db_for_write(through, instance=board)
+    wanted = set(user_ids)
+    current = set(through.objects.using(db).filter(board_id=board.pk).values_list('user_id', flat=True))
+    added, removed = wanted - current, current - wanted
+
+    def send(action, pk_set):
+        m2m_changed.send(
+            sender=through, instance=board, action=action, reverse=False, model=User, pk_set=pk_set, using=db,
+        )
+
+    if removed:
+        send('pre_remove', removed)
+        through.objects.using(db).filter(board_id=board.pk, user_id__in=removed).delete()
+        send('post_remove', removed)
+    if added:
+        send('pre_add', added)
+        through.objects.using(db).bulk_create(
+            [through(board_id=board.pk, user_id=user_id) for user_id in sorted(added)], batch_size=batch_size,
+        )
+        send('post_add', added)
+    return sorted(added), sorted(removed)
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_board_stats(apps, schema_editor):
+    Board = apps.get_model('boards_app', 'Board')
+    BoardStats = apps.get_model('boards_app', 'BoardStats')
+    Task = apps.get_model('tasks_app', 'Task')
+    task_counts = {
+        row['board']: row
+        for row in Task.objects.order_by().values('board').annotate(
+            total=Count('pk'),
+            to_do=Count('pk', filter=Q(status='to-do')),
+            high=Count('pk', filter=Q(priority='high')),
+        )
+    }
+    member_counts = dict(
+        Board.members.through.objects.order_by().values('board').annotate(count=Count('pk')).values_list('board', 'count')
+    )
+    stats = []
+    for board_id in Board.objects.values_list('pk', flat=True).iterator():
+        row = task_counts.get(board_id, {})
+        stats.append(BoardStats(
+            board_id=board_id,
+            task_count=row.get('total', 0),
+            tasks_to_do_count=row.get('to_do', 0),
+            tasks_high_prio_count=row.get('high', 0),
+            member_count=member_counts.get(board_id, 0) + 1,
+        ))
+    BoardStats.objects.bulk_create(stats, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0002_alter_board_options'),
+        ('tasks_app', '0005_alter_comment_options_alter_task_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardStats',
+            fields=[
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='boards_app.board')),
+                ('task_count', models.IntegerField(default=0)),
+                ('tasks_to_do_count', models.IntegerField(default=0)),
+                ('tasks_high_prio_count', models.IntegerField(default=0)),
+                ('member_count', models.IntegerField(default=1)),
+            ],
+            options={
+                'verbose_name': 'Board Stats',
+                'verbose_name_plural': 'Board Stats',
+            },
+        ),
+        migrations.RunPython(populate_board_stats, migrations.RunPython.noop),
+    ]
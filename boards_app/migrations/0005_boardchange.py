@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 02:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveBigIntegerField()),
+                ('kind', models.CharField(choices=[('task', 'Task'), ('comment', 'Comment'), ('member', 'Member'), ('board', 'Board')], max_length=10)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('deleted', models.BooleanField(default=False)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='boards_app.board')),
+            ],
+            options={
+                'verbose_name': 'Board Change',
+                'verbose_name_plural': 'Board Changes',
+                'indexes': [models.Index(fields=['board', 'seq'], name='board_change_seq_idx')],
+            },
+        ),
+    ]
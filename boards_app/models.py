@@ -9,6 +9,7 @@ class Board(models.Model):
         - title: Titel des Boards (max. 255 Zeichen)
         - owner: User, dem das Board gehört (ForeignKey)
         - members: Mitglieder des Boards (ManyToMany zu User)
+        - version: Änderungszähler, wird bei jeder Änderung an Board, Tasks oder Kommentaren erhöht
 
     Zweck:
         Ein Board dient als Container für Aufgaben (Tasks) und kann von mehreren Benutzern gemeinsam genutzt werden.
@@ -18,6 +19,7 @@ class Board(models.Model):
 	title = models.CharField(max_length=255)
 	owner = models.ForeignKey(User, related_name='owned_boards', on_delete=models.CASCADE)
 	members = models.ManyToManyField(User, related_name='boards')
+	version = models.PositiveBigIntegerField(default=0)
 
 	def __str__(self):
 		return self.title
@@ -27,3 +29,80 @@ class Board(models.Model):
 		verbose_name_plural = "Boards"
 		ordering = ["title"]
 
+
+
+class BoardStats(models.Model):
+	"""
+    Denormalisierte Zähler eines Boards.
+
+    Felder:
+        - board: Zugehöriges Board (OneToOne, zugleich Primärschlüssel)
+        - task_count: Anzahl aller Tasks
+        - tasks_to_do_count: Anzahl Tasks mit Status 'to-do'
+        - tasks_high_prio_count: Anzahl Tasks mit Priorität 'high'
+        - member_count: Anzahl der Mitglieder inklusive Owner
+
+    Zweck:
+        Die Listenansicht liest die Zähler direkt aus dieser Tabelle, statt die Tasks
+        bei jeder Anfrage zu zählen. Gepflegt wird sie in boards_app.stats, reparieren
+        lässt sie sich mit dem Management-Command 'rebuild_board_stats'.
+    """
+
+	board = models.OneToOneField(Board, related_name='stats', on_delete=models.CASCADE, primary_key=True)
+	task_count = models.IntegerField(default=0)
+	tasks_to_do_count = models.IntegerField(default=0)
+	tasks_high_prio_count = models.IntegerField(default=0)
+	member_count = models.IntegerField(default=1)
+
+	def __str__(self):
+		return f"Stats for {self.board_id}"
+
+	class Meta:
+		verbose_name = "Board Stats"
+		verbose_name_plural = "Board Stats"
+
+
+
+class BoardChange(models.Model):
+	"""
+    Eintrag im Änderungsprotokoll eines Boards (nur anhängen, nie ändern).
+
+    Felder:
+        - board: Betroffenes Board
+        - seq: Sequenznummer; entspricht Board.version nach der Änderung (mehrere Einträge
+          einer Änderung teilen sich die Nummer)
+        - kind: Art des Objekts ('task', 'comment', 'member', 'board')
+        - object_id: ID des Objekts (bei 'member' die User-ID)
+        - deleted: Tombstone, das Objekt wurde gelöscht bzw. entfernt
+
+    Zweck:
+        Clients holen über /api/boards/<id>/changes/?since=<seq> nur die Änderungen seit ihrem
+        letzten Stand (siehe boards_app/changelog.py).
+    """
+
+	KIND_TASK = 'task'
+	KIND_COMMENT = 'comment'
+	KIND_MEMBER = 'member'
+	KIND_BOARD = 'board'
+	KIND_CHOICES = [
+		(KIND_TASK, 'Task'),
+		(KIND_COMMENT, 'Comment'),
+		(KIND_MEMBER, 'Member'),
+		(KIND_BOARD, 'Board'),
+	]
+
+	board = models.ForeignKey(Board, related_name='changes', on_delete=models.CASCADE)
+	seq = models.PositiveBigIntegerField()
+	kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+	object_id = models.PositiveBigIntegerField()
+	deleted = models.BooleanField(default=False)
+
+	def __str__(self):
+		return f"{self.kind} {self.object_id} @ {self.board_id}:{self.seq}"
+
+	class Meta:
+		verbose_name = "Board Change"
+		verbose_name_plural = "Board Changes"
+		indexes = [
+			models.Index(fields=['board', 'seq'], name='board_change_seq_idx'),
+		]
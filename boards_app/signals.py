@@ -0,0 +1,43 @@
+"""
+Signal-Handler des boards_app.
+
+Halten den Zugriffs-Cache (boards_app.access_cache) aktuell, auch wenn Boards oder Mitglieder
+außerhalb der API geändert werden (z.B. im Admin oder per Shell).
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from boards_app.access_cache import invalidate_board
+from boards_app.models import Board
+
+
+@receiver(post_save, sender=Board)
+def board_saved(sender, instance, created, **kwargs):
+    # Deckt neue Boards und Owner-Wechsel ab; der bisherige Owner verliert den Zugriff über die Version.
+    invalidate_board(instance.pk, [instance.owner_id])
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def board_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear':
+        if reverse:
+            instance._cleared_board_ids = list(instance.boards.values_list('pk', flat=True))
+        else:
+            instance._cleared_member_ids = list(instance.members.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        board_ids = pk_set if action != 'post_clear' else getattr(instance, '_cleared_board_ids', [])
+        for board_id in board_ids:
+            invalidate_board(board_id, [instance.pk])
+    else:
+        user_ids = pk_set if action != 'post_clear' else getattr(instance, '_cleared_member_ids', [])
+        invalidate_board(instance.pk, list(user_ids))
+
+
+@receiver(post_delete, sender=Board)
+def board_deleted(sender, instance, **kwargs):
+    # Alle Einträge, die das Board enthalten, werden über die erhöhte Version ungültig.
+    invalidate_board(instance.pk)
@@ -0,0 +1,180 @@
+"""
+Pflege der denormalisierten Board-Zähler (BoardStats).
+
+- task_state: Momentaufnahme der für die Zähler relevanten Felder einer Task.
+- locked_task_state: Liest diese Momentaufnahme innerhalb der Transaktion neu und sperrt die Task.
+- locked_task_states: Wie locked_task_state für viele Tasks mit einer Query.
+- apply_task_transition: Verbucht Anlegen, Ändern, Verschieben oder Löschen einer Task.
+- apply_task_transitions: Wie apply_task_transition, für viele Tasks mit einem UPDATE pro Board.
+- refresh_member_count: Setzt die Mitgliederzahl eines Boards neu.
+- compute_board_stats / rebuild_board_stats: Berechnen bzw. reparieren die Zähler in Bulk.
+
+Die Funktionen werden innerhalb der Transaktion des jeweiligen Schreibvorgangs aufgerufen,
+damit Task und Zähler gemeinsam committet oder zurückgerollt werden.
+"""
+
+from collections import defaultdict
+
+from django.db.models import Count, F, Q
+
+from boards_app.models import Board, BoardStats
+
+COUNTER_FIELDS = ['task_count', 'tasks_to_do_count', 'tasks_high_prio_count', 'member_count']
+
+
+def task_state(task):
+    """
+    Gibt (board_id, status, priority) einer Task zurück, oder None für eine nicht existierende Task.
+    """
+    if task is None:
+        return None
+    return (task.board_id, task.status, task.priority)
+
+
+def locked_task_state(task_id):
+    """
+    Liest task_state der Task 'task_id' innerhalb der laufenden Transaktion aus der Datenbank
+    und sperrt die Zeile (select_for_update; unter SQLite hält BEGIN IMMEDIATE die Schreibsperre
+    ohnehin). Zwei gleichzeitige Updates berechnen ihre Deltas so nie vom selben alten Stand.
+    Gibt None zurück, wenn die Task nicht mehr existiert.
+    """
+    return locked_task_states([task_id]).get(task_id)
+
+
+def locked_task_states(task_ids):
+    """
+    Wie locked_task_state für viele Tasks mit einer Query. Gibt {task_id: task_state} zurück;
+    gelöschte Tasks fehlen im Ergebnis.
+    """
+    from tasks_app.models import Task
+
+    task_ids = set(task_ids)
+    if not task_ids:
+        return {}
+    rows = (
+        Task.objects.select_for_update().filter(pk__in=task_ids).order_by()
+        .values_list('id', 'board_id', 'status', 'priority')
+    )
+    return {task_id: (board_id, status, priority) for task_id, board_id, status, priority in rows}
+
+
+def _task_counters(state):
+    board_id, status, priority = state
+    return board_id, {
+        'task_count': 1,
+        'tasks_to_do_count': 1 if status == 'to-do' else 0,
+        'tasks_high_prio_count': 1 if priority == 'high' else 0,
+    }
+
+
+def apply_task_transition(before, after):
+    """
+    Verbucht den Übergang einer Task von 'before' nach 'after' (jeweils task_state oder None).
+    Pro betroffenem Board wird genau ein UPDATE mit F-Ausdrücken ausgeführt.
+    """
+    apply_task_transitions([(before, after)])
+
+
+def apply_task_transitions(transitions):
+    """
+    Verbucht beliebig viele Übergänge [(before, after), ...] auf einmal (z.B. bei Bulk-Schreibvorgängen).
+    Die Deltas werden pro Board summiert, sodass weiterhin ein UPDATE pro Board genügt.
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    for before, after in transitions:
+        for state, sign in [(before, -1), (after, 1)]:
+            if state is None:
+                continue
+            board_id, counters = _task_counters(state)
+            for field, value in counters.items():
+                deltas[board_id][field] += sign * value
+
+    for board_id, counters in deltas.items():
+        changes = {field: F(field) + value for field, value in counters.items() if value}
+        if not changes:
+            continue
+        if not BoardStats.objects.filter(board_id=board_id).update(**changes):
+            rebuild_board_stats([board_id])
+
+
+def refresh_member_count(board):
+    """
+    Setzt die Mitgliederzahl eines Boards (Mitglieder plus Owner) neu.
+    """
+    member_count = Board.members.through.objects.filter(board=board).count() + 1
+    if not BoardStats.objects.filter(board=board).update(member_count=member_count):
+        rebuild_board_stats([board.pk])
+
+
+def compute_board_stats(board_ids=None):
+    """
+    Berechnet die Soll-Werte aller Zähler mit zwei gruppierten Queries.
+    Gibt ein Dict {board_id: {feld: wert}} zurück.
+    """
+    from tasks_app.models import Task
+
+    boards = Board.objects.all()
+    tasks = Task.objects.order_by()
+    members = Board.members.through.objects.order_by()
+    if board_ids is not None:
+        boards = boards.filter(pk__in=board_ids)
+        tasks = tasks.filter(board_id__in=board_ids)
+        members = members.filter(board_id__in=board_ids)
+
+    result = {
+        board_id: {'task_count': 0, 'tasks_to_do_count': 0, 'tasks_high_prio_count': 0, 'member_count': 1}
+        for board_id in boards.values_list('pk', flat=True)
+    }
+    task_rows = tasks.values('board').annotate(
+        total=Count('pk'),
+        to_do=Count('pk', filter=Q(status='to-do')),
+        high=Count('pk', filter=Q(priority='high')),
+    )
+    for row in task_rows:
+        result[row['board']].update(
+            task_count=row['total'],
+            tasks_to_do_count=row['to_do'],
+            tasks_high_prio_count=row['high'],
+        )
+    for board_id, count in members.values('board').annotate(count=Count('pk')).values_list('board', 'count'):
+        result[board_id]['member_count'] = count + 1
+    return result
+
+
+def find_drift(board_ids=None):
+    """
+    Vergleicht gespeicherte und berechnete Zähler.
+    Gibt ein Dict {board_id: (gespeichert oder None, berechnet)} der abweichenden Boards zurück.
+    """
+    expected = compute_board_stats(board_ids)
+    stored = {
+        row['board']: row
+        for row in BoardStats.objects.filter(board_id__in=expected.keys()).values('board', *COUNTER_FIELDS)
+    }
+    drift = {}
+    for board_id, values in expected.items():
+        current = stored.get(board_id)
+        if current is not None:
+            current = {field: current[field] for field in COUNTER_FIELDS}
+        if current != values:
+            drift[board_id] = (current, values)
+    return drift
+
+
+def rebuild_board_stats(board_ids=None, batch_size=500):
+    """
+    Schreibt die berechneten Zähler per bulk_create/bulk_update zurück.
+    Gibt die Anzahl der korrigierten Boards zurück.
+    """
+    drift = find_drift(board_ids)
+    missing = [
+        BoardStats(board_id=board_id, **expected)
+        for board_id, (current, expected) in drift.items() if current is None
+    ]
+    outdated = [
+        BoardStats(board_id=board_id, **expected)
+        for board_id, (current, expected) in drift.items() if current is not None
+    ]
+    BoardStats.objects.bulk_create(missing, batch_size=batch_size)
+    BoardStats.objects.bulk_update(outdated, COUNTER_FIELDS, batch_size=batch_size)
+    return len(drift)
@@ -1,3 +1,759 @@
-from django.test import TestCase
+import datetime
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, connections
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from boards_app.access_cache import aget_board_roles, get_access_cache_stats, get_board_roles, reset_access_cache_stats
+from boards_app.api.views import BoardListCreateView
+from boards_app.membership import BoardMembershipResolver
+from boards_app.models import Board, BoardChange, BoardStats
+from core.replicas import begin_request, end_request
+from tasks_app.api.views import TaskDetailView
+from tasks_app.models import Comment, Task
+
+
+class BoardListTests(APITestCase):
+    """
+    Tests für GET /api/boards/.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.other = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.url = reverse('board-list-create')
+
+    def _create_board(self, title, owner, members=()):
+        board = Board.objects.create(title=title, owner=owner)
+        board.members.set(members)
+        return board
+
+    def _create_task(self, board, **kwargs):
+        return Task.objects.create(board=board, title='Task', created_by=board.owner, **kwargs)
+
+    def test_list_returns_counts(self):
+        board = self._create_board('Alpha', self.user, [self.user, self.other])
+        self._create_task(board, status='to-do', priority='high')
+        self._create_task(board, status='to-do', priority='low')
+        self._create_task(board, status='done', priority='high')
+        self._create_board('Fremd', self.other)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{
+            'id': board.id,
+            'title': 'Alpha',
+            'member_count': 3,
+            'ticket_count': 3,
+            'tasks_to_do_count': 2,
+            'tasks_high_prio_count': 2,
+            'owner_id': self.user.id,
+        }])
+
+    def test_list_contains_member_boards_once(self):
+        self._create_board('Eigenes', self.user, [self.user])
+        self._create_board('Geteilt', self.other, [self.user, self.other])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual([board['title'] for board in response.json()], ['Eigenes', 'Geteilt'])
+
+    def test_query_count_is_constant(self):
+        for index in range(2):
+            board = self._create_board(f'Board {index}', self.user, [self.other])
+            self._create_task(board)
+        self.client.get(self.url)
+        with self.assertNumQueries(2):  # ETag + Liste
+            self.client.get(self.url)
+
+        for index in range(2, 20):
+            board = self._create_board(f'Board {index}', self.other, [self.user])
+            self._create_task(board, priority='high')
+        self.client.get(self.url)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()), 20)
+
+    def test_fast_path_is_byte_identical(self):
+        board = self._create_board('Älpha "zitiert"', self.user, [self.other])
+        for priority in ['low', 'high', 'high']:
+            self._create_task(board, priority=priority)
+        self._create_board('Geteilt', self.other, [self.user])
+
+        fast = self.client.get(self.url).content
+        with mock.patch.object(BoardListCreateView, 'fast_rendering', False):
+            cache.clear()
+            slow = self.client.get(self.url).content
+        self.assertEqual(fast, slow)
+
+    def test_list_uses_fast_path(self):
+        self._create_board('Alpha', self.user)
+        with mock.patch('boards_app.api.serializers.BoardListSerializer.fast_render', side_effect=lambda rows: []) as render:
+            self.assertEqual(self.client.get(self.url).json(), [])
+        render.assert_called_once()
+
+
+class BoardStatsTests(APITestCase):
+    """
+    Tests für die denormalisierten Zähler in BoardStats.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.other = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        response = self.client.post(reverse('board-list-create'), {'title': 'Alpha', 'members': [self.user.id]}, format='json')
+        self.board = Board.objects.get(pk=response.json()['id'])
+
+    def _stats(self, board=None):
+        stats = BoardStats.objects.get(board=board or self.board)
+        return (stats.task_count, stats.tasks_to_do_count, stats.tasks_high_prio_count, stats.member_count)
+
+    def _create_task(self, board=None, **kwargs):
+        data = {'board': (board or self.board).id, 'title': 'Task', 'status': 'to-do', 'priority': 'high'}
+        data.update(kwargs)
+        response = self.client.post(reverse('task-create'), data, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.json()['id']
+
+    def test_board_create_initializes_stats(self):
+        self.assertEqual(self._stats(), (0, 0, 0, 2))
+
+    def test_task_create_update_delete(self):
+        task_id = self._create_task()
+        self._create_task(status='done', priority='low')
+        self.assertEqual(self._stats(), (2, 1, 1, 2))
+
+        self.client.patch(reverse('task-detail', args=[task_id]), {'status': 'review'}, format='json')
+        self.assertEqual(self._stats(), (2, 0, 1, 2))
+
+        self.client.delete(reverse('task-detail', args=[task_id]))
+        self.assertEqual(self._stats(), (1, 0, 0, 2))
+
+    def test_concurrent_task_updates_do_not_drift(self):
+        task_id = self._create_task()
+        stale = Task.objects.get(pk=task_id)
+        self.client.patch(reverse('task-detail', args=[task_id]), {'status': 'done'}, format='json')
+
+        # Ein zweiter Request hat die Task vor dem ersten Update geladen.
+        with mock.patch.object(TaskDetailView, 'get_object', return_value=stale):
+            self.client.patch(reverse('task-detail', args=[task_id]), {'status': 'review'}, format='json')
+        self.assertEqual(self._stats(), (1, 0, 1, 2))
+        with mock.patch.object(TaskDetailView, 'get_object', return_value=stale):
+            self.client.delete(reverse('task-detail', args=[task_id]))
+            self.client.delete(reverse('task-detail', args=[task_id]))
+        self.assertEqual(self._stats(), (0, 0, 0, 2))
+
+    def test_task_move_between_boards(self):
+        other_board = Board.objects.get(pk=self.client.post(
+            reverse('board-list-create'), {'title': 'Beta', 'members': []}, format='json'
+        ).json()['id'])
+        task_id = self._create_task()
+
+        self.client.patch(reverse('task-detail', args=[task_id]), {'board': other_board.id}, format='json')
+
+        self.assertEqual(self._stats(), (0, 0, 0, 2))
+        self.assertEqual(self._stats(other_board), (1, 1, 1, 1))
+
+    def test_member_patch_updates_member_count(self):
+        self.client.patch(
+            reverse('board-detail', args=[self.board.id]), {'members': [self.user.id, self.other.id]}, format='json'
+        )
+        self.assertEqual(self._stats(), (0, 0, 0, 3))
+
+    def test_rebuild_command_repairs_drift(self):
+        self._create_task()
+        BoardStats.objects.filter(board=self.board).update(task_count=42)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_board_stats', verify=True, stdout=StringIO())
+        call_command('rebuild_board_stats', stdout=StringIO())
+
+        self.assertEqual(self._stats(), (1, 1, 1, 2))
+        call_command('rebuild_board_stats', verify=True, stdout=StringIO())
+
+
+class BoardDetailTests(APITestCase):
+    """
+    Tests für GET /api/boards/<id>/.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.other = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.board.members.set([self.user, self.other])
+        self.url = reverse('board-detail', args=[self.board.id])
+
+    def _create_tasks(self, count):
+        for index in range(count):
+            task = Task.objects.create(
+                board=self.board, title=f'Task {index}', created_by=self.user,
+                assignee=self.user, reviewer=self.other, comments_count=1,
+            )
+            task.comments.create(author=self.user, content='Kommentar')
+
+    def test_detail_payload(self):
+        self._create_tasks(1)
+
+        data = self.client.get(self.url).json()
+
+        self.assertEqual([member['id'] for member in data['members']], [self.user.id, self.other.id])
+        self.assertEqual(data['tasks'][0]['assignee']['email'], 'lisa@example.com')
+        self.assertEqual(data['tasks'][0]['reviewer']['fullname'], 'max')
+        self.assertEqual(data['tasks'][0]['comments_count'], 1)
+
+    def test_query_budget_is_flat(self):
+        self._create_tasks(1)
+        self.client.get(self.url)
+        with self.assertNumQueries(4):  # ETag + Board + Mitglieder + Tasks
+            self.client.get(self.url)
+
+        self._create_tasks(25)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()['tasks']), 26)
+
+    def test_non_member_does_not_load_tasks(self):
+        self._create_tasks(3)
+        self.client.force_authenticate(User.objects.create_user(username='eva', email='eva@example.com', password='pw'))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(self.url).status_code, 403)
+            self.assertEqual(self.client.get(reverse('board-detail', args=[999999])).status_code, 404)
+        self.assertFalse([query for query in queries if 'tasks_app_task' in query['sql']])
+
+
+class BoardMembershipResolverTests(APITestCase):
+    """
+    Tests für den Request-bezogenen Mitgliedschafts-Resolver.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.stranger = User.objects.create_user(username='eva', email='eva@example.com', password='pw')
+        self.board = Board.objects.create(title='Alpha', owner=self.owner)
+        self.board.members.set([self.member])
+
+    def test_owner_needs_no_query(self):
+        resolver = BoardMembershipResolver()
+        with self.assertNumQueries(0):
+            self.assertTrue(resolver.is_member_or_owner(self.owner, self.board))
+
+    def test_results_are_memoized(self):
+        resolver = BoardMembershipResolver()
+        with self.assertNumQueries(2):
+            for _ in range(3):
+                self.assertTrue(resolver.is_member_or_owner(self.member, self.board))
+                self.assertFalse(resolver.is_member_or_owner(self.stranger.id, self.board.id))
+
+    def test_board_id_checks_owner_and_members(self):
+        resolver = BoardMembershipResolver()
+        self.assertTrue(resolver.is_member_or_owner(self.owner, self.board.id))
+        self.assertTrue(resolver.is_member_or_owner(self.member, self.board.id))
+        self.assertFalse(resolver.is_member_or_owner(self.stranger, self.board.id))
+
+    def test_prefetched_members_are_used(self):
+        board = Board.objects.prefetch_related('members').get(pk=self.board.pk)
+        resolver = BoardMembershipResolver()
+        with self.assertNumQueries(0):
+            self.assertTrue(resolver.is_member_or_owner(self.member, board))
+            self.assertFalse(resolver.is_member_or_owner(self.stranger, board))
+
+
+class BoardAccessCacheTests(APITestCase):
+    """
+    Tests für den versionierten Zugriffs-Cache.
+    """
+
+    def setUp(self):
+        cache.clear()
+        reset_access_cache_stats()
+        self.owner = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.board = Board.objects.create(title='Alpha', owner=self.owner)
+
+    def test_hits_and_misses_are_counted(self):
+        self.assertEqual(get_board_roles(self.owner), {self.board.id: 'owner'})
+        with self.assertNumQueries(0):
+            self.assertEqual(get_board_roles(self.owner), {self.board.id: 'owner'})
+        self.assertEqual(get_access_cache_stats(), {'hits': 1, 'misses': 1})
+
+    def test_membership_changes_invalidate(self):
+        self.assertEqual(get_board_roles(self.member), {})
+
+        self.board.members.add(self.member)
+        self.assertEqual(get_board_roles(self.member), {self.board.id: 'member'})
+
+        self.board.members.remove(self.member)
+        self.assertEqual(get_board_roles(self.member), {})
+
+        self.member.boards.add(self.board)
+        self.assertEqual(get_board_roles(self.member), {self.board.id: 'member'})
+
+    def test_invalidation_during_load_is_not_cached(self):
+        from boards_app import access_cache
+
+        self.board.members.add(self.member)
+        load_roles = access_cache._load_roles
+
+        def load_then_remove(user_id):
+            roles = load_roles(user_id)
+            self.board.members.remove(self.member)
+            return roles
+
+        for board_known in [False, True]:
+            with self.subTest(board_known=board_known):
+                if board_known:
+                    self.board.members.add(self.member)
+                    get_board_roles(self.member)
+                    self.board.title = 'Neu'
+                    self.board.save()
+                with mock.patch.object(access_cache, '_load_roles', side_effect=load_then_remove):
+                    self.assertEqual(get_board_roles(self.member), {self.board.id: 'member'})
+                self.assertEqual(get_board_roles(self.member), {})
+
+    def test_roles_ignore_lagging_replica(self):
+        self.board.members.add(self.member)
+        through = Board.members.through
+        with tempfile.TemporaryDirectory() as directory:
+            settings_dict = dict(connections['default'].settings_dict, NAME=os.path.join(directory, 'replica.sqlite3'))
+            replica = connections['default'].__class__(settings_dict, alias='lagging_replica')
+            connections['lagging_replica'] = replica
+            try:
+                # Das Replikat enthält Boards und Mitglieder, die Entfernung erreicht es nicht mehr.
+                with replica.schema_editor() as editor:
+                    editor.create_model(Board)
+                with replica.constraint_checks_disabled():
+                    Board.objects.using('lagging_replica').bulk_create(Board.objects.all())
+                    through.objects.using('lagging_replica').bulk_create(through.objects.all())
+                self.board.members.remove(self.member)
+
+                # Der Router liest in Transaktionen primär; der Test läuft in einer.
+                request = RequestFactory().get('/api/boards/', HTTP_AUTHORIZATION='Token member')
+                with override_settings(REPLICA_ROUTING={'ALIASES': ['lagging_replica']}), \
+                        mock.patch.object(connections['default'], 'in_atomic_block', False):
+                    token = begin_request(request)
+                    try:
+                        self.assertEqual(through.objects.filter(user=self.member).count(), 1)
+                        self.assertEqual(get_board_roles(self.member), {})
+                        cache.clear()
+                        self.assertEqual(async_to_sync(aget_board_roles)(self.member), {})
+                    finally:
+                        end_request(request, token)
+            finally:
+                replica.close()
+                del connections['lagging_replica']
+
+    def test_board_delete_invalidates(self):
+        self.board.members.add(self.member)
+        get_board_roles(self.member)
+
+        self.board.delete()
+
+        self.assertEqual(get_board_roles(self.member), {})
+        self.assertEqual(get_board_roles(self.owner), {})
+
+    def test_member_patch_grants_access(self):
+        other = Board.objects.create(title='Beta', owner=self.owner)
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get(reverse('board-detail', args=[other.id])).status_code, 403)
+
+        self.client.force_authenticate(self.owner)
+        self.client.patch(reverse('board-detail', args=[other.id]), {'members': [self.member.id]}, format='json')
+
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get(reverse('board-detail', args=[other.id])).status_code, 200)
+
+
+class BoardMemberUpdateTests(APITestCase):
+    """
+    Tests für die gebündelte Prüfung und das Differenz-Update der Mitglieder (BoardSerializer).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.users = User.objects.bulk_create([
+            User(username=f'user{index}', email=f'user{index}@example.com') for index in range(60)
+        ])
+        self.client.force_authenticate(self.owner)
+
+    def _create(self, members):
+        response = self.client.post(
+            reverse('board-list-create'), {'title': 'Alpha', 'members': [user.id for user in members]}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        return Board.objects.get(pk=response.json()['id'])
+
+    def test_query_count_does_not_depend_on_member_count(self):
+        with CaptureQueriesContext(connection) as few:
+            self._create(self.users[:3])
+        with CaptureQueriesContext(connection) as many:
+            board = self._create(self.users)
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(board.members.count(), 60)
+        self.assertEqual(BoardStats.objects.get(board=board).member_count, 61)
+
+    def test_patch_writes_only_the_difference(self):
+        board = self._create(self.users[:3])
+        through = Board.members.through
+        kept = dict(through.objects.filter(board=board, user__in=self.users[1:3]).values_list('user_id', 'id'))
+        self.client.force_authenticate(self.users[0])
+        self.assertEqual(self.client.get(reverse('board-detail', args=[board.id])).status_code, 200)
+
+        self.client.force_authenticate(self.owner)
+        members = [user.id for user in self.users[1:4]]
+        response = self.client.patch(reverse('board-detail', args=[board.id]), {'members': members}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(member['id'] for member in response.json()['members_data']), members)
+        self.assertEqual(dict(through.objects.filter(board=board, user__in=self.users[1:3]).values_list('user_id', 'id')), kept)
+        self.assertEqual(BoardStats.objects.get(board=board).member_count, 4)
+        changes = BoardChange.objects.filter(board=board, kind=BoardChange.KIND_MEMBER).order_by('object_id')
+        self.assertEqual(
+            list(changes.values_list('object_id', 'deleted'))[-2:],
+            [(self.users[0].id, True), (self.users[3].id, False)],
+        )
+        # Der Zugriffs-Cache des entfernten Mitglieds ist ungültig geworden.
+        self.client.force_authenticate(self.users[0])
+        self.assertEqual(self.client.get(reverse('board-detail', args=[board.id])).status_code, 403)
+
+    def test_unknown_member_is_rejected(self):
+        board = self._create(self.users[:2])
+        response = self.client.patch(
+            reverse('board-detail', args=[board.id]), {'members': [self.users[0].id, 999999]}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(board.members.count(), 2)
+
+
+class BoardETagTests(APITestCase):
+    """
+    Tests für Conditional GET auf Board- und Task-Endpunkten.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.task = Task.objects.create(board=self.board, title='Task', created_by=self.user, reviewer=self.user)
+
+    def _assert_conditional(self, url, queries=1):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        with self.assertNumQueries(queries):
+            second = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], etag)
+        return etag
+
+    def test_board_detail_etag_changes_with_tasks(self):
+        url = reverse('board-detail', args=[self.board.id])
+        etag = self._assert_conditional(url)
+
+        self.client.patch(reverse('task-detail', args=[self.task.id]), {'title': 'Neu'}, format='json')
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_board_list_etag_changes_with_comments(self):
+        url = reverse('board-list-create')
+        etag = self._assert_conditional(url)
+
+        self.client.post(reverse('task-comments-list-create', args=[self.task.id]), {'content': 'Hi'}, format='json')
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_task_endpoints_support_etags(self):
+        self._assert_conditional(reverse('reviewing'))
+        self._assert_conditional(reverse('assigned-to-me'))
+        self._assert_conditional(reverse('task-detail', args=[self.task.id]))
+
+    def test_no_etag_for_foreign_board(self):
+        other = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(other)
+        response = self.client.get(reverse('board-detail', args=[self.board.id]), HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 403)
+
+
+class BoardChangesTests(APITestCase):
+    """
+    Tests für das Änderungsprotokoll und /api/boards/<id>/changes/.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.url = reverse('board-changes', args=[self.board.id])
+
+    def _changes(self, since):
+        response = self.client.get(self.url, {'since': since})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def _create_task(self, title):
+        response = self.client.post(reverse('task-create'), {'board': self.board.id, 'title': title, 'status': 'to-do', 'priority': 'low'}, format='json')
+        return response.json()['id']
+
+    def test_task_and_comment_changes(self):
+        first = self._create_task('Erste')
+        seq = self._changes(0)['seq']
+        second = self._create_task('Zweite')
+        self.client.patch(reverse('task-detail', args=[first]), {'title': 'Neu'}, format='json')
+        comment = self.client.post(
+            reverse('task-comments-list-create', args=[first]), {'content': 'Hi'}, format='json'
+        ).json()['id']
+        self.client.delete(reverse('task-detail', args=[second]))
+
+        body = self._changes(seq)
+        self.assertFalse(body['reset'])
+        changes = {(item['type'], item['id']): item for item in body['changes']}
+        self.assertEqual(len(body['changes']), 3)
+        self.assertEqual(changes[('task', first)]['data']['title'], 'Neu')
+        self.assertEqual(changes[('task', first)]['data']['comments_count'], 1)
+        self.assertEqual(changes[('comment', comment)]['data']['task'], first)
+        self.assertTrue(changes[('task', second)]['deleted'])
+        self.assertNotIn('data', changes[('task', second)])
+        self.assertEqual(body['seq'], Board.objects.get(pk=self.board.id).version)
+        self.assertEqual(self._changes(body['seq'])['changes'], [])
+
+    def test_member_changes(self):
+        self.client.patch(reverse('board-detail', args=[self.board.id]), {'members': [self.member.id]}, format='json')
+        seq = self._changes(0)['seq']
+        self.client.patch(reverse('board-detail', args=[self.board.id]), {'members': []}, format='json')
+
+        changes = self._changes(seq)['changes']
+        self.assertEqual([(item['type'], item['id'], item['deleted']) for item in changes], [
+            ('board', self.board.id, False), ('member', self.member.id, True),
+        ])
+
+    def test_one_edit_on_a_large_board_is_small(self):
+        Task.objects.bulk_create([
+            Task(board=self.board, title=f'Task {index}', created_by=self.user, description='x' * 100)
+            for index in range(500)
+        ])
+        seq = self._changes(0)['seq']
+        task = Task.objects.filter(board=self.board).first()
+        self.client.patch(reverse('task-detail', args=[task.id]), {'title': 'Neu'}, format='json')
+
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'since': seq})
+        self.assertEqual(len(response.json()['changes']), 1)
+        detail = self.client.get(reverse('board-detail', args=[self.board.id]))
+        self.assertLess(len(response.content) * 100, len(detail.content))
+
+    def test_reset_when_log_does_not_cover_since(self):
+        Board.objects.filter(pk=self.board.id).update(version=5)
+        self.assertTrue(self._changes(0)['reset'])
+        self._create_task('Task')
+        self.assertTrue(self._changes(0)['reset'])
+        self.assertFalse(self._changes(5)['reset'])
+        self.assertTrue(self._changes(99)['reset'])
+
+    def test_prune_keeps_recent_versions(self):
+        for index in range(4):
+            self._create_task(f'Task {index}')
+        seq = self._changes(0)['seq']
+        call_command('prune_board_changes', keep_versions=2, stdout=StringIO())
+
+        self.assertEqual(sorted(BoardChange.objects.values_list('seq', flat=True)), [seq - 1, seq])
+        self.assertFalse(self._changes(seq - 2)['reset'])
+        self.assertEqual(len(self._changes(seq - 2)['changes']), 2)
+        self.assertTrue(self._changes(seq - 3)['reset'])
+
+    def test_access_and_validation(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'since': 'abc'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('board-changes', args=[999999]), {'since': 0}).status_code, 404)
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get(self.url, {'since': 0}).status_code, 403)
+
+
+
+class ScaleDataCommandTests(APITestCase):
+    """
+    seed_scale_data und bench_endpoints mit kleinen Mengen.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_seed_creates_consistent_data(self):
+        call_command(
+            'seed_scale_data', users=10, boards=5, huge_boards=1, huge_board_members=5,
+            huge_board_tasks=30, stdout=StringIO(),
+        )
+        self.assertEqual(User.objects.filter(username__startswith='seed-user-').count(), 10)
+        self.assertEqual(Board.objects.count(), 6)
+        self.assertEqual(BoardStats.objects.get(board__title='Großes Board 1').task_count, 30)
+        call_command('rebuild_board_stats', verify=True, stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command('seed_scale_data', users=10, stdout=StringIO())
+
+        call_command('seed_scale_data', flush=True, stdout=StringIO())
+        self.assertFalse(Board.objects.exists())
+
+    def test_benchmark_reports_percentiles(self):
+        call_command(
+            'seed_scale_data', users=5, boards=3, huge_boards=1, huge_board_members=3,
+            huge_board_tasks=10, stdout=StringIO(),
+        )
+        out = StringIO()
+        call_command('bench_endpoints', requests=3, warmup=1, writes=True, stdout=out)
+        report = json.loads(out.getvalue())
+
+        self.assertEqual(report['endpoints']['board-list']['requests'], 3)
+        for name, result in report['endpoints'].items():
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            self.assertTrue(all(status.startswith('2') for status in result['status']), (name, result))
+        self.assertFalse(Task.objects.filter(title__startswith='Benchmark-Task').exists())
+
+    def test_bench_runs_only_writes_in_transaction(self):
+        call_command(
+            'seed_scale_data', users=4, boards=2, huge_boards=1, huge_board_members=3,
+            huge_board_tasks=5, stdout=StringIO(),
+        )
+        # Der TestCase selbst läuft schon in einer Transaktion; gezählt wird die zusätzliche Ebene.
+        depth = len(connection.atomic_blocks)
+        seen = {}
+
+        def run(command, name, warmup, iterations):
+            seen[name] = len(connection.atomic_blocks) - depth
+            return {}
+
+        with mock.patch('boards_app.management.commands.bench_endpoints.Command._run', run):
+            call_command('bench_endpoints', endpoints=['task-create', 'board-list', 'login'], writes=True, stdout=StringIO())
+        self.assertEqual(seen, {'board-list': 0, 'login': 0, 'task-create': 1})
+
+
+
+class BoardTransferTests(APITestCase):
+    """
+    Tests für NDJSON-Export und -Import (boards_app/transfer.py).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.board.members.set([self.member])
+        for index in range(5):
+            task = Task.objects.create(
+                board=self.board, title=f'Task {index}', description='Beschreibung', created_by=self.user,
+                assignee=self.member, status='review', priority='high', position=index * 1024,
+            )
+        self.created_at = datetime.datetime(2025, 1, 2, 10, tzinfo=datetime.timezone.utc)
+        comment = Comment.objects.create(task=task, author=self.member, content='Kommentar ü')
+        Comment.objects.filter(pk=comment.pk).update(created_at=self.created_at)
+
+    def _export(self, board):
+        response = self.client.get(reverse('board-export', args=[board.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content)
+
+    def test_export_streams_all_records(self):
+        lines = [json.loads(line) for line in self._export(self.board).decode().splitlines()]
+        self.assertEqual([line['type'] for line in lines], ['board', 'member'] + ['task'] * 5 + ['comment'])
+        self.assertEqual(lines[0]['owner'], 'lisa@example.com')
+        self.assertEqual(lines[2]['assignee'], 'max@example.com')
+        self.assertEqual(lines[-1]['content'], 'Kommentar ü')
+
+    def test_import_roundtrip_remaps_ids(self):
+        body = self._export(self.board)
+        response = self.client.post(reverse('board-import'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['tasks'], 5)
+
+        copy = Board.objects.get(pk=response.json()['id'])
+        self.assertEqual(list(copy.members.all()), [self.member])
+        tasks = list(copy.tasks.order_by('position'))
+        self.assertEqual([task.title for task in tasks], [f'Task {index}' for index in range(5)])
+        self.assertTrue(all(task.assignee_id == self.member.id for task in tasks))
+        comment = tasks[-1].comments.get()
+        self.assertEqual((comment.author, comment.content), (self.member, 'Kommentar ü'))
+        self.assertEqual(comment.created_at, self.created_at)
+        self.assertEqual(tasks[-1].comments_count, 1)
+        self.assertEqual(BoardStats.objects.get(board=copy).task_count, 5)
+
+        export = self._export(copy).decode().splitlines()
+        self.assertEqual([json.loads(line)['type'] for line in export], ['board', 'member'] + ['task'] * 5 + ['comment'])
+
+    def test_import_matches_emails_case_insensitively(self):
+        body = self._export(self.board).replace(b'max@example.com', b'MAX@Example.COM')
+        response = self.client.post(reverse('board-import'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 201)
+
+        copy = Board.objects.get(pk=response.json()['id'])
+        self.assertEqual(list(copy.members.all()), [self.member])
+        self.assertTrue(all(task.assignee_id == self.member.id for task in copy.tasks.all()))
+        self.assertEqual(Comment.objects.get(task__board=copy).author, self.member)
+        self.assertEqual(User.objects.count(), 2)
+
+    def test_import_rejects_invalid_data(self):
+        response = self.client.post(
+            reverse('board-import'), b'{"type": "task", "title": "x"}\n', content_type='application/x-ndjson'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Zeile 1', response.json()['detail'])
+        self.assertEqual(Board.objects.count(), 1)
+
+    def test_import_rejects_wrong_field_types(self):
+        board = b'{"type": "board", "format": 1, "title": "Kopie"}\n'
+        task = {'type': 'task', 'id': 1, 'title': 'x', 'status': 'to-do', 'priority': 'low'}
+        for line in [
+            dict(task, position='abc'), dict(task, id=[1]), dict(task, id=True), dict(task, position=2 ** 64),
+            dict(task, description={'a': 1}), dict(task, assignee=['max@example.com']),
+            {'type': 'comment', 'task': 1, 'content': {'a': 1}, 'created_at': '2025-01-02T10:00:00'},
+            {'type': 'member', 'email': 5}, {'type': ['task']},
+        ]:
+            with self.subTest(line=line):
+                body = board + json.dumps(task).encode() + b'\n' + json.dumps(line).encode() + b'\n'
+                response = self.client.post(reverse('board-import'), body, content_type='application/x-ndjson')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('Zeile 3', response.json()['detail'])
+        self.assertEqual(Board.objects.count(), 1)
+
+    def test_export_requires_membership(self):
+        stranger = User.objects.create_user(username='eva', email='eva@example.com', password='pw')
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self.client.get(reverse('board-export', args=[self.board.id])).status_code, 403)
+
+    def test_commands_roundtrip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'board.ndjson')
+            call_command('export_board', self.board.id, output=path, chunk_size=2)
+            out = StringIO()
+            call_command('import_board', path, owner='max@example.com', batch_size=2, stdout=out)
+        self.assertIn('5 Tasks, 1 Kommentare', out.getvalue())
+        copy = Board.objects.exclude(pk=self.board.pk).get()
+        self.assertEqual(copy.owner, self.member)
+        # Der bisherige Owner ist kein Mitglied des neuen Boards; Bearbeiter bleibt der neue Owner.
+        self.assertEqual(copy.tasks.filter(assignee=self.member).count(), 5)
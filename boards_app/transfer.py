@@ -0,0 +1,346 @@
+"""
+Export und Import eines Boards als NDJSON (eine JSON-Zeile pro Objekt).
+
+- export_board_lines: Erzeugt die Zeilen eines Boards als Generator.
+- import_board_lines: Legt aus solchen Zeilen ein neues Board an.
+- chunked: Fasst Zeilen für StreamingHttpResponse zu größeren Blöcken zusammen.
+- BoardImportError: Fehler in den Importdaten (mit Zeilennummer).
+
+Format (Reihenfolge wie aufgeführt, 'format' gibt die Version an):
+    {"type": "board", "format": 1, "id": 1, "title": "...", "owner": "lisa@example.com"}
+    {"type": "member", "email": "max@example.com"}
+    {"type": "task", "id": 7, "title": "...", "description": "...", "status": "to-do", "priority": "high",
+     "assignee": "max@example.com", "reviewer": null, "created_by": "lisa@example.com",
+     "due_date": "2025-01-31", "position": 1024}
+    {"type": "comment", "id": 3, "task": 7, "author": "max@example.com", "content": "...",
+     "created_at": "2025-01-02T10:00:00+00:00"}
+
+User werden über ihre E-Mail-Adresse referenziert, damit ein Export auch in einer anderen
+Installation importiert werden kann. IDs im Export sind die der Quelle; der Import vergibt neue
+und übersetzt die Verweise der Kommentare.
+
+Beide Richtungen arbeiten in Blöcken: der Export liest per .iterator(chunk_size), der Import
+schreibt per bulk_create. Im Speicher liegt jeweils nur ein Block plus die Zuordnung alter zu
+neuer Task-IDs.
+"""
+
+import datetime
+import json
+from collections import Counter
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_date, parse_datetime
+
+from authentication_app.lookups import normalize_email, users_by_emails
+from boards_app.models import Board
+from boards_app.stats import rebuild_board_stats
+from tasks_app.models import Comment, Task
+from tasks_app.search import get_search_backend
+
+FORMAT_VERSION = 1
+CHUNK_SIZE = 2000
+
+
+# JSON-Typen der Felder je Zeilentyp; null ist überall erlaubt, Pflichtfelder prüft der Importer.
+FIELD_TYPES = {
+    'member': {'email': str},
+    'task': {
+        'id': int, 'title': str, 'description': str, 'status': str, 'priority': str, 'assignee': str,
+        'reviewer': str, 'created_by': str, 'due_date': str, 'position': int,
+    },
+    'comment': {'id': int, 'task': int, 'author': str, 'content': str, 'created_at': str},
+}
+TYPE_NAMES = {str: 'ein String', int: 'eine Ganzzahl'}
+# Wertebereich der Ganzzahlen (BigIntegerField bzw. SQLite INTEGER).
+INT_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+class BoardImportError(Exception):
+    """
+    Ungültige Importdaten; 'line' ist die Zeilennummer (ab 1) oder None.
+    """
+
+    def __init__(self, message, line=None):
+        super().__init__(message if line is None else f'Zeile {line}: {message}')
+        self.line = line
+
+
+
+def _dumps(record):
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def chunked(lines, size=64 * 1024):
+    """
+    Fasst Zeilen zu Blöcken von etwa 'size' Zeichen zusammen (weniger, größere Writes beim Streamen).
+    """
+    buffer, length = [], 0
+    for line in lines:
+        buffer.append(line)
+        length += len(line)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def export_board_lines(board, chunk_size=CHUNK_SIZE):
+    """
+    Generator über die NDJSON-Zeilen (str, mit Zeilenumbruch) eines Boards.
+    Die Queries laufen erst beim Iterieren, Tasks und Kommentare blockweise.
+    """
+    owner_email = User.objects.filter(pk=board.owner_id).values_list('email', flat=True).first()
+    yield _dumps({'type': 'board', 'format': FORMAT_VERSION, 'id': board.pk, 'title': board.title, 'owner': owner_email})
+
+    members = board.members.order_by('pk').values_list('email', flat=True)
+    for email in members.iterator(chunk_size=chunk_size):
+        yield _dumps({'type': 'member', 'email': email})
+
+    tasks = Task.objects.filter(board_id=board.pk).order_by('pk').values_list(
+        'pk', 'title', 'description', 'status', 'priority', 'assignee__email', 'reviewer__email',
+        'created_by__email', 'due_date', 'position',
+    )
+    for pk, title, description, status, priority, assignee, reviewer, created_by, due_date, position in tasks.iterator(chunk_size=chunk_size):
+        yield _dumps({
+            'type': 'task', 'id': pk, 'title': title, 'description': description, 'status': status,
+            'priority': priority, 'assignee': assignee, 'reviewer': reviewer, 'created_by': created_by,
+            'due_date': None if due_date is None else due_date.isoformat(), 'position': position,
+        })
+
+    comments = Comment.objects.filter(task__board_id=board.pk).order_by('pk').values_list(
+        'pk', 'task_id', 'author__email', 'content', 'created_at',
+    )
+    for pk, task_id, author, content, created_at in comments.iterator(chunk_size=chunk_size):
+        yield _dumps({
+            'type': 'comment', 'id': pk, 'task': task_id, 'author': author, 'content': content,
+            'created_at': created_at.isoformat(),
+        })
+
+
+
+class _BoardImporter:
+    """
+    Verarbeitet die Zeilen eines Exports nacheinander und schreibt blockweise.
+    """
+
+    def __init__(self, owner, batch_size):
+        self.owner = owner
+        self.batch_size = batch_size
+        self.board = None
+        self.users = {}
+        self.member_ids = set()
+        self.task_ids = {}
+        self.pending_members, self.pending_tasks, self.pending_comments = [], [], []
+        self.counts = Counter()
+
+    def feed(self, number, record):
+        kind = record.get('type') if isinstance(record, dict) else None
+        if self.board is None:
+            if kind != 'board':
+                raise BoardImportError('Die erste Zeile muss das Board beschreiben.', number)
+            self._create_board(number, record)
+            return
+        if isinstance(kind, str) and kind in FIELD_TYPES:
+            self._check_types(kind, number, record)
+        if kind == 'member':
+            self._flush_after('member')
+            self.pending_members.append(record.get('email'))
+            if len(self.pending_members) >= self.batch_size:
+                self._flush_members()
+        elif kind == 'task':
+            self._flush_after('task')
+            self.pending_tasks.append((number, record))
+            if len(self.pending_tasks) >= self.batch_size:
+                self._flush_tasks()
+        elif kind == 'comment':
+            self._flush_after('comment')
+            self.pending_comments.append((number, record))
+            if len(self.pending_comments) >= self.batch_size:
+                self._flush_comments()
+        else:
+            raise BoardImportError(f'Unbekannter Typ: {kind!r}.', number)
+
+    def finish(self):
+        if self.board is None:
+            raise BoardImportError('Die Datei enthält kein Board.')
+        self._flush_members()
+        self._flush_tasks()
+        self._flush_comments()
+        # Kommentarzähler aller Tasks des Boards mit einem UPDATE.
+        counts = Comment.objects.filter(task=OuterRef('pk')).order_by().values('task').annotate(count=Count('pk'))
+        Task.objects.filter(board=self.board).update(
+            comments_count=Coalesce(Subquery(counts.values('count')), 0)
+        )
+        rebuild_board_stats([self.board.pk])
+        get_search_backend().update(self.task_ids.values())
+        return self.board
+
+    @staticmethod
+    def _check_types(kind, number, record):
+        for field, expected in FIELD_TYPES[kind].items():
+            value = record.get(field)
+            if value is None:
+                continue
+            # bool ist in Python eine Unterklasse von int, in JSON aber ein eigener Typ.
+            if not isinstance(value, expected) or isinstance(value, bool):
+                raise BoardImportError(f"'{field}' muss {TYPE_NAMES[expected]} sein.", number)
+            if expected is int and value not in INT_RANGE:
+                raise BoardImportError(f"'{field}' liegt außerhalb des gültigen Bereichs.", number)
+
+    def _create_board(self, number, record):
+        if record.get('format') != FORMAT_VERSION:
+            raise BoardImportError(f"Nicht unterstütztes Format: {record.get('format')!r}.", number)
+        title = record.get('title')
+        if not isinstance(title, str) or not title:
+            raise BoardImportError('Das Board braucht einen Titel.', number)
+        self.board = Board.objects.create(title=title[:255], owner=self.owner)
+        self.counts['boards'] += 1
+
+    def _flush_after(self, kind):
+        # Die Abschnitte folgen aufeinander; offene Blöcke des vorherigen Abschnitts werden geschrieben.
+        if kind != 'member':
+            self._flush_members()
+        if kind == 'comment':
+            self._flush_tasks()
+
+    def _resolve_users(self, emails):
+        """
+        Lädt die noch unbekannten E-Mail-Adressen mit einer Query; unbekannte User bleiben None.
+        Verglichen wird wie beim Login ohne Groß-/Kleinschreibung (über den Index auf LOWER(email)).
+        """
+        missing = {normalize_email(email) for email in emails if email} - set(self.users)
+        if missing:
+            found = {
+                normalize_email(email): pk for email, pk in users_by_emails(missing).values_list('email', 'pk')
+            }
+            for email in missing:
+                self.users[email] = found.get(email)
+
+    def _user(self, email):
+        return self.users.get(normalize_email(email)) if email else None
+
+    def _flush_members(self):
+        if not self.pending_members:
+            return
+        self._resolve_users(self.pending_members)
+        user_ids = {self._user(email) for email in self.pending_members} - {None, self.owner.pk} - self.member_ids
+        # members.add sendet m2m_changed, Zugriffs-Cache und Mitgliederzahl bleiben so aktuell.
+        self.board.members.add(*user_ids)
+        self.member_ids.update(user_ids)
+        self.counts['members'] += len(user_ids)
+        self.pending_members = []
+
+    def _member(self, email):
+        user_id = self._user(email)
+        if user_id == self.owner.pk or user_id in self.member_ids:
+            return user_id
+        return None
+
+    def _flush_tasks(self):
+        if not self.pending_tasks:
+            return
+        self._resolve_users(
+            email for _, record in self.pending_tasks
+            for email in (record.get('assignee'), record.get('reviewer'), record.get('created_by'))
+        )
+        statuses = {value for value, _ in Task.STATUS_CHOICES}
+        priorities = {value for value, _ in Task.PRIORITY_CHOICES}
+        tasks, old_ids = [], []
+        for number, record in self.pending_tasks:
+            if record.get('id') in self.task_ids or not isinstance(record.get('title'), str):
+                raise BoardImportError('Task ohne Titel oder mit doppelter ID.', number)
+            if record.get('status') not in statuses or record.get('priority') not in priorities:
+                raise BoardImportError('Ungültiger Status oder ungültige Priorität.', number)
+            tasks.append(Task(
+                board=self.board, title=record['title'][:255], description=record.get('description') or '',
+                status=record['status'], priority=record['priority'],
+                assignee_id=self._member(record.get('assignee')), reviewer_id=self._member(record.get('reviewer')),
+                created_by_id=self._user(record.get('created_by')) or self.owner.pk,
+                due_date=self._date(record.get('due_date'), number), position=record.get('position') or 0,
+            ))
+            old_ids.append(record.get('id'))
+        Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+        self.task_ids.update((old_id, task.pk) for old_id, task in zip(old_ids, tasks))
+        self.counts['tasks'] += len(tasks)
+        self.pending_tasks = []
+
+    def _flush_comments(self):
+        if not self.pending_comments:
+            return
+        self._resolve_users(record.get('author') for _, record in self.pending_comments)
+        comments = []
+        for number, record in self.pending_comments:
+            task_id = self.task_ids.get(record.get('task'))
+            if task_id is None or not isinstance(record.get('content'), str):
+                raise BoardImportError('Kommentar ohne Inhalt oder zu unbekannter Task.', number)
+            comments.append(Comment(
+                task_id=task_id, author_id=self._user(record.get('author')) or self.owner.pk,
+                content=record['content'], created_at=self._datetime(record.get('created_at'), number),
+            ))
+        created_at = [comment.created_at for comment in comments]
+        Comment.objects.bulk_create(comments, batch_size=self.batch_size)
+        # auto_now_add überschreibt created_at beim Anlegen; der exportierte Zeitpunkt wird mit
+        # einem executemany nachgetragen (bulk_update baut pro Zeile einen CASE-Ausdruck).
+        field = Comment._meta.get_field('created_at')
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'UPDATE {Comment._meta.db_table} SET {field.column} = %s WHERE id = %s',
+                [
+                    (connection.ops.adapt_datetimefield_value(value), comment.pk)
+                    for comment, value in zip(comments, created_at)
+                ],
+            )
+        self.counts['comments'] += len(comments)
+        self.pending_comments = []
+
+    @staticmethod
+    def _date(value, number):
+        if value is None:
+            return None
+        try:
+            parsed = parse_date(value)
+        except (TypeError, ValueError):
+            parsed = None
+        if parsed is None:
+            raise BoardImportError(f'Ungültiges Datum: {value!r}.', number)
+        return parsed
+
+    @staticmethod
+    def _datetime(value, number):
+        try:
+            parsed = parse_datetime(value)
+        except (TypeError, ValueError):
+            parsed = None
+        if parsed is None:
+            raise BoardImportError(f'Ungültiger Zeitpunkt: {value!r}.', number)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+        return parsed
+
+
+def import_board_lines(lines, owner, batch_size=1000):
+    """
+    Legt aus den NDJSON-Zeilen (str oder bytes) eines Exports ein neues Board mit 'owner' als
+    Eigentümer an, in einer Transaktion. Mitglieder, Bearbeiter, Prüfer und Autoren werden
+    über die E-Mail zugeordnet; unbekannte User werden als Mitglied übersprungen, als
+    Bearbeiter/Prüfer geleert und als Ersteller/Autor durch den Owner ersetzt.
+    Gibt (board, {'boards': .., 'members': .., 'tasks': .., 'comments': ..}) zurück.
+    """
+    importer = _BoardImporter(owner, batch_size)
+    with transaction.atomic():
+        for number, line in enumerate(lines, start=1):
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise BoardImportError('Ungültiges JSON.', number)
+            importer.feed(number, record)
+        board = importer.finish()
+    return board, dict(importer.counts)
@@ -0,0 +1,20 @@
+"""
+Änderungsversion der Boards.
+
+Board.version wird bei jeder Änderung erhöht, die die Antworten von Board-Liste, Board-Detail
+oder den Task-Endpunkten verändert. Die Version dient als Grundlage für ETags
+(boards_app/api/conditional.py) und muss in derselben Transaktion wie die Änderung erhöht werden.
+"""
+
+from django.db.models import F
+
+from boards_app.models import Board
+
+
+def touch_boards(*board_ids):
+    """
+    Erhöht die Version der angegebenen Boards mit einem einzigen UPDATE.
+    """
+    board_ids = {board_id for board_id in board_ids if board_id is not None}
+    if board_ids:
+        Board.objects.filter(pk__in=board_ids).update(version=F('version') + 1)
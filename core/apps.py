@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from core.sqlite import apply_sqlite_profile
+        connection_created.connect(apply_sqlite_profile, dispatch_uid='core.sqlite_profile')
@@ -3,14 +3,37 @@ ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Unter ASGI werden die URLs aus core/urls_asgi.py verwendet, damit die lesenden Endpunkte
+(Board-Liste, Board-Detail, assigned-to-me, reviewing, Kommentarliste) asynchron laufen.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
-application = get_asgi_application()
+
+class KanMindASGIHandler(ASGIHandler):
+    """
+    ASGIHandler, der jedem Request die ASGI-URL-Konfiguration zuweist.
+    """
+    urlconf = 'core.urls_asgi'
+
+    def create_request(self, scope, body_file):
+        request, error_response = super().create_request(scope, body_file)
+        if request is not None:
+            request.urlconf = self.urlconf
+        return request, error_response
+
+
+def get_application():
+    django.setup(set_prefix=False)
+    return KanMindASGIHandler()
+
+
+application = get_application()
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.replicas import _config, sync_sqlite_replicas
+
+
+class Command(BaseCommand):
+    """
+    Kopiert die primäre SQLite-Datenbank in die konfigurierten Replikate (core/replicas.py).
+    Ersetzt lokal die Replikation; regelmäßig aufgerufen (z.B. per cron) entspricht der
+    Abstand der Aufrufe der Replikationsverzögerung.
+
+    Aufruf:
+        KANMIND_REPLICA_DATABASES=replica.sqlite3 python manage.py sync_sqlite_replicas
+    """
+    help = 'Kopiert die primäre SQLite-Datenbank in alle Lesereplikate.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('aliases', nargs='*', help='Nur diese Replikate (Standard: alle).')
+
+    def handle(self, *args, **options):
+        configured = _config('ALIASES')
+        aliases = options['aliases'] or configured
+        unknown = [alias for alias in aliases if alias not in configured]
+        if unknown:
+            raise CommandError(f"Kein Replikat: {', '.join(unknown)}")
+        if not aliases:
+            raise CommandError('Keine Replikate konfiguriert (KANMIND_REPLICA_DATABASES).')
+        sync_sqlite_replicas(aliases)
+        self.stdout.write(self.style.SUCCESS(f"{len(aliases)} Replikat(e) aktualisiert: {', '.join(aliases)}"))
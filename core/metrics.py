@@ -0,0 +1,133 @@
+"""
+Prozesslokale Request-Metriken.
+
+- Histogram: Histogramm mit festen Bucket-Grenzen (kumulativ wie bei Prometheus).
+- MetricsRegistry: Sammelt pro Endpoint (URL-Name) und HTTP-Methode Wall-Zeit, DB-Zeit,
+  Query-Anzahl und Antwortgröße.
+- registry: Globale Instanz, befüllt von core.middleware.RequestMetricsMiddleware.
+- render_prometheus: Gibt alle Metriken im Prometheus-Textformat aus.
+"""
+
+import bisect
+import threading
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+METRICS = {
+    'kanmind_request_duration_seconds': ('Wall-Zeit pro Request in Sekunden.', DURATION_BUCKETS),
+    'kanmind_request_db_duration_seconds': ('Datenbankzeit pro Request in Sekunden.', DURATION_BUCKETS),
+    'kanmind_request_queries': ('Anzahl der SQL-Queries pro Request.', QUERY_BUCKETS),
+    'kanmind_response_size_bytes': ('Größe des Response-Bodys in Bytes.', SIZE_BUCKETS),
+}
+
+
+class Histogram:
+    """
+    Histogramm mit festen Grenzen; observe() ist O(log Buckets).
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        Gibt [(Grenze, kumulierte Anzahl), ...] inklusive '+Inf' zurück.
+        """
+        result, total = [], 0
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Threadsichere Sammlung der Histogramme pro (Metrik, Endpoint, Methode).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def record(self, endpoint, method, duration, db_duration, queries, size):
+        values = {
+            'kanmind_request_duration_seconds': duration,
+            'kanmind_request_db_duration_seconds': db_duration,
+            'kanmind_request_queries': queries,
+            'kanmind_response_size_bytes': size,
+        }
+        with self._lock:
+            for name, value in values.items():
+                key = (name, endpoint, method)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram(METRICS[name][1])
+                histogram.observe(value)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                key: (list(histogram.cumulative()), histogram.sum, histogram.count)
+                for key, histogram in self._histograms.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _format_bound(bound):
+    return bound if isinstance(bound, str) else repr(float(bound))
+
+
+def _counter_lines():
+    """
+    Zähler der Caches (Token- und Board-Zugriffs-Cache).
+    """
+    from authentication_app.authentication import token_cache
+    from boards_app.access_cache import get_access_cache_stats
+
+    token_stats = token_cache.stats()
+    access_stats = get_access_cache_stats()
+    return [
+        '# HELP kanmind_cache_requests_total Cache-Lookups nach Cache und Ergebnis.',
+        '# TYPE kanmind_cache_requests_total counter',
+        f'kanmind_cache_requests_total{{cache="token",result="hit"}} {token_stats["hits"]}',
+        f'kanmind_cache_requests_total{{cache="token",result="miss"}} {token_stats["misses"]}',
+        f'kanmind_cache_requests_total{{cache="board_access",result="hit"}} {access_stats["hits"]}',
+        f'kanmind_cache_requests_total{{cache="board_access",result="miss"}} {access_stats["misses"]}',
+    ]
+
+
+def render_prometheus():
+    """
+    Rendert alle Metriken im Prometheus-Textformat (Version 0.0.4).
+    """
+    snapshot = registry.snapshot()
+    lines = []
+    for name, (help_text, _) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} histogram')
+        for (metric, endpoint, method), (buckets, total, count) in sorted(snapshot.items()):
+            if metric != name:
+                continue
+            labels = f'endpoint="{endpoint}",method="{method}"'
+            for bound, cumulative in buckets:
+                lines.append(f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+            lines.append(f'{name}_sum{{{labels}}} {total}')
+            lines.append(f'{name}_count{{{labels}}} {count}')
+    lines.extend(_counter_lines())
+    return '\n'.join(lines) + '\n'
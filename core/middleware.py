@@ -0,0 +1,135 @@
+"""
+Middleware des KanMind Backends.
+
+- RequestMetricsMiddleware: Misst Wall-Zeit, DB-Zeit, Query-Anzahl und Antwortgröße pro Endpoint.
+- ReplicaRoutingMiddleware: Legt pro Request fest, ob er von einem Replikat liest (core/replicas.py).
+"""
+
+import contextlib
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from core import replicas
+from core.metrics import registry
+
+
+class _QueryTimer:
+    """
+    execute_wrapper, der Anzahl und Dauer der Queries eines Requests aufsummiert.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class RequestMetricsMiddleware:
+    """
+    Erfasst Metriken pro aufgelöstem URL-Namen (z.B. 'board-detail', 'task-create').
+
+    Aktivierung über settings.REQUEST_METRICS['ENABLED']. Ist sie deaktiviert, meldet sich die
+    Middleware beim Start per MiddlewareNotUsed ab und verursacht keinerlei Overhead.
+    Nicht aufgelöste URLs werden unter 'unresolved' gezählt. Die Middleware arbeitet unter WSGI
+    und ASGI; unter ASGI wird sie asynchron aufgerufen, damit async Views nicht in einen Thread
+    gezwungen werden.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_METRICS', {}).get('ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        timer = _QueryTimer()
+        start = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            self._install(stack, timer)
+            response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - start, timer)
+        return response
+
+    async def __acall__(self, request):
+        """
+        Unter ASGI laufen die Queries im Datenbank-Thread des Requests (sync_to_async mit
+        thread_sensitive), deshalb wird der execute_wrapper dort installiert.
+        """
+        timer = _QueryTimer()
+        start = time.perf_counter()
+        stack = contextlib.ExitStack()
+        await sync_to_async(self._install)(stack, timer)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        self._record(request, response, time.perf_counter() - start, timer)
+        return response
+
+    @staticmethod
+    def _install(stack, timer):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timer))
+
+    @staticmethod
+    def _record(request, response, duration, timer):
+        match = getattr(request, 'resolver_match', None)
+        endpoint = match.url_name if match and match.url_name else 'unresolved'
+        size = 0 if response.streaming else len(response.content)
+        registry.record(endpoint, request.method, duration, timer.duration, timer.count, size)
+
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Gibt dem ReplicaRouter den Request bekannt: sichere Requests lesen von einem Replikat,
+    sofern der Client nicht kürzlich geschrieben hat; schreibende Requests pinnen den Client.
+
+    Ohne konfigurierte Replikate (settings.REPLICA_ROUTING['ALIASES']) meldet sich die
+    Middleware per MiddlewareNotUsed ab. Gestreamte Antworten werden nach dem Ende der
+    Middleware erzeugt und lesen deshalb von der primären Datenbank.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replicas._config('ALIASES'):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = replicas.begin_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            replicas.end_request(request, token)
+
+    async def __acall__(self, request):
+        # Die Pins liegen im (lokalen) Cache; die Abfrage blockiert die Event-Loop nicht nennenswert.
+        token = replicas.begin_request(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            replicas.end_request(request, token)
@@ -0,0 +1,160 @@
+"""
+Verteilung der Lesezugriffe auf Replikate.
+
+- ReplicaRouter: Datenbank-Router; Lesezugriffe sicherer Requests gehen an ein Replikat,
+  alles andere an die primäre Datenbank ('default').
+- begin_request / end_request: Legen für einen Request fest, ob und welches Replikat er liest
+  (aufgerufen von core.middleware.ReplicaRoutingMiddleware).
+- pin_client: Hält einen Client nach einem Schreibzugriff für PIN_SECONDS auf der primären Datenbank.
+- sync_sqlite_replicas: Kopiert die primäre SQLite-Datenbank in die Replikate (lokaler Betrieb).
+
+Read-your-writes:
+    Ein Request liest nur dann von einem Replikat, wenn er eine sichere Methode hat (GET, HEAD,
+    OPTIONS) und sein Client in den letzten PIN_SECONDS nichts geschrieben hat. Der Client wird
+    am Authorization-Header erkannt, anonyme Schreibzugriffe (Login, Registrierung) pinnen die
+    Client-Adresse. Innerhalb eines Requests wechselt der Router nach dem ersten Schreibzugriff
+    und innerhalb von Transaktionen ebenfalls auf die primäre Datenbank. Außerhalb von Requests
+    (Management-Commands, Shell, Tests) wird immer die primäre Datenbank verwendet.
+
+    Gepinnt wird nur der Schreibende. Daten, die über Zugriffsrechte entscheiden und gecacht
+    werden (boards_app/access_cache.py), lesen deshalb immer primär (using(DEFAULT_DB_ALIAS)).
+
+    Die Pins liegen im Django-Cache. Mit mehreren Worker-Prozessen muss dieser geteilt sein
+    (z.B. Redis), sonst sieht ein anderer Worker den Pin nicht.
+
+Konfiguration (settings.REPLICA_ROUTING):
+    - ALIASES: Aliase der Replikate in settings.DATABASES (Standard: keine, d.h. alles primär)
+    - PIN_SECONDS: Dauer des Pins nach einem Schreibzugriff; sollte über der maximalen
+      Replikationsverzögerung liegen (Standard: 5)
+    - CACHE_ALIAS: Alias aus settings.CACHES für die Pins (Standard: 'default')
+    - KEY_PREFIX: Präfix der Cache-Keys (Standard: 'replica-pin')
+"""
+
+import contextvars
+import hashlib
+import random
+import sqlite3
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+DEFAULTS = {
+    'ALIASES': [],
+    'PIN_SECONDS': 5,
+    'CACHE_ALIAS': 'default',
+    'KEY_PREFIX': 'replica-pin',
+}
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Zustand des laufenden Requests: {'replica': <Alias oder None>}; None außerhalb von Requests.
+_routing = contextvars.ContextVar('replica_routing', default=None)
+
+
+def _config(name):
+    return getattr(settings, 'REPLICA_ROUTING', {}).get(name, DEFAULTS[name])
+
+
+def _client_keys(request):
+    """
+    Cache-Keys, unter denen Schreibzugriffe dieses Clients gepinnt werden: der Hash des
+    Authorization-Headers (das Token selbst landet nicht im Cache) und die Client-Adresse.
+    """
+    prefix = _config('KEY_PREFIX')
+    keys = {'address': f"{prefix}:addr:{request.META.get('REMOTE_ADDR', '')}"}
+    header = request.META.get('HTTP_AUTHORIZATION')
+    if header:
+        keys['auth'] = f'{prefix}:auth:{hashlib.sha256(header.encode()).hexdigest()}'
+    return keys
+
+
+def is_pinned(request):
+    keys = _client_keys(request)
+    return bool(caches[_config('CACHE_ALIAS')].get_many(list(keys.values())))
+
+
+def pin_client(request):
+    """
+    Leitet die Lesezugriffe dieses Clients für PIN_SECONDS an die primäre Datenbank.
+    """
+    keys = _client_keys(request)
+    key = keys.get('auth', keys['address'])
+    caches[_config('CACHE_ALIAS')].set(key, 1, timeout=_config('PIN_SECONDS'))
+
+
+def begin_request(request):
+    """
+    Wählt das Replikat für den Request (zufällig, aber für den ganzen Request dasselbe) und
+    gibt das Token für end_request zurück.
+    """
+    aliases = _config('ALIASES')
+    replica = None
+    if aliases and request.method in SAFE_METHODS and not is_pinned(request):
+        replica = random.choice(aliases)
+    return _routing.set({'replica': replica})
+
+
+def end_request(request, token):
+    if request.method not in SAFE_METHODS:
+        pin_client(request)
+    _routing.reset(token)
+
+
+def current_replica():
+    """
+    Alias, von dem der laufende Request liest, oder None für die primäre Datenbank.
+    """
+    state = _routing.get()
+    return state['replica'] if state is not None else None
+
+
+class ReplicaRouter:
+    """
+    Liest vom Replikat des laufenden Requests (siehe begin_request), schreibt immer primär.
+    """
+
+    def db_for_read(self, model, **hints):
+        replica = current_replica()
+        if replica is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # In einer Transaktion muss z.B. next_position() denselben Stand lesen, den sie ändert.
+            return DEFAULT_DB_ALIAS
+        return replica
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            # Ab dem ersten Schreibzugriff liest der Request seine eigenen Änderungen.
+            state['replica'] = None
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replikate enthalten dieselben Daten; Objekte aus beiden dürfen verknüpft werden.
+        databases = {DEFAULT_DB_ALIAS, *_config('ALIASES')}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replikate erhalten das Schema mit den Daten von der primären Datenbank.
+        if db in _config('ALIASES'):
+            return False
+        return None
+
+
+def sync_sqlite_replicas(aliases=None):
+    """
+    Überschreibt die SQLite-Replikate mit einer konsistenten Kopie der primären Datenbank
+    (Online-Backup-API, Leser der Replikate werden nicht unterbrochen). Gibt die Aliase zurück.
+    Für echte Replikation (z.B. PostgreSQL-Streaming oder LiteFS) wird das nicht gebraucht.
+    """
+    aliases = list(_config('ALIASES') if aliases is None else aliases)
+    primary = connections[DEFAULT_DB_ALIAS]
+    primary.ensure_connection()
+    for alias in aliases:
+        target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+    return aliases
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -40,12 +41,15 @@ INSTALLED_APPS = [
     'corsheaders',
     'rest_framework',
     'rest_framework.authtoken',
+    'core',
     'authentication_app',
     'boards_app',
     'tasks_app',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -83,7 +87,44 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Persistente Verbindungen: Verbindungsaufbau und Pragmas (core/sqlite.py) nur einmal pro Thread.
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Transaktionen holen die Schreibsperre sofort (BEGIN IMMEDIATE) und warten bei Bedarf
+            # auf sie, statt beim ersten Schreiben mit 'database is locked' abzubrechen.
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+}
+
+# Lesereplikate (siehe core/replicas.py). Lokal z.B. mit einer zweiten SQLite-Datei:
+#   KANMIND_REPLICA_DATABASES=replica.sqlite3 python manage.py sync_sqlite_replicas
+# Mehrere Replikate werden durch Kommas getrennt. In Tests spiegeln sie die Testdatenbank.
+for _index, _name in enumerate(filter(None, os.environ.get('KANMIND_REPLICA_DATABASES', '').split(',')), start=1):
+    DATABASES[f'replica_{_index}'] = {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / _name.strip(),
+        'TEST': {'MIRROR': 'default'},
     }
+
+DATABASE_ROUTERS = ['core.replicas.ReplicaRouter']
+
+REPLICA_ROUTING = {
+    'ALIASES': [alias for alias in DATABASES if alias != 'default'],
+    'PIN_SECONDS': 5,
+    'CACHE_ALIAS': 'default',
+}
+
+# Pragmas für jede neue SQLite-Verbindung (siehe core/sqlite.py)
+SQLITE_PROFILE = {
+    'ENABLED': True,
+    'JOURNAL_MODE': 'WAL',
+    'SYNCHRONOUS': 'NORMAL',
+    'BUSY_TIMEOUT_MS': 5000,
+    'CACHE_SIZE_KB': 20000,
+    'MMAP_SIZE': 256 * 1024 * 1024,
+    'TEMP_STORE': 'MEMORY',
 }
 
 
@@ -106,6 +147,13 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Login per E-Mail (authentication_app/backends.py), ModelBackend bleibt für den Admin aktiv.
+AUTHENTICATION_BACKENDS = [
+    'authentication_app.backends.EmailBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -118,6 +166,28 @@ USE_I18N = True
 USE_TZ = True
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'kanmind',
+    }
+}
+
+# Zugriffs-Cache der Boards pro User (siehe boards_app/access_cache.py)
+BOARD_ACCESS_CACHE = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+# Änderungsprotokoll der Boards (siehe boards_app/changelog.py, Command prune_board_changes)
+BOARD_CHANGELOG = {
+    'KEEP_VERSIONS': 5000,
+}
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
@@ -132,13 +202,36 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         # 'rest_framework.authentication.SessionAuthentication',
         # 'rest_framework.authentication.BasicAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        'authentication_app.authentication.CachedTokenAuthentication',
     ],
      'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ]
 }
 
+# Request-Metriken pro Endpoint, abrufbar für Staff-User unter /api/metrics/ (siehe core/metrics.py)
+REQUEST_METRICS = {
+    'ENABLED': True,
+}
+
+# Prozesslokaler Cache für Token-Lookups (siehe authentication_app/authentication.py)
+TOKEN_AUTH_CACHE = {
+    'ENABLED': True,
+    'MAX_SIZE': 10000,
+    'TTL': 60,
+}
+
+# Negativer Cache der E-Mail-Lookups (siehe authentication_app/lookups.py)
+EMAIL_LOOKUP = {
+    'MISS_TTL': 30,
+    'CACHE_ALIAS': 'default',
+}
+
+# Volltextsuche über Tasks und Kommentare (siehe tasks_app/search.py); None wählt FTS5 unter SQLite
+TASK_SEARCH = {
+    'BACKEND': None,
+}
+
 CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:8000",
     "http://127.0.0.1:5500",
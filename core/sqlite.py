@@ -0,0 +1,77 @@
+"""
+SQLite-Profil: Pragmas, die beim Öffnen jeder Verbindung gesetzt werden (Signal connection_created,
+verbunden in core/apps.py).
+
+Konfiguration (settings.SQLITE_PROFILE):
+    - ENABLED: Profil anwenden (Standard: True)
+    - JOURNAL_MODE: 'WAL' (Standard); Leser und ein Schreiber blockieren sich nicht gegenseitig,
+      Commits schreiben nur ins WAL statt Rollback-Journal plus Datenbankdatei zu synchronisieren
+    - SYNCHRONOUS: 'NORMAL' (Standard); im WAL-Modus sicher gegen Abstürze der Anwendung, nur ein
+      Stromausfall kann die letzten Commits kosten
+    - BUSY_TIMEOUT_MS: So lange wartet eine Verbindung auf eine Sperre, bevor 'database is locked'
+      gemeldet wird (Standard: 5000)
+    - CACHE_SIZE_KB: Page-Cache pro Verbindung in KiB (Standard: 20000)
+    - MMAP_SIZE: Bytes der Datei, die per Memory-Mapping gelesen werden (Standard: 256 MiB, 0 = aus)
+    - TEMP_STORE: Ablage temporärer Tabellen und Indizes, 'MEMORY' (Standard) oder 'DEFAULT'/'FILE'
+
+Schreibende Transaktionen sollten zusätzlich mit DATABASES[...]['OPTIONS']['transaction_mode'] =
+'IMMEDIATE' gestartet werden (siehe core/settings.py): Eine Transaktion, die erst liest und dann
+schreibt, würde sonst beim Aufwerten der Lese- zur Schreibsperre sofort mit 'database is locked'
+scheitern, ohne das Busy-Timeout abzuwarten.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+DEFAULTS = {
+    'ENABLED': True,
+    'JOURNAL_MODE': 'WAL',
+    'SYNCHRONOUS': 'NORMAL',
+    'BUSY_TIMEOUT_MS': 5000,
+    'CACHE_SIZE_KB': 20000,
+    'MMAP_SIZE': 256 * 1024 * 1024,
+    'TEMP_STORE': 'MEMORY',
+}
+
+JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+TEMP_STORES = {'DEFAULT', 'FILE', 'MEMORY'}
+
+
+def _config(name):
+    return getattr(settings, 'SQLITE_PROFILE', {}).get(name, DEFAULTS[name])
+
+
+def _choice(name, allowed):
+    value = str(_config(name)).upper()
+    if value not in allowed:
+        raise ImproperlyConfigured(f"SQLITE_PROFILE['{name}'] muss einer von {sorted(allowed)} sein.")
+    return value
+
+
+def pragma_statements():
+    """
+    Gibt die PRAGMA-Anweisungen des konfigurierten Profils zurück (leer, wenn deaktiviert).
+    """
+    if not _config('ENABLED'):
+        return []
+    return [
+        f"PRAGMA journal_mode = {_choice('JOURNAL_MODE', JOURNAL_MODES)}",
+        f"PRAGMA synchronous = {_choice('SYNCHRONOUS', SYNCHRONOUS_MODES)}",
+        f"PRAGMA busy_timeout = {int(_config('BUSY_TIMEOUT_MS'))}",
+        f"PRAGMA cache_size = {-int(_config('CACHE_SIZE_KB'))}",
+        f"PRAGMA mmap_size = {int(_config('MMAP_SIZE'))}",
+        f"PRAGMA temp_store = {_choice('TEMP_STORE', TEMP_STORES)}",
+    ]
+
+
+def apply_sqlite_profile(sender, connection, **kwargs):
+    """
+    Handler für connection_created: setzt die Pragmas auf neuen SQLite-Verbindungen.
+    Mit CONN_MAX_AGE > 0 geschieht das einmal pro Verbindung statt pro Request.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for statement in pragma_statements():
+            cursor.execute(statement)
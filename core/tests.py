@@ -0,0 +1,260 @@
+import datetime
+import os
+import tempfile
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from authentication_app.authentication import token_cache
+from boards_app.models import Board
+from core.metrics import registry
+from core.middleware import ReplicaRoutingMiddleware
+from core.replicas import ReplicaRouter
+from core.sqlite import pragma_statements
+from tasks_app.models import Comment, Task
+
+
+class MetricsTests(APITestCase):
+    """
+    Tests für RequestMetricsMiddleware und /api/metrics/.
+    """
+
+    def setUp(self):
+        registry.reset()
+        self.staff = User.objects.create_user(username='admin', email='admin@example.com', password='pw', is_staff=True)
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+
+    def test_metrics_are_recorded_per_endpoint(self):
+        self.client.force_authenticate(self.user)
+        self.client.get(reverse('board-list-create'))
+        self.client.get(reverse('board-list-create'))
+
+        self.client.force_authenticate(self.staff)
+        body = self.client.get(reverse('metrics')).content.decode()
+
+        self.assertIn('kanmind_request_duration_seconds_count{endpoint="board-list-create",method="GET"} 2', body)
+        self.assertIn('kanmind_request_queries_bucket{endpoint="board-list-create",method="GET",le="+Inf"} 2', body)
+        self.assertIn('kanmind_response_size_bytes_sum{endpoint="board-list-create",method="GET"}', body)
+        self.assertIn('kanmind_cache_requests_total{cache="board_access",result="miss"}', body)
+
+    def test_metrics_are_staff_only(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+
+
+
+class AsyncViewTests(APITestCase):
+    """
+    Die async Views aus core/urls_asgi.py müssen dieselben Antworten liefern wie die DRF-Views.
+    """
+    compared_headers = ['Content-Type', 'ETag', 'Allow', 'Vary', 'WWW-Authenticate']
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        registry.reset()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.stranger = User.objects.create_user(username='eva', email='eva@example.com', password='pw')
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.board.members.set([self.member])
+        for index in range(5):
+            task = Task.objects.create(
+                board=self.board, title=f'Task {index}', created_by=self.user, assignee=self.user,
+                reviewer=self.member if index % 2 else None, due_date=datetime.date(2025, 1, index + 1),
+            )
+            Comment.objects.create(task=task, author=self.member, content=f'Kommentar {index}')
+        self.task = task
+        self.tokens = {user: Token.objects.create(user=user).key for user in [self.user, self.member, self.stranger]}
+
+    def _get_sync(self, path, headers):
+        return self.client.get(path, **headers)
+
+    def _get_async(self, path, headers):
+        with override_settings(ROOT_URLCONF='core.urls_asgi'):
+            return async_to_sync(self.async_client.get)(path, headers=self._asgi_headers(headers))
+
+    @staticmethod
+    def _asgi_headers(headers):
+        # Der AsyncClient erwartet Header-Namen statt WSGI-Schlüsseln (HTTP_IF_NONE_MATCH -> If-None-Match).
+        return {key[5:].replace('_', '-').title(): value for key, value in headers.items()}
+
+    def _assert_same(self, path, user=None, **headers):
+        if user is not None:
+            headers['HTTP_AUTHORIZATION'] = f'Token {self.tokens[user]}'
+        expected = self._get_sync(path, headers)
+        actual = self._get_async(path, headers)
+        self.assertEqual(actual.status_code, expected.status_code, path)
+        self.assertEqual(actual.content, expected.content, path)
+        for header in self.compared_headers:
+            self.assertEqual(actual.get(header), expected.get(header), (path, header))
+        return actual
+
+    def test_board_endpoints(self):
+        self._assert_same('/api/boards/', self.user)
+        self._assert_same('/api/boards/', self.stranger)
+        detail = self._assert_same(f'/api/boards/{self.board.id}/', self.member)
+        self._assert_same(f'/api/boards/{self.board.id}/', self.member, HTTP_IF_NONE_MATCH=detail['ETag'])
+        self._assert_same(f'/api/boards/{self.board.id}/', self.stranger)
+        self._assert_same('/api/boards/999999/', self.user)
+
+    def test_board_detail_checks_access_before_loading(self):
+        headers = {'HTTP_AUTHORIZATION': f'Token {self.tokens[self.stranger]}'}
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._get_async(f'/api/boards/{self.board.id}/', headers).status_code, 403)
+        self.assertFalse([query for query in queries if 'tasks_app_task' in query['sql']])
+
+    def test_task_lists(self):
+        self._assert_same('/api/tasks/assigned-to-me/', self.user)
+        self._assert_same('/api/tasks/reviewing/', self.member)
+        first = self._assert_same('/api/tasks/assigned-to-me/?page_size=2', self.user).json()
+        self._assert_same(first['next'], self.user)
+
+    def test_comment_list(self):
+        self._assert_same(f'/api/tasks/{self.task.id}/comments/', self.member)
+        self._assert_same(f'/api/tasks/{self.task.id}/comments/', self.stranger)
+        self._assert_same('/api/tasks/999999/comments/', self.user)
+
+    def test_authentication_errors(self):
+        self._assert_same('/api/boards/')
+        self._assert_same('/api/boards/', HTTP_AUTHORIZATION='Token falsch')
+        self._assert_same('/api/tasks/reviewing/', HTTP_AUTHORIZATION='Token')
+
+    def test_writes_fall_back_to_sync_views(self):
+        headers = {'HTTP_AUTHORIZATION': f'Token {self.tokens[self.user]}'}
+        with override_settings(ROOT_URLCONF='core.urls_asgi'):
+            response = async_to_sync(self.async_client.post)(
+                '/api/boards/', {'title': 'Neu', 'members': []}, content_type='application/json',
+                headers=self._asgi_headers(headers),
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Board.objects.filter(title='Neu').exists())
+
+    def test_metrics_are_recorded_for_async_views(self):
+        self._get_async('/api/boards/', {'HTTP_AUTHORIZATION': f'Token {self.tokens[self.user]}'})
+        snapshot = registry.snapshot()
+        _, _, count = snapshot[('kanmind_request_queries', 'board-list-create', 'GET')]
+        self.assertEqual(count, 1)
+        buckets, total, _ = snapshot[('kanmind_request_queries', 'board-list-create', 'GET')]
+        self.assertGreater(total, 0)
+
+
+
+class SqliteProfileTests(APITestCase):
+    """
+    Tests für das SQLite-Profil (core/sqlite.py).
+    """
+
+    def _pragma(self, cursor, name):
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+
+    def test_profile_is_applied_to_connection(self):
+        with connection.cursor() as cursor:
+            self.assertEqual(self._pragma(cursor, 'busy_timeout'), 5000)
+            self.assertEqual(self._pragma(cursor, 'synchronous'), 1)
+            self.assertEqual(self._pragma(cursor, 'cache_size'), -20000)
+            self.assertEqual(self._pragma(cursor, 'temp_store'), 2)
+
+    def test_file_database_uses_wal_and_immediate_transactions(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings_dict = dict(connection.settings_dict, NAME=os.path.join(directory, 'profile.sqlite3'))
+            wrapper = connections['default'].__class__(settings_dict, alias='profile_test')
+            try:
+                with wrapper.cursor() as cursor:
+                    self.assertEqual(self._pragma(cursor, 'journal_mode'), 'wal')
+                self.assertEqual(wrapper.transaction_mode, 'IMMEDIATE')
+            finally:
+                wrapper.close()
+
+    def test_profile_can_be_disabled(self):
+        with override_settings(SQLITE_PROFILE={'ENABLED': False}):
+            self.assertEqual(pragma_statements(), [])
+
+    def test_invalid_value_is_rejected(self):
+        with override_settings(SQLITE_PROFILE={'JOURNAL_MODE': 'FAST'}):
+            with self.assertRaises(ImproperlyConfigured):
+                pragma_statements()
+
+
+
+@override_settings(REPLICA_ROUTING={'ALIASES': ['replica_1'], 'PIN_SECONDS': 5, 'KEY_PREFIX': 'replica-pin-test'})
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    Tests für ReplicaRouter und ReplicaRoutingMiddleware (core/replicas.py). Die Routing-
+    Entscheidungen werden ohne Queries geprüft, ein Replikat muss daher nicht existieren.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+
+    def _read_database(self, request, write=False):
+        """
+        Schickt den Request durch die Middleware und gibt zurück, wohin der View liest.
+        """
+        seen = {}
+
+        def view(request):
+            if write:
+                self.router.db_for_write(Task)
+            seen['db'] = self.router.db_for_read(Task)
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(request)
+        return seen['db']
+
+    def _get(self, token='abc'):
+        return self.factory.get('/api/boards/', HTTP_AUTHORIZATION=f'Token {token}')
+
+    def test_safe_requests_read_from_replica(self):
+        self.assertEqual(self._read_database(self._get()), 'replica_1')
+
+    def test_writes_go_to_primary(self):
+        self.assertEqual(self.router.db_for_write(Task), 'default')
+        request = self.factory.post('/api/boards/', HTTP_AUTHORIZATION='Token abc')
+        self.assertEqual(self._read_database(request), 'default')
+
+    def test_request_reads_primary_after_its_own_write(self):
+        self.assertEqual(self._read_database(self._get(), write=True), 'default')
+
+    def test_client_is_pinned_after_write(self):
+        self._read_database(self.factory.patch('/api/boards/1/', HTTP_AUTHORIZATION='Token abc'))
+
+        self.assertEqual(self._read_database(self._get('abc')), 'default')
+        self.assertEqual(self._read_database(self._get('other')), 'replica_1')
+        cache.clear()
+        self.assertEqual(self._read_database(self._get('abc')), 'replica_1')
+
+    def test_anonymous_write_pins_client_address(self):
+        self._read_database(self.factory.post('/api/login/'))
+        self.assertEqual(self._read_database(self._get('fresh-token')), 'default')
+
+    def test_outside_requests_reads_use_primary(self):
+        self.assertEqual(self.router.db_for_read(Task), 'default')
+
+    def test_reads_inside_transaction_use_primary(self):
+        seen = {}
+
+        def view(request):
+            with mock.patch.object(connections['default'], 'in_atomic_block', True):
+                seen['db'] = self.router.db_for_read(Task)
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(self._get())
+        self.assertEqual(seen['db'], 'default')
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate('replica_1', 'tasks_app'))
+        self.assertIsNone(self.router.allow_migrate('default', 'tasks_app'))
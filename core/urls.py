@@ -1,13 +1,17 @@
 from django.contrib import admin
 from django.urls import include, path
-from authentication_app.api.views import RegistrationView, LoginView
-from boards_app.api.views import EmailCheckView
+from authentication_app.api.views import RegistrationView, LoginView, LogoutView
+from boards_app.api.views import EmailBatchCheckView, EmailCheckView
+from core.views import MetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/registration/', RegistrationView.as_view(), name='registration'),  
     path('api/login/', LoginView.as_view(), name='login'),
+    path('api/logout/', LogoutView.as_view(), name='logout'),
     path('api/email-check/', EmailCheckView.as_view(), name='email-check'), 
+    path('api/email-check/batch/', EmailBatchCheckView.as_view(), name='email-check-batch'),
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
                
     path('api/auth/', include('authentication_app.api.urls')),
     path('api/boards/', include('boards_app.api.urls')),
@@ -0,0 +1,19 @@
+"""
+URL-Konfiguration für den Betrieb unter ASGI (siehe core/asgi.py).
+
+Die lesenden Endpunkte mit hoher Last werden von async Views bedient, alle übrigen URLs
+kommen unverändert aus core/urls.py. URL-Namen und Pfade sind identisch.
+"""
+from django.urls import include, path
+
+from boards_app.api.async_views import AsyncBoardDetailView, AsyncBoardListView
+from tasks_app.api.async_views import AsyncAssignedTasksListView, AsyncReviewingTasksListView, AsyncTaskCommentListView
+
+urlpatterns = [
+    path('api/boards/', AsyncBoardListView.as_view(), name='board-list-create'),
+    path('api/boards/<int:pk>/', AsyncBoardDetailView.as_view(), name='board-detail'),
+    path('api/tasks/assigned-to-me/', AsyncAssignedTasksListView.as_view(), name='assigned-to-me'),
+    path('api/tasks/reviewing/', AsyncReviewingTasksListView.as_view(), name='reviewing'),
+    path('api/tasks/<int:task_id>/comments/', AsyncTaskCommentListView.as_view(), name='task-comments-list-create'),
+    path('', include('core.urls')),
+]
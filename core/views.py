@@ -0,0 +1,18 @@
+from django.http import HttpResponse
+from rest_framework import permissions
+from rest_framework.views import APIView
+
+from core.metrics import render_prometheus
+
+
+class MetricsView(APIView):
+    """
+    API-Endpoint für Betriebsmetriken (nur Staff-User).
+
+    GET:
+        Gibt die Request-Metriken aller Endpoints im Prometheus-Textformat zurück.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
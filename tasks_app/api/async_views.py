@@ -0,0 +1,97 @@
+"""
+Asynchrone Lese-Views des tasks_app API (siehe boards_app/api/async_views.py).
+
+- AsyncAssignedTasksListView: GET /api/tasks/assigned-to-me/
+- AsyncReviewingTasksListView: GET /api/tasks/reviewing/
+- AsyncTaskCommentListView: GET /api/tasks/<task_id>/comments/
+"""
+
+from asgiref.sync import sync_to_async
+from django.db import models
+from rest_framework import exceptions
+from rest_framework.request import Request
+
+from boards_app.api.async_views import AsyncReadView
+from boards_app.api.conditional import hashed_etag
+from boards_app.membership import get_membership_resolver
+from boards_app.models import Board
+from tasks_app.api.serializers import CommentSerializer, TaskListSerializer
+from tasks_app.api.views import AssignedTasksListView, ReviewingTasksListView, TaskCommentListCreateView
+from tasks_app.models import Comment, Task
+
+
+class AsyncTaskListView(AsyncReadView):
+    """
+    Gemeinsamer Ablauf der Task-Listen: ETag aus den Board-Versionen, optionale Keyset-Pagination,
+    Rendering über den schnellen Lesepfad.
+    """
+    etag_name = None
+
+    def get_boards(self, user):
+        raise NotImplementedError
+
+    def get_tasks(self, user):
+        raise NotImplementedError
+
+    async def get(self, request, *args, **kwargs):
+        user = request.user
+        versions = self.get_boards(user).order_by('pk').values_list('pk', 'version').distinct()
+        etag = hashed_etag(self.etag_name, user.pk, request.get_full_path(), [row async for row in versions])
+        response = self.not_modified(request, etag)
+        if response is not None:
+            return response
+
+        queryset = TaskListSerializer.fast_queryset(self.get_tasks(user))
+        paginator = self.sync_view_class.pagination_class()
+        # Die Pagination liest genau eine Seite; sie läuft im Datenbank-Thread des Requests.
+        page = await sync_to_async(paginator.paginate_queryset)(queryset, Request(request))
+        if page is not None:
+            data = paginator.get_paginated_response(TaskListSerializer.fast_render(page)).data
+        else:
+            data = TaskListSerializer.fast_render([row async for row in queryset])
+        return self.render(data, etag=etag)
+
+
+
+class AsyncAssignedTasksListView(AsyncTaskListView):
+    sync_view_class = AssignedTasksListView
+    etag_name = 'assigned-to-me'
+
+    def get_boards(self, user):
+        return Board.objects.filter(models.Q(tasks__assignee=user) | models.Q(tasks__reviewer=user))
+
+    def get_tasks(self, user):
+        return Task.objects.filter(models.Q(assignee=user) | models.Q(reviewer=user))
+
+
+
+class AsyncReviewingTasksListView(AsyncTaskListView):
+    sync_view_class = ReviewingTasksListView
+    etag_name = 'reviewing'
+
+    def get_boards(self, user):
+        return Board.objects.filter(tasks__reviewer=user)
+
+    def get_tasks(self, user):
+        return Task.objects.filter(reviewer=user)
+
+
+
+class AsyncTaskCommentListView(AsyncReadView):
+    """
+    GET: Kommentare einer Task, nur für Mitglieder oder Owner ihres Boards.
+    """
+    sync_view_class = TaskCommentListCreateView
+
+    async def initial(self, request, *args, **kwargs):
+        # Wie TaskCommentListCreateView.initial: erst die Task, dann Authentifizierung und Rechte.
+        self.task = await Task.objects.filter(pk=kwargs['task_id']).only('id', 'board_id').afirst()
+        if self.task is None:
+            raise exceptions.NotFound('Task nicht gefunden. Die angegebene Task-ID existiert nicht.')
+        await super().initial(request, *args, **kwargs)
+        if not await get_membership_resolver(request).ais_member_or_owner(request.user, self.task.board_id):
+            raise exceptions.PermissionDenied()
+
+    async def get(self, request, *args, **kwargs):
+        comments = Comment.objects.filter(task_id=self.task.pk).select_related('author').order_by('created_at')
+        return self.render(CommentSerializer([comment async for comment in comments], many=True).data)
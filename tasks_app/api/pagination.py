@@ -0,0 +1,211 @@
+"""
+Pagination für die Task-Listen des tasks_app API.
+
+- TaskKeysetPagination: Optionale Keyset-(Cursor-)Pagination entlang Task.Meta.ordering plus id.
+- TaskSearchPagination: Seiten-Pagination für nach Relevanz sortierte Suchergebnisse.
+"""
+
+import base64
+import json
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskKeysetPagination(BasePagination):
+    """
+    Keyset-Pagination für Task-Listen.
+
+    Verwendung:
+        - Ohne 'cursor' und 'page_size' bleibt die Liste unpaginiert (Opt-in).
+        - '?page_size=50' liefert die erste Seite, 'next' enthält die URL der Folgeseite.
+        - Der Cursor kodiert die Sortierwerte des letzten Eintrags (Meta.ordering plus id),
+          die Folgeseite wird per WHERE-Bedingung statt OFFSET gelesen. Dadurch bleibt sie
+          stabil, auch wenn zwischendurch Tasks eingefügt werden.
+        - NULL-Werte in sortierten Feldern werden immer ans Ende sortiert.
+
+    Antwort:
+        {"next": <URL oder null>, "results": [...]}
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    default_page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = 'Ungültiger Cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.model = queryset.model
+        self.ordering = self.get_ordering(self.model)
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self._order_by())
+
+        encoded = params.get(self.cursor_query_param)
+        if encoded:
+            queryset = queryset.filter(self._after(self.decode_cursor(encoded)))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_ordering(self, model):
+        """
+        Gibt die Sortierung als Liste von (Feldname, absteigend) zurück, mit id als Tiebreaker.
+        """
+        ordering = [
+            (name.lstrip('-'), name.startswith('-'))
+            for name in model._meta.ordering
+        ]
+        if not any(name in ('id', 'pk') for name, _ in ordering):
+            ordering.append(('id', False))
+        return ordering
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.default_page_size))
+        except (TypeError, ValueError):
+            return self.default_page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [self._value(last, name) for name, _ in self.ordering]
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(values))
+
+    def get_previous_link(self):
+        return None
+
+    def encode_cursor(self, values):
+        payload = json.dumps([self._dump(value) for value in values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, encoded):
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            if not isinstance(raw, list) or len(raw) != len(self.ordering):
+                raise ValueError
+            return [
+                None if value is None else self._field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, raw)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def _field(self, name):
+        return self.model._meta.get_field(name)
+
+    @staticmethod
+    def _value(obj, name):
+        if isinstance(obj, dict):
+            return obj[name]
+        return getattr(obj, name)
+
+    @staticmethod
+    def _dump(value):
+        if value is None or isinstance(value, (int, str)):
+            return value
+        return value.isoformat()
+
+    def _order_by(self):
+        expressions = []
+        for name, descending in self.ordering:
+            expression = F(name)
+            if self._field(name).null:
+                expressions.append(expression.desc(nulls_last=True) if descending else expression.asc(nulls_last=True))
+            else:
+                expressions.append(expression.desc() if descending else expression.asc())
+        return expressions
+
+    def _after(self, values):
+        """
+        Baut die Keyset-Bedingung "liegt in der Sortierung hinter values".
+        """
+        conditions = []
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            nullable = self._field(name).null
+            if value is None:
+                # NULL steht am Ende: dahinter liegen nur weitere NULL-Werte mit größerem Rest-Schlüssel.
+                equal &= Q(**{f'{name}__isnull': True})
+                continue
+            after = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+            if nullable:
+                after |= Q(**{f'{name}__isnull': True})
+            conditions.append(equal & after)
+            equal &= Q(**{name: value})
+        condition = Q()
+        for term in conditions:
+            condition |= term
+        return condition
+
+
+
+class TaskSearchPagination(BasePagination):
+    """
+    Pagination für die Suche: '?page=2&page_size=20'. Die Ergebnisse sind nach Relevanz sortiert,
+    eine Keyset-Pagination ist daher nicht möglich. Pro Seite wird ein Treffer mehr gelesen, um
+    'next' ohne Zählung aller Treffer zu bestimmen.
+
+    Antwort:
+        {"next": <URL oder null>, "previous": <URL oder null>, "results": [...]}
+    """
+    page_query_param = 'page'
+    page_size_query_param = 'page_size'
+    default_page_size = 20
+    max_page_size = 100
+
+    def paginate_search(self, fetch, request):
+        """
+        'fetch(limit, offset)' liefert die Treffer eines Ausschnitts. Gibt die Treffer der
+        angeforderten Seite zurück.
+        """
+        self.request = request
+        self.page_number = self._positive_int(request.query_params.get(self.page_query_param), 1)
+        self.page_size = min(
+            self._positive_int(request.query_params.get(self.page_size_query_param), self.default_page_size),
+            self.max_page_size,
+        )
+        hits = fetch(self.page_size + 1, (self.page_number - 1) * self.page_size)
+        self.has_next = len(hits) > self.page_size
+        return hits[:self.page_size]
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'previous': self.get_previous_link(), 'results': data})
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self._page_link(self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        return self._page_link(self.page_number - 1)
+
+    def _page_link(self, page_number):
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.page_query_param, page_number)
+
+    @staticmethod
+    def _positive_int(value, default):
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return default
@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from boards_app.membership import get_membership_resolver
+
 class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
     """
     Erlaubt das Löschen einer Task nur, wenn der anfragende User
@@ -8,8 +10,8 @@ class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         return (
-            obj.created_by == request.user or
-            obj.board.owner == request.user
+            obj.created_by_id == request.user.id or
+            obj.board.owner_id == request.user.id
         )
     
 
@@ -21,13 +23,10 @@ class IsBoardMember(permissions.BasePermission):
     def has_permission(self, request, view):
         task_id = view.kwargs.get('task_id')
         from tasks_app.models import Task
-        try:
-            task = Task.objects.get(pk=task_id)
-        except Task.DoesNotExist:
+        board_id = Task.objects.filter(pk=task_id).values_list('board_id', flat=True).first()
+        if board_id is None:
             return False
-        user = request.user
-        board = task.board
-        return user == board.owner or user in board.members.all()
+        return get_membership_resolver(request).is_member_or_owner(request.user, board_id)
     
 
 
@@ -36,11 +35,4 @@ class IsCommentAuthor(permissions.BasePermission):
     Erlaubt das Löschen/Bearbeiten eines Kommentars nur durch dessen Autor.
     """
     def has_object_permission(self, request, view, obj):
-        return obj.author == request.user
-    
-
-def is_board_member_or_owner(user, board):
-    """
-    Gibt True zurück, wenn der User Owner oder Mitglied des Boards ist.
-    """
-    return user == board.owner or user in board.members.all()
\ No newline at end of file
+        return obj.author_id == request.user.id
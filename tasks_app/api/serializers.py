@@ -2,9 +2,10 @@ from django.contrib.auth.models import User
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 from tasks_app.models import Task
+from boards_app.api.fast_render import render_date, render_user
 from boards_app.api.serializers import UserShortSerializer
 from tasks_app.models import Comment
-from tasks_app.api.permissions import is_board_member_or_owner
+from boards_app.membership import get_membership_resolver
 
 class CommentSerializer(serializers.ModelSerializer):
     """
@@ -35,22 +36,59 @@ class TaskListSerializer(serializers.ModelSerializer):
         - assignee: Bearbeiter (UserShortSerializer)
         - reviewer: Prüfer (UserShortSerializer)
         - comments_count: Anzahl der Kommentare
-        - comments: Liste der Kommentare (CommentSerializer)
+        - position: Sortierschlüssel innerhalb der Spalte (nur lesbar, ändern über /move/)
+
+    Für Listen sollte das Queryset mit prepare_queryset vorbereitet werden,
+    damit Bearbeiter und Prüfer nicht pro Task nachgeladen werden. comments_count ist eine
+    Spalte der Task (siehe tasks_app/comment_counts.py).
+
+    fast_queryset/fast_render bilden denselben Output ohne Serializer-Instanzen
+    (siehe boards_app/api/fast_render.py).
     """
     assignee = UserShortSerializer()
     reviewer = UserShortSerializer()
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
     
 
     class Meta:
         model = Task
         fields = [
             'id', 'board', 'title', 'description', 'status', 'priority',
-            'assignee', 'reviewer', 'due_date', 'comments_count'
+            'assignee', 'reviewer', 'due_date', 'comments_count', 'position'
+        ]
+        read_only_fields = ['position']
+
+    @staticmethod
+    def prepare_queryset(queryset):
+        return queryset.select_related('assignee', 'reviewer')
+
+    @staticmethod
+    def fast_queryset(queryset):
+        return queryset.values(
+            'id', 'board_id', 'title', 'description', 'status', 'priority',
+            'assignee_id', 'assignee__email', 'assignee__username',
+            'reviewer_id', 'reviewer__email', 'reviewer__username',
+            'due_date', 'comments_count', 'position',
+        )
+
+    @staticmethod
+    def fast_render(rows):
+        return [
+            {
+                'id': row['id'],
+                'board': row['board_id'],
+                'title': row['title'],
+                'description': row['description'],
+                'status': row['status'],
+                'priority': row['priority'],
+                'assignee': render_user(row['assignee_id'], row['assignee__email'], row['assignee__username']),
+                'reviewer': render_user(row['reviewer_id'], row['reviewer__email'], row['reviewer__username']),
+                'due_date': render_date(row['due_date']),
+                'comments_count': row['comments_count'],
+                'position': row['position'],
+            }
+            for row in rows
         ]
-
-    def get_comments_count(self, obj):
-        return obj.comments.count()
     
 
 class TaskDetailSerializer(serializers.ModelSerializer):
@@ -66,7 +104,7 @@ class TaskDetailSerializer(serializers.ModelSerializer):
     """
     assignee = UserShortSerializer()
     reviewer = UserShortSerializer()
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
     comments = CommentSerializer(many=True)
 
     class Meta:
@@ -76,8 +114,6 @@ class TaskDetailSerializer(serializers.ModelSerializer):
             'assignee', 'reviewer', 'due_date', 'comments_count', 'comments'
         ]
 
-    def get_comments_count(self, obj):
-        return obj.comments.count()
 
 
 
@@ -122,15 +158,16 @@ class TaskCreateSerializer(serializers.ModelSerializer):
     
 # Validierung, ob der User Mitglied des Boards ist
     def _validate_board(self, board):
-        user = self.context['request'].user
+        request = self.context['request']
         if not board:
              raise serializers.ValidationError("Board ist erforderlich.")
-        if not is_board_member_or_owner(user, board):
+        if not get_membership_resolver(request).is_member_or_owner(request.user, board):
              raise PermissionDenied("Du bist kein Mitglied dieses Boards.")   
 
     def _validate_members(self, board, data):
+        resolver = get_membership_resolver(self.context.get('request'))
         for role, member in [('assignee', data.get('assignee')), ('reviewer', data.get('reviewer'))]:
-            if member and not is_board_member_or_owner(member, board):
+            if member and not resolver.is_member_or_owner(member, board):
                 raise serializers.ValidationError(f"{role.capitalize()} muss Mitglied des Boards sein.")
             
 # Validierung für Status und Priorität
@@ -140,6 +177,15 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         if 'priority' in data and data.get('priority') not in ['low', 'medium', 'high']:
             raise serializers.ValidationError("Ungültige Priorität.")
 
+    def update(self, instance, validated_data):
+        # Nur die gesendeten Felder (plus z.B. 'position' aus save(**kwargs)) speichern, damit
+        # comments_count und Position nicht mit dem vorher geladenen Stand überschrieben werden.
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
+        return instance
+
 # Anpassen der Ausgabe nach Erstellung/Aktualisierung
     def to_representation(self, instance):
         rep = super().to_representation(instance)
@@ -149,6 +195,43 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         # Füge verschachtelte User-Objekte hinzu
         rep['assignee'] = UserShortSerializer(instance.assignee).data if instance.assignee else None
         rep['reviewer'] = UserShortSerializer(instance.reviewer).data if instance.reviewer else None
-        rep['comments_count'] = instance.comments.count()
+        rep['comments_count'] = instance.comments_count
         # Keine comments-Liste in der POST-Antwort
         return rep
+
+
+
+class TaskMoveSerializer(serializers.Serializer):
+    """
+    Eingabe für POST /api/tasks/<id>/move/.
+
+    Felder:
+        - status: Zielspalte (optional, Standard: aktuelle Spalte)
+        - after_id: Task, hinter der eingefügt wird; null oder fehlend für den Spaltenanfang
+    """
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    after_id = serializers.IntegerField(required=False, allow_null=True)
+
+
+
+class TaskBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer für ein einzelnes Element von /api/tasks/bulk/.
+
+    Prüft nur Feldtypen und erlaubte Werte. Board und User werden als IDs angenommen und nicht
+    einzeln geladen; Existenz und Mitgliedschaft prüft die View für alle Elemente gemeinsam.
+
+    Felder:
+        - board, title, description, status, priority, due_date
+        - assignee_id, reviewer_id: IDs von Bearbeiter und Prüfer (optional, null erlaubt)
+    """
+    board = serializers.IntegerField()
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = [
+            'board', 'title', 'description', 'status', 'priority',
+            'assignee_id', 'reviewer_id', 'due_date'
+        ]
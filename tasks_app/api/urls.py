@@ -3,20 +3,26 @@ URL-Konfiguration für das tasks_app API.
 
 Enthält folgende Endpunkte:
 - /api/tasks/                         : Erstellt eine neue Task (POST)
+- /api/tasks/bulk/                    : Legt viele Tasks an und/oder aktualisiert sie (POST)
+- /api/tasks/<int:pk>/move/           : Verschiebt eine Task innerhalb/zwischen Spalten (POST)
 - /api/tasks/<int:pk>/                : Details, Aktualisieren und Löschen einer Task (GET, PATCH/PUT, DELETE)
+- /api/tasks/search/                  : Volltextsuche über Tasks und Kommentare (GET, Query-Parameter: q, page, page_size)
 - /api/tasks/assigned-to-me/          : Listet alle Tasks, bei denen der User Bearbeiter ist (GET)
 - /api/tasks/reviewing/               : Listet alle Tasks, bei denen der User Prüfer ist (GET)
 - /api/tasks/<int:task_id>/comments/  : Erstellt einen neuen Kommentar zu einer Task (POST)
 - /api/tasks/<int:task_id>/comments/<int:comment_id>/ : Details, Aktualisieren und Löschen eines Kommentars (GET, PATCH/PUT, DELETE)
 """
 from django.urls import path
-from .views import AssignedTasksListView, CommentDetailView, ReviewingTasksListView, TaskCommentListCreateView, TaskCreateView, TaskDetailView
+from .views import AssignedTasksListView, CommentDetailView, ReviewingTasksListView, TaskBulkView, TaskCommentListCreateView, TaskCreateView, TaskDetailView, TaskMoveView, TaskSearchView
 
 urlpatterns = [
     path('assigned-to-me/', AssignedTasksListView.as_view(), name='assigned-to-me'),
     path('reviewing/', ReviewingTasksListView.as_view(), name='reviewing'),
+    path('search/', TaskSearchView.as_view(), name='task-search'),
     path('', TaskCreateView.as_view(), name='task-create'),
-    path('<int:pk>/', TaskDetailView.as_view(), name='task-detail'),  
+    path('bulk/', TaskBulkView.as_view(), name='task-bulk'),
+    path('<int:pk>/', TaskDetailView.as_view(), name='task-detail'),
+    path('<int:pk>/move/', TaskMoveView.as_view(), name='task-move'),  
     path('<int:task_id>/comments/', TaskCommentListCreateView.as_view(), name='task-comments-list-create'),
     path('<int:task_id>/comments/<int:comment_id>/', CommentDetailView.as_view(), name='task-comment-detail'),
 ]
\ No newline at end of file
@@ -1,47 +1,112 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 
 from rest_framework import generics, permissions
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
+from tasks_app.api.pagination import TaskKeysetPagination, TaskSearchPagination
 from tasks_app.api.permissions import IsBoardMember, IsCommentAuthor, IsTaskCreatorOrBoardOwner
 from tasks_app.models import Task
-from .serializers import CommentSerializer, TaskCreateSerializer, TaskListSerializer
+from .serializers import CommentSerializer, TaskBulkItemSerializer, TaskCreateSerializer, TaskListSerializer, TaskMoveSerializer
 from tasks_app.models import Comment
-from boards_app.models import Board
-from tasks_app.api.permissions import is_board_member_or_owner
+from tasks_app.comment_counts import change_comment_count
+from tasks_app.positions import POSITION_STEP, move_task, next_position, next_positions
+from tasks_app.search import get_search_backend, search_terms
+from boards_app.access_cache import get_accessible_board_ids
+from boards_app.api.conditional import ConditionalGetMixin, hashed_etag
+from boards_app.api.fast_render import FastListMixin
+from boards_app.changelog import record_changes
+from boards_app.models import Board, BoardChange
+from boards_app.stats import apply_task_transition, apply_task_transitions, locked_task_state, locked_task_states, task_state
+from boards_app.membership import get_membership_resolver
 
 
 
-class AssignedTasksListView(generics.ListAPIView):
+class AssignedTasksListView(ConditionalGetMixin, FastListMixin, generics.ListAPIView):
     """
     Listet alle Tasks, bei denen der User als Bearbeiter oder Prüfer eingetragen ist.
+    Mit '?page_size=' wird die Liste per Keyset-Cursor paginiert. Gerendert wird über den
+    schnellen Lesepfad (boards_app/api/fast_render.py).
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = TaskListSerializer
+    pagination_class = TaskKeysetPagination
+    fast_rendering = True
+
+    def get_etag(self, request, *args, **kwargs):
+        user = request.user
+        boards = Board.objects.filter(models.Q(tasks__assignee=user) | models.Q(tasks__reviewer=user))
+        return _board_versions_etag('assigned-to-me', request, boards)
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(
-            models.Q(assignee=user) | models.Q(reviewer=user)
-        ).distinct()
+        return TaskListSerializer.prepare_queryset(
+            Task.objects.filter(models.Q(assignee=user) | models.Q(reviewer=user))
+        )
 
 
 
-class ReviewingTasksListView(generics.ListAPIView):
+class ReviewingTasksListView(ConditionalGetMixin, FastListMixin, generics.ListAPIView):
     """
     Listet alle Tasks, bei denen der User als Prüfer eingetragen ist. 
+    Mit '?page_size=' wird die Liste per Keyset-Cursor paginiert (schneller Lesepfad).
     """
     serializer_class = TaskListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskKeysetPagination
+    fast_rendering = True
+
+    def get_etag(self, request, *args, **kwargs):
+        boards = Board.objects.filter(tasks__reviewer=request.user)
+        return _board_versions_etag('reviewing', request, boards)
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(reviewer=user)
+        return TaskListSerializer.prepare_queryset(Task.objects.filter(reviewer=user))
     
 
 
+class TaskSearchView(generics.GenericAPIView):
+    """
+    Volltextsuche über Titel, Beschreibung und Kommentare der Tasks aller Boards, auf die der
+    User zugreifen darf (siehe tasks_app/search.py).
+
+    GET /api/tasks/search/?q=<Begriffe>&page=1&page_size=20
+        Alle Begriffe müssen vorkommen (auch als Wortanfang). Die Treffer sind nach Relevanz
+        sortiert und werden wie die Task-Listen gerendert.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskSearchPagination
+
+    def get(self, request, *args, **kwargs):
+        terms = search_terms(request.query_params.get('q', ''))
+        if not terms:
+            return Response({'detail': 'Ungültige Anfrage. Der Suchbegriff fehlt.'}, status=400)
+        board_ids = get_accessible_board_ids(request.user)
+        backend = get_search_backend()
+        paginator = self.pagination_class()
+        task_ids = paginator.paginate_search(
+            lambda limit, offset: backend.search(terms, board_ids, limit, offset) if board_ids else [], request
+        )
+        rows = TaskListSerializer.fast_queryset(Task.objects.filter(pk__in=task_ids, board_id__in=board_ids).order_by())
+        by_id = {task['id']: task for task in TaskListSerializer.fast_render(rows)}
+        return paginator.get_paginated_response([by_id[task_id] for task_id in task_ids if task_id in by_id])
+
+
+
+def _board_versions_etag(name, request, boards):
+    """
+    ETag einer Task-Liste: Versionen aller Boards, auf denen Tasks der Liste liegen,
+    plus User und vollständiger Pfad (wegen Pagination-Parametern).
+    """
+    versions = list(boards.order_by('pk').values_list('pk', 'version').distinct())
+    return hashed_etag(name, request.user.pk, request.get_full_path(), versions)
+
+
+
 class TaskCreateView(generics.CreateAPIView):
     """
     Erstellt eine neue Task. Nur Board-Mitglieder dürfen Tasks anlegen.
@@ -72,7 +137,7 @@ class TaskCreateView(generics.CreateAPIView):
             board = Board.objects.get(pk=board_id)
         except Board.DoesNotExist:
             return None, Response({'detail': 'Board nicht gefunden. Das angegebene Board existiert nicht.'}, status=404)
-        if not is_board_member_or_owner(user, board):
+        if not get_membership_resolver(self.request).is_member_or_owner(user, board):
             return None, Response({'detail': 'Verboten. Der Benutzer muss Mitglied des Boards sein, um eine Task zu erstellen.'}, status=403)
         return board, None
 
@@ -99,7 +164,7 @@ class TaskCreateView(generics.CreateAPIView):
                     user_obj = User.objects.get(pk=user_id)
                 except User.DoesNotExist:
                     return Response({'detail': f'{role.capitalize()} nicht gefunden.'}, status=400)
-                if not is_board_member_or_owner(user_obj, board):
+                if not get_membership_resolver(self.request).is_member_or_owner(user_obj, board):
                     return Response({'detail': f'{role.capitalize()} muss Mitglied des Boards sein.'}, status=400)
                 data[role] = user_id
             else:
@@ -109,21 +174,31 @@ class TaskCreateView(generics.CreateAPIView):
     def _save_task(self, data, user, board):
         serializer = self.get_serializer(data=data)
         if serializer.is_valid():
-            task = serializer.save(created_by=user, board=board)
+            with transaction.atomic():
+                position = next_position(board.pk, serializer.validated_data['status'])
+                task = serializer.save(created_by=user, board=board, position=position)
+                apply_task_transition(None, task_state(task))
+                record_changes([(task.board_id, BoardChange.KIND_TASK, task.pk, False)])
             response_serializer = TaskListSerializer(task)
             return Response(response_serializer.data, status=201)
         return Response({'detail': 'Ungültige Anfragedaten.', 'errors': serializer.errors}, status=400)
 
 
 
-class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TaskDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
-    Zeigt Details, erlaubt Bearbeiten und Löschen einer Task.
+    Zeigt Details (mit ETag), erlaubt Bearbeiten und Löschen einer Task.
     Nur Ersteller oder Board-Owner dürfen löschen.
     """
     queryset = Task.objects.all()
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_etag(self, request, *args, **kwargs):
+        row = Task.objects.filter(pk=kwargs.get('pk')).order_by().values_list('board_id', 'board__version').first()
+        if row is None:
+            return None
+        return f'"task-{kwargs["pk"]}-{row[0]}-{row[1]}"'
+
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return TaskCreateSerializer
@@ -147,6 +222,39 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
 
         return super().update(request, *args, **kwargs)
 
+    def perform_update(self, serializer):
+        """
+        Wechselt die Task die Spalte (Board oder Status), wird sie am Ende der neuen Spalte eingereiht.
+        Der Ausgangszustand für die Board-Zähler wird in der Transaktion gesperrt neu gelesen.
+        """
+        instance = serializer.instance
+        extra = {}
+        with transaction.atomic():
+            before = locked_task_state(instance.pk)
+            if before is None:
+                raise NotFound('Task nicht gefunden.')
+            instance.board_id, instance.status, instance.priority = before
+            board = serializer.validated_data.get('board')
+            column = (board.pk if board else before[0], serializer.validated_data.get('status', before[1]))
+            if column != before[:2]:
+                extra['position'] = next_position(*column)
+            task = serializer.save(**extra)
+            apply_task_transition(before, task_state(task))
+            changes = [(task.board_id, BoardChange.KIND_TASK, task.pk, False)]
+            if before[0] != task.board_id:
+                changes.insert(0, (before[0], BoardChange.KIND_TASK, task.pk, True))
+            record_changes(changes)
+
+    def perform_destroy(self, instance):
+        task_id = instance.pk
+        with transaction.atomic():
+            before = locked_task_state(task_id)
+            if before is None:
+                return
+            instance.delete()
+            apply_task_transition(before, None)
+            record_changes([(before[0], BoardChange.KIND_TASK, task_id, True)])
+
 
 
 class TaskCommentListCreateView(generics.ListCreateAPIView):
@@ -165,7 +273,13 @@ class TaskCommentListCreateView(generics.ListCreateAPIView):
         return Comment.objects.filter(task=self.task).order_by('created_at')
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user, task=self.task)
+        with transaction.atomic():
+            comment = serializer.save(author=self.request.user, task=self.task)
+            change_comment_count(self.task.pk, 1)
+            record_changes([
+                (self.task.board_id, BoardChange.KIND_COMMENT, comment.pk, False),
+                (self.task.board_id, BoardChange.KIND_TASK, self.task.pk, False),
+            ])
 
 
 
@@ -192,4 +306,277 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.check_object_permissions(request, instance)
-        return super().destroy(request, *args, **kwargs)
\ No newline at end of file
+        return super().destroy(request, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            comment = serializer.save()
+            board_id = Task.objects.filter(pk=comment.task_id).values_list('board_id', flat=True).first()
+            record_changes([(board_id, BoardChange.KIND_COMMENT, comment.pk, False)])
+
+    def perform_destroy(self, instance):
+        comment_id = instance.pk
+        with transaction.atomic():
+            board_id = Task.objects.filter(pk=instance.task_id).values_list('board_id', flat=True).first()
+            instance.delete()
+            change_comment_count(instance.task_id, -1)
+            record_changes([
+                (board_id, BoardChange.KIND_COMMENT, comment_id, True),
+                (board_id, BoardChange.KIND_TASK, instance.task_id, False),
+            ])
+
+
+class TaskBulkView(generics.GenericAPIView):
+    """
+    Legt viele Tasks an und/oder aktualisiert sie teilweise in einer Anfrage.
+
+    POST:
+        {"create": [{board, title, status, priority, ...}, ...],
+         "update": [{"id": 1, "status": "done", ...}, ...]}
+        Felder wie bei POST /api/tasks/ bzw. PATCH /api/tasks/<id>/.
+
+    Alle Elemente werden zuerst gemeinsam validiert: Tasks, Boards und die Mitgliedschaft aller
+    referenzierten Bearbeiter/Prüfer werden mit je einer Query geladen. Gültige Elemente werden
+    anschließend in einer Transaktion per bulk_create/bulk_update geschrieben; ungültige werden
+    übersprungen. Board, Status und Priorität der zu ändernden Tasks werden dort gesperrt neu
+    gelesen (locked_task_states), inzwischen gelöschte Tasks erhalten 404. Die Zahl der Queries hängt nicht von der Zahl der Elemente ab, mit zwei
+    Ausnahmen: Django teilt die INSERTs nach dem Parameterlimit des Backends auf
+    (connection.ops.bulk_batch_size, unter SQLite 999 Parameter, also ca. 66 Tasks bzw.
+    199 Protokolleinträge pro INSERT), und bulk_update läuft einmal pro Kombination geänderter
+    Felder. Die Antwort enthält pro Element einen Eintrag mit 'index', 'status' und
+    entweder der Task oder 'detail'/'errors'.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    max_items = 500
+    update_fields = ['board', 'title', 'description', 'status', 'priority', 'assignee_id', 'reviewer_id', 'due_date']
+
+    def post(self, request, *args, **kwargs):
+        creates = request.data.get('create', []) if isinstance(request.data, dict) else None
+        updates = request.data.get('update', []) if isinstance(request.data, dict) else None
+        if not isinstance(creates, list) or not isinstance(updates, list):
+            return Response({'detail': "Erwartet ein Objekt mit den Listen 'create' und 'update'."}, status=400)
+        if len(creates) + len(updates) > self.max_items:
+            return Response({'detail': f'Maximal {self.max_items} Elemente pro Anfrage.'}, status=400)
+
+        create_results = [self._validate_item(item, partial=False) for item in creates]
+        tasks = self._load_tasks(updates)
+        update_results = [self._validate_update(item, tasks) for item in updates]
+        boards = self._load_boards(create_results + update_results, tasks)
+        resolver = get_membership_resolver(request)
+        resolver.prime(self._referenced_users(create_results + update_results), boards.values())
+        for result in create_results:
+            self._check_access(result, boards, resolver, partial=False)
+        for result in update_results:
+            self._check_access(result, boards, resolver, partial=True)
+
+        self._save(create_results, update_results, resolver)
+        return Response({
+            'create': [self._render(index, result) for index, result in enumerate(create_results)],
+            'update': [self._render(index, result) for index, result in enumerate(update_results)],
+        })
+
+    def _validate_item(self, item, partial):
+        """
+        Prüft Feldtypen und Werte eines Elements. Gibt ein Ergebnis-Dict zurück, das die
+        folgenden Schritte ergänzen; ein gesetzter 'status' markiert das Element als fehlerhaft.
+        """
+        if not isinstance(item, dict):
+            return {'status': 400, 'detail': 'Element muss ein Objekt sein.'}
+        if not partial:
+            for field, allowed in [('status', Task.STATUS_CHOICES), ('priority', Task.PRIORITY_CHOICES)]:
+                if item.get(field) not in dict(allowed):
+                    return {'status': 400, 'detail': f"Ungültiger Wert für '{field}'."}
+        serializer = TaskBulkItemSerializer(data=item, partial=partial)
+        if not serializer.is_valid():
+            return {'status': 400, 'detail': 'Ungültige Anfragedaten.', 'errors': serializer.errors}
+        return {'data': serializer.validated_data}
+
+    def _validate_update(self, item, tasks):
+        if not isinstance(item, dict) or not isinstance(item.get('id'), int):
+            return {'status': 400, 'detail': "Jedes Update braucht eine numerische 'id'."}
+        unknown = set(item) - set(self.update_fields) - {'id'}
+        if unknown:
+            return {'status': 400, 'detail': f"Ungültiges Feld: '{sorted(unknown)[0]}'."}
+        task = tasks.get(item['id'])
+        if task is None:
+            return {'status': 404, 'detail': 'Task nicht gefunden.'}
+        result = self._validate_item({key: value for key, value in item.items() if key != 'id'}, partial=True)
+        result['instance'] = task
+        return result
+
+    def _load_tasks(self, updates):
+        ids = {item.get('id') for item in updates if isinstance(item, dict) and isinstance(item.get('id'), int)}
+        return Task.objects.in_bulk(ids) if ids else {}
+
+    def _load_boards(self, results, tasks):
+        board_ids = {task.board_id for task in tasks.values()}
+        board_ids |= {result['data']['board'] for result in results if 'data' in result and 'board' in result['data']}
+        return Board.objects.only('id', 'owner_id').in_bulk(board_ids) if board_ids else {}
+
+    def _referenced_users(self, results):
+        user_ids = {self.request.user.pk}
+        for result in results:
+            data = result.get('data', {})
+            user_ids.update(data.get(role) for role in ['assignee_id', 'reviewer_id'])
+        return user_ids
+
+    def _check_access(self, result, boards, resolver, partial):
+        """
+        Prüft, ob der User auf die beteiligten Boards zugreifen darf und ob Bearbeiter/Prüfer
+        Mitglieder des Ziel-Boards sind. Nutzt ausschließlich die vorab geladenen Daten.
+        """
+        if 'status' in result:
+            return
+        data, task = result['data'], result.get('instance')
+        board = boards.get(data['board']) if 'board' in data else boards.get(task.board_id)
+        if board is None:
+            result.update(status=404, detail='Board nicht gefunden. Das angegebene Board existiert nicht.')
+            return
+        user = self.request.user
+        if not resolver.is_member_or_owner(user, board) or (task and not resolver.is_member_or_owner(user, boards[task.board_id])):
+            result.update(status=403, detail='Verboten. Der Benutzer muss Mitglied des Boards sein.')
+            return
+        for role in ['assignee', 'reviewer']:
+            user_id = data.get(f'{role}_id', getattr(task, f'{role}_id', None))
+            if user_id is not None and not resolver.is_member_or_owner(user_id, board):
+                result.update(status=400, detail=f'{role.capitalize()} muss Mitglied des Boards sein.')
+                return
+
+    def _save(self, create_results, update_results, resolver):
+        new_tasks, transitions, changes = [], [], []
+        for result in create_results:
+            if 'status' not in result:
+                data = dict(result['data'], board_id=result['data'].pop('board'))
+                result['instance'] = Task(created_by=self.request.user, **data)
+                new_tasks.append(result['instance'])
+
+        with transaction.atomic():
+            # Board, Status und Priorität gesperrt neu lesen: Die bei der Validierung geladenen
+            # Tasks können inzwischen verschoben, geändert oder gelöscht worden sein.
+            updates = [result for result in update_results if 'status' not in result]
+            states = locked_task_states(result['instance'].pk for result in updates)
+            # Jede Task schreibt nur die Felder, die ihr Element gesendet hat, plus 'position',
+            # wenn sie die Spalte wechselt; sonst würden veraltete Werte anderer Felder (oder eine
+            # zwischenzeitlich per /move/ geänderte Position) zurückgeschrieben.
+            changed, moved, groups = [], [], defaultdict(list)
+            for result in updates:
+                task = result['instance']
+                before = states.get(task.pk)
+                if before is None:
+                    result.update(status=404, detail='Task nicht gefunden.')
+                    continue
+                if before[0] != task.board_id and not resolver.is_member_or_owner(self.request.user, before[0]):
+                    result.update(status=403, detail='Verboten. Der Benutzer muss Mitglied des Boards sein.')
+                    continue
+                task.board_id, task.status, task.priority = before
+                data = dict(result['data'])
+                if 'board' in data:
+                    data['board_id'] = data.pop('board')
+                for field, value in data.items():
+                    setattr(task, field, value)
+                fields = set(data)
+                after = task_state(task)
+                if before[:2] != after[:2]:
+                    moved.append(task)
+                    fields.add('position')
+                changed.append(task)
+                groups[tuple(sorted(fields))].append(task)
+                transitions.append((before, after))
+                if before[0] != task.board_id:
+                    changes.append((before[0], BoardChange.KIND_TASK, task.pk, True))
+                changes.append((task.board_id, BoardChange.KIND_TASK, task.pk, False))
+
+            self._assign_positions(new_tasks, moved)
+            Task.objects.bulk_create(new_tasks)
+            for fields, tasks in groups.items():
+                if fields:
+                    Task.objects.bulk_update(tasks, fields)
+            transitions += [(None, task_state(task)) for task in new_tasks]
+            changes += [(task.board_id, BoardChange.KIND_TASK, task.pk, False) for task in new_tasks]
+            apply_task_transitions(transitions)
+            record_changes(changes)
+
+        saved = [task.pk for task in new_tasks] + [task.pk for task in changed]
+        rendered = TaskListSerializer(
+            TaskListSerializer.prepare_queryset(Task.objects.filter(pk__in=saved)), many=True
+        ).data
+        by_id = {task['id']: task for task in rendered}
+        for result in create_results:
+            if 'status' not in result:
+                result.update(status=201, task=by_id[result['instance'].pk])
+        for result in update_results:
+            if 'status' not in result:
+                result.update(status=200, task=by_id[result['instance'].pk])
+
+    def _assign_positions(self, new_tasks, moved_tasks):
+        """
+        Reiht neue und in eine andere Spalte verschobene Tasks am Ende ihrer Spalte ein
+        (eine Query für alle Spalten).
+        """
+        tasks = new_tasks + moved_tasks
+        positions = next_positions((task.board_id, task.status) for task in tasks)
+        for task in tasks:
+            column = (task.board_id, task.status)
+            task.position = positions[column]
+            positions[column] += POSITION_STEP
+
+    def _render(self, index, result):
+        item = {'index': index, 'status': result['status']}
+        for key in ['task', 'detail', 'errors']:
+            if key in result:
+                item[key] = result[key]
+        return item
+
+
+
+class TaskMoveView(generics.GenericAPIView):
+    """
+    Verschiebt eine Task per Drag-and-Drop.
+
+    POST:
+        {"status": "done", "after_id": 12}
+        Fügt die Task in der Spalte 'status' (Standard: aktuelle Spalte) direkt hinter Task 12 ein;
+        ohne after_id bzw. mit null landet sie am Spaltenanfang. Geschrieben wird nur die
+        verschobene Task (siehe tasks_app/positions.py).
+    """
+    queryset = Task.objects.all()
+    serializer_class = TaskMoveSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        task = self.get_object()
+        resolver = get_membership_resolver(request)
+        if not resolver.is_member_or_owner(request.user, task.board_id):
+            return Response({'detail': 'Du bist kein Mitglied dieses Boards.'}, status=403)
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'detail': 'Ungültige Anfragedaten.', 'errors': serializer.errors}, status=400)
+
+        with transaction.atomic():
+            # Ausgangszustand gesperrt neu lesen (wie TaskDetailView.perform_update), damit
+            # Spalte und Zähler-Deltas nicht von einem zwischenzeitlich geänderten Stand ausgehen.
+            before = locked_task_state(task.pk)
+            if before is None:
+                raise NotFound('Task nicht gefunden.')
+            if before[0] != task.board_id and not resolver.is_member_or_owner(request.user, before[0]):
+                return Response({'detail': 'Du bist kein Mitglied dieses Boards.'}, status=403)
+            task.board_id, task.status, task.priority = before
+            status = serializer.validated_data.get('status', task.status)
+            after, error = self._get_after(serializer.validated_data.get('after_id'), task, status)
+            if error:
+                return error
+            moved = move_task(task, status, after)
+            apply_task_transition(before, task_state(task))
+            record_changes([(task.board_id, BoardChange.KIND_TASK, task_id, False) for task_id in moved])
+        task = TaskListSerializer.prepare_queryset(Task.objects.filter(pk=task.pk)).get()
+        return Response(TaskListSerializer(task).data)
+
+    def _get_after(self, after_id, task, status):
+        if after_id is None:
+            return None, None
+        if after_id == task.pk:
+            return None, Response({'detail': 'Eine Task kann nicht hinter sich selbst verschoben werden.'}, status=400)
+        after = Task.objects.filter(pk=after_id, board_id=task.board_id, status=status).only('id', 'position').first()
+        if after is None:
+            return None, Response({'detail': 'after_id muss eine Task derselben Spalte sein.'}, status=400)
+        return after, None
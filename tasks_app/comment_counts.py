@@ -0,0 +1,58 @@
+"""
+Pflege des denormalisierten Kommentarzählers Task.comments_count.
+
+- change_comment_count: Erhöht oder verringert den Zähler einer Task mit einem F-Ausdruck.
+- compute_comment_counts / find_comment_count_drift / rebuild_comment_counts: Berechnen,
+  prüfen bzw. reparieren die Zähler in Bulk.
+
+change_comment_count wird in derselben Transaktion wie das Anlegen oder Löschen des Kommentars
+aufgerufen. Kommentare, die auf anderem Weg verschwinden (z.B. durch das Löschen ihres Autors),
+korrigiert der Befehl rebuild_comment_counts.
+"""
+
+from django.db.models import Count, F
+
+from tasks_app.models import Comment, Task
+
+
+def change_comment_count(task_id, delta):
+    """
+    Ändert comments_count einer Task atomar um delta (+1 / -1).
+    """
+    Task.objects.filter(pk=task_id).update(comments_count=F('comments_count') + delta)
+
+
+def compute_comment_counts(task_ids=None):
+    """
+    Berechnet die Soll-Werte mit einer gruppierten Query. Gibt {task_id: anzahl} zurück.
+    """
+    comments = Comment.objects.order_by()
+    if task_ids is not None:
+        comments = comments.filter(task_id__in=task_ids)
+    return dict(comments.values('task').annotate(count=Count('pk')).values_list('task', 'count'))
+
+
+def find_comment_count_drift(task_ids=None):
+    """
+    Gibt {task_id: (gespeichert, berechnet)} aller Tasks mit abweichendem Zähler zurück.
+    """
+    expected = compute_comment_counts(task_ids)
+    tasks = Task.objects.order_by()
+    if task_ids is not None:
+        tasks = tasks.filter(pk__in=task_ids)
+    drift = {}
+    for task_id, stored in tasks.values_list('pk', 'comments_count').iterator():
+        if stored != expected.get(task_id, 0):
+            drift[task_id] = (stored, expected.get(task_id, 0))
+    return drift
+
+
+def rebuild_comment_counts(task_ids=None, batch_size=500):
+    """
+    Schreibt die berechneten Zähler abweichender Tasks per bulk_update zurück.
+    Gibt die Anzahl der korrigierten Tasks zurück.
+    """
+    drift = find_comment_count_drift(task_ids)
+    tasks = [Task(pk=task_id, comments_count=expected) for task_id, (_, expected) in drift.items()]
+    Task.objects.bulk_update(tasks, ['comments_count'], batch_size=batch_size)
+    return len(tasks)
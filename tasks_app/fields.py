@@ -0,0 +1,55 @@
+"""
+Modellfelder der tasks_app.
+
+- RankedChoiceField: Auswahlfeld, das statt des Werts dessen Rang als kleine Ganzzahl speichert.
+"""
+
+from django.core import exceptions
+from django.db import models
+
+
+class RankedChoiceField(models.PositiveSmallIntegerField):
+    """
+    Auswahlfeld mit Rang-Speicherung.
+
+    In Python, im ORM und in der API bleibt der Wert der String aus 'choices' (z.B. 'high');
+    in der Datenbank steht seine Position in 'choices' (0, 1, 2, ...). Die Reihenfolge der
+    choices ist damit zugleich die Sortierreihenfolge: order_by('priority') sortiert
+    low < medium < high statt alphabetisch, und Indizes auf der Spalte liefern diese Ordnung
+    direkt. Filter wie filter(status='to-do') oder status__in=[...] werden beim Vorbereiten der
+    Query in Ränge übersetzt.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self.choices:
+            raise ValueError('RankedChoiceField braucht choices.')
+        self.values = [value for value, _ in self.flatchoices]
+        self.ranks = {value: rank for rank, value in enumerate(self.values)}
+
+    @property
+    def validators(self):
+        # Keine Bereichsprüfung der Ganzzahl: validiert wird der String gegen choices.
+        return [*self.default_validators, *self._validators]
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if value is None or value in self.ranks:
+            return value
+        try:
+            return self.values[int(value)]
+        except (TypeError, ValueError, IndexError):
+            raise exceptions.ValidationError(
+                self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value},
+            )
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return self.ranks[value]
+        except KeyError:
+            raise ValueError(f"Ungültiger Wert für '{self.name}': {value!r}") from None
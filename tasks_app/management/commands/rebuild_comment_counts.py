@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from tasks_app.comment_counts import find_comment_count_drift, rebuild_comment_counts
+
+
+class Command(BaseCommand):
+    """
+    Prüft oder repariert den denormalisierten Kommentarzähler (Task.comments_count).
+
+    Aufruf:
+        python manage.py rebuild_comment_counts            # alle Zähler neu berechnen und korrigieren
+        python manage.py rebuild_comment_counts --verify   # nur Abweichungen melden (Exit-Code 1 bei Drift)
+        python manage.py rebuild_comment_counts --task 3 --task 7
+    """
+    help = 'Berechnet Task.comments_count neu oder prüft den Zähler auf Abweichungen.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help='Nur prüfen, nichts schreiben.')
+        parser.add_argument('--task', type=int, action='append', dest='tasks', help='Nur diese Task (mehrfach möglich).')
+
+    def handle(self, *args, **options):
+        task_ids = options['tasks']
+        if options['verify']:
+            drift = find_comment_count_drift(task_ids)
+            for task_id, (current, expected) in sorted(drift.items()):
+                self.stdout.write(f'Task {task_id}: gespeichert={current} erwartet={expected}')
+            if drift:
+                raise CommandError(f'{len(drift)} Task(s) mit abweichendem Kommentarzähler.')
+            self.stdout.write(self.style.SUCCESS('Alle Kommentarzähler sind korrekt.'))
+            return
+
+        with transaction.atomic():
+            repaired = rebuild_comment_counts(task_ids)
+        self.stdout.write(self.style.SUCCESS(f'{repaired} Task(s) korrigiert.'))
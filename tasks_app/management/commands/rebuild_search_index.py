@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from tasks_app.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    Baut den Suchindex der Tasks (tasks_app/search.py) komplett neu auf, z.B. nach einem
+    Import oder wenn Tasks außerhalb der API geändert wurden.
+
+    Aufruf:
+        python manage.py rebuild_search_index
+    """
+    help = 'Baut den Volltext-Suchindex über Tasks und Kommentare neu auf.'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        with transaction.atomic():
+            indexed = backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'{indexed} Task(s) indiziert ({type(backend).__name__}).'))
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+POSITION_STEP = 1024
+
+
+def populate_positions(apps, schema_editor):
+    Task = apps.get_model('tasks_app', 'Task')
+    tasks = Task.objects.order_by('board_id', 'status', '-due_date', 'priority', 'id').only('id', 'board_id', 'status')
+    column, position, batch = None, 0, []
+    for task in tasks.iterator():
+        if (task.board_id, task.status) != column:
+            column, position = (task.board_id, task.status), 0
+        position += POSITION_STEP
+        task.position = position
+        batch.append(task)
+        if len(batch) >= 500:
+            Task.objects.bulk_update(batch, ['position'])
+            batch = []
+    Task.objects.bulk_update(batch, ['position'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_version'),
+        ('tasks_app', '0005_alter_comment_options_alter_task_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='position',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_positions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'position'], name='task_column_position_idx'),
+        ),
+    ]
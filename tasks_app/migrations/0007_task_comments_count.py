@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 02:00
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_comments_count(apps, schema_editor):
+    Task = apps.get_model('tasks_app', 'Task')
+    Comment = apps.get_model('tasks_app', 'Comment')
+    counts = Comment.objects.order_by().values('task').annotate(count=Count('pk')).values_list('task', 'count')
+    tasks = [Task(pk=task_id, comments_count=count) for task_id, count in counts]
+    Task.objects.bulk_update(tasks, ['comments_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0006_task_position'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_comments_count, migrations.RunPython.noop),
+    ]
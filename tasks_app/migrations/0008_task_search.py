@@ -0,0 +1,35 @@
+# Virtuelle FTS5-Tabelle für die Volltextsuche (siehe tasks_app/search.py).
+# Auf anderen Datenbanken als SQLite wird nichts angelegt.
+
+from django.db import migrations
+
+
+def create_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE tasks_app_task_search USING fts5("
+        "title, description, comments, board, tokenize='unicode61 remove_diacritics 2', prefix='2 3 4 5 6 7 8')"
+    )
+    schema_editor.execute(
+        "INSERT INTO tasks_app_task_search (rowid, title, description, comments, board) "
+        "SELECT t.id, t.title, t.description, "
+        "(SELECT group_concat(c.content, ' ') FROM tasks_app_comment c WHERE c.task_id = t.id), "
+        "'b' || t.board_id FROM tasks_app_task t"
+    )
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS tasks_app_task_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0007_task_comments_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Einspaltige Indizes der Fremdschlüssel, die durch die neuen Indizes abgedeckt sind
+# (Namen wie von Django für db_index=True erzeugt).
+REDUNDANT_INDEXES = [
+    ('tasks_app_task_board_id_2c04c845', 'tasks_app_task', 'board_id'),
+    ('tasks_app_task_assignee_id_b967b4fa', 'tasks_app_task', 'assignee_id'),
+    ('tasks_app_task_reviewer_id_5b1f3085', 'tasks_app_task', 'reviewer_id'),
+    ('tasks_app_comment_task_id_2c74989f', 'tasks_app_comment', 'task_id'),
+]
+
+
+class Migration(migrations.Migration):
+    """
+    Zusammengesetzte Indizes für die häufigsten Zugriffe auf Tasks und Kommentare (siehe
+    Task.Meta.indexes / Comment.Meta.indexes). Die einspaltigen Indizes der Fremdschlüssel werden
+    erst danach und per DROP INDEX entfernt; ein AlterField würde unter SQLite die ganze Tabelle
+    neu aufbauen.
+    """
+
+    dependencies = [
+        ('boards_app', '0005_boardchange'),
+        ('tasks_app', '0008_task_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', '-due_date', 'priority'], name='task_assignee_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reviewer', '-due_date', 'priority'], name='task_reviewer_due_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=f'DROP INDEX IF EXISTS {name}',
+                    reverse_sql=f'CREATE INDEX {name} ON {table} ({column})',
+                )
+                for name, table, column in REDUNDANT_INDEXES
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='comment',
+                    name='task',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='tasks_app.task'),
+                ),
+                migrations.AlterField(
+                    model_name='task',
+                    name='assignee',
+                    field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assigned_tasks', to=settings.AUTH_USER_MODEL),
+                ),
+                migrations.AlterField(
+                    model_name='task',
+                    name='board',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='boards_app.board'),
+                ),
+                migrations.AlterField(
+                    model_name='task',
+                    name='reviewer',
+                    field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_tasks', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:11
+
+import tasks_app.fields
+from django.conf import settings
+from django.db import migrations, models
+
+# Stand der choices zum Zeitpunkt der Migration; der Rang ist die Position in der Liste.
+STATUSES = ['to-do', 'in-progress', 'review', 'done']
+PRIORITIES = ['low', 'medium', 'high']
+
+
+def _to_ranks(column, values, default):
+    cases = ' '.join(f"WHEN '{value}' THEN {rank}" for rank, value in enumerate(values))
+    return f'{column} = CASE {column} {cases} ELSE {values.index(default)} END'
+
+
+def _to_values(column, values):
+    cases = ' '.join(f"WHEN {rank} THEN '{value}'" for rank, value in enumerate(values))
+    return f'{column} = CASE CAST({column} AS INTEGER) {cases} END'
+
+
+class Migration(migrations.Migration):
+    """
+    Speichert status und priority als Rang (tasks_app/fields.py, RankedChoiceField).
+
+    Die Werte werden zuerst in der bisherigen Textspalte durch ihren Rang ersetzt, danach wird
+    der Spaltentyp geändert (SQLite baut die Tabelle dabei neu auf und übernimmt '0', '1', ... als
+    Zahl, PostgreSQL konvertiert per USING). Rückwärts läuft es in umgekehrter Reihenfolge.
+    Die Indizes für 'assigned-to-me' und 'reviewing' folgen der neuen Sortierung
+    (-due_date, -priority).
+    """
+
+    dependencies = [
+        ('boards_app', '0005_boardchange'),
+        ('tasks_app', '0009_task_access_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['-due_date', '-priority'], 'verbose_name': 'Task', 'verbose_name_plural': 'Tasks'},
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_assignee_due_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_reviewer_due_idx',
+        ),
+        migrations.RunSQL(
+            sql=(
+                f"UPDATE tasks_app_task SET {_to_ranks('status', STATUSES, 'to-do')}, "
+                f"{_to_ranks('priority', PRIORITIES, 'medium')}"
+            ),
+            reverse_sql=(
+                f"UPDATE tasks_app_task SET {_to_values('status', STATUSES)}, {_to_values('priority', PRIORITIES)}"
+            ),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='priority',
+            field=tasks_app.fields.RankedChoiceField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='medium'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=tasks_app.fields.RankedChoiceField(choices=[('to-do', 'To Do'), ('in-progress', 'In Progress'), ('review', 'Review'), ('done', 'Done')], default='to-do'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', '-due_date', '-priority'], name='task_assignee_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reviewer', '-due_date', '-priority'], name='task_reviewer_due_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from boards_app.models import Board
+from tasks_app.fields import RankedChoiceField
 
 class Task(models.Model):
 	"""
@@ -10,16 +11,19 @@ class Task(models.Model):
         - board: Zugehöriges Board (ForeignKey)
         - title: Titel des Tasks
         - description: Beschreibung des Tasks (optional)
-        - status: Status des Tasks (to-do, in-progress, review, done)
-        - priority: Priorität des Tasks (low, medium, high)
+        - status: Status des Tasks (to-do, in-progress, review, done), gespeichert als Rang 0-3
+        - priority: Priorität des Tasks (low, medium, high), gespeichert als Rang 0-2
         - assignee: Bearbeiter (User, optional)
         - reviewer: Prüfer (User, optional)
         - due_date: Fälligkeitsdatum (optional)
         - created_by: Ersteller des Tasks
+        - comments_count: Anzahl der Kommentare (denormalisiert, siehe tasks_app/comment_counts.py)
+        - position: Sortierschlüssel innerhalb der Spalte (Board + Status), mit Lücken (siehe tasks_app/positions.py)
 
     Zweck:
         Tasks können Boards zugeordnet, verschiedenen Nutzern zugewiesen und mit Status/Priorität versehen werden.
     """
+	# Die Reihenfolge der choices ist der gespeicherte Rang (siehe tasks_app/fields.py).
 	STATUS_CHOICES = [
 		('to-do', 'To Do'),
 		('in-progress', 'In Progress'),
@@ -32,15 +36,19 @@ class Task(models.Model):
 		('high', 'High'),
 	]
 
-	board = models.ForeignKey(Board, related_name='tasks', on_delete=models.CASCADE)
+	# Die Fremdschlüssel board, assignee und reviewer sind führende Spalten der Indizes in Meta.indexes
+	# und brauchen keinen eigenen Index.
+	board = models.ForeignKey(Board, related_name='tasks', on_delete=models.CASCADE, db_index=False)
 	title = models.CharField(max_length=255)
 	description = models.TextField(blank=True)
-	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='to-do')
-	priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='medium')
-	assignee = models.ForeignKey(User, related_name='assigned_tasks', on_delete=models.SET_NULL, null=True, blank=True)
-	reviewer = models.ForeignKey(User, related_name='reviewed_tasks', on_delete=models.SET_NULL, null=True, blank=True)
+	status = RankedChoiceField(choices=STATUS_CHOICES, default='to-do')
+	priority = RankedChoiceField(choices=PRIORITY_CHOICES, default='medium')
+	assignee = models.ForeignKey(User, related_name='assigned_tasks', on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
+	reviewer = models.ForeignKey(User, related_name='reviewed_tasks', on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
 	due_date = models.DateField(null=True, blank=True)
 	created_by = models.ForeignKey(User, related_name='created_tasks', on_delete=models.CASCADE)
+	position = models.BigIntegerField(default=0)
+	comments_count = models.PositiveIntegerField(default=0)
 
 	def __str__(self):
 			return self.title
@@ -48,7 +56,17 @@ class Task(models.Model):
 	class Meta:
 			verbose_name = "Task"
 			verbose_name_plural = "Tasks"
-			ordering = ["-due_date", "priority"]    
+			# Innerhalb eines Fälligkeitsdatums die höchste Priorität zuerst.
+			ordering = ["-due_date", "-priority"]
+			indexes = [
+				# Spalten eines Boards (auch Filter nach board + status)
+				models.Index(fields=['board', 'status', 'position'], name='task_column_position_idx'),
+				# Filter nach board + priority (z.B. Zähler der Tasks mit hoher Priorität)
+				models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+				# 'assigned-to-me' und 'reviewing' in der Reihenfolge von Meta.ordering
+				models.Index(fields=['assignee', '-due_date', '-priority'], name='task_assignee_due_idx'),
+				models.Index(fields=['reviewer', '-due_date', '-priority'], name='task_reviewer_due_idx'),
+			]
 
 
 class Comment(models.Model):
@@ -65,7 +83,8 @@ class Comment(models.Model):
         Kommentare ermöglichen Diskussionen und Notizen zu einzelnen Aufgaben.
     """
 
-    task = models.ForeignKey('Task', related_name='comments', on_delete=models.CASCADE)
+    # Führende Spalte von comment_task_created_idx, daher ohne eigenen Index.
+    task = models.ForeignKey('Task', related_name='comments', on_delete=models.CASCADE, db_index=False)
     author = models.ForeignKey(User, related_name='comments', on_delete=models.CASCADE)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -76,4 +95,8 @@ class Comment(models.Model):
     class Meta:
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
-        ordering = ["-created_at"]
\ No newline at end of file
+        ordering = ["-created_at"]
+        indexes = [
+            # Kommentare einer Task in zeitlicher Reihenfolge (beide Richtungen)
+            models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+        ]
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Sortierung der Tasks innerhalb einer Spalte (Board + Status).
+
+Positionen sind ganze Zahlen mit Lücken von POSITION_STEP. Eine verschobene Task erhält die Mitte
+zwischen ihren neuen Nachbarn, sodass pro Verschiebung nur die Task selbst geschrieben wird.
+Erst wenn zwischen zwei Nachbarn keine freie Zahl mehr liegt, wird die Spalte einmal mit
+frischen Lücken neu durchnummeriert (renumber_column).
+
+- next_position / next_positions: Position am Spaltenende für neue oder umgezogene Tasks.
+- move_task: Verschiebt eine Task hinter eine andere Task (oder an den Spaltenanfang).
+- renumber_column: Vergibt die Positionen einer Spalte neu.
+"""
+
+from django.db.models import Max
+
+from tasks_app.models import Task
+
+POSITION_STEP = 1024
+
+
+def _column(board_id, status):
+    return Task.objects.filter(board_id=board_id, status=status).order_by('position', 'id')
+
+
+def next_position(board_id, status):
+    """
+    Position hinter der letzten Task der Spalte.
+    """
+    return next_positions([(board_id, status)])[(board_id, status)]
+
+
+def next_positions(columns):
+    """
+    Wie next_position für mehrere Spalten [(board_id, status), ...] mit einer Query.
+    Gibt {(board_id, status): position} zurück.
+    """
+    columns = set(columns)
+    if not columns:
+        return {}
+    rows = (
+        Task.objects.filter(board_id__in={board_id for board_id, _ in columns}).order_by()
+        .values_list('board_id', 'status').annotate(last=Max('position'))
+    )
+    last = {(board_id, status): value for board_id, status, value in rows}
+    return {column: last.get(column, 0) + POSITION_STEP for column in columns}
+
+
+def renumber_column(board_id, status):
+    """
+    Nummeriert die Spalte in der bestehenden Reihenfolge mit Abstand POSITION_STEP neu.
+    Gibt die IDs der Tasks zurück.
+    """
+    tasks = list(_column(board_id, status).only('id', 'position'))
+    for index, task in enumerate(tasks, start=1):
+        task.position = index * POSITION_STEP
+    Task.objects.bulk_update(tasks, ['position'], batch_size=500)
+    return [task.pk for task in tasks]
+
+
+def _position_after(board_id, status, after, exclude):
+    """
+    Freie Position direkt hinter 'after' (Task oder None für den Spaltenanfang), oder None,
+    wenn zwischen 'after' und seinem Nachfolger keine Zahl mehr frei ist.
+    """
+    column = _column(board_id, status).exclude(pk=exclude)
+    if after is None:
+        first = column.values_list('position', flat=True).first()
+        return POSITION_STEP if first is None else first - POSITION_STEP
+    following = (
+        column.filter(position__gt=after.position).values_list('position', flat=True).first()
+    )
+    if following is None:
+        return after.position + POSITION_STEP
+    if following - after.position < 2:
+        return None
+    return (after.position + following) // 2
+
+
+def move_task(task, status, after=None):
+    """
+    Verschiebt 'task' in die Spalte 'status' ihres Boards, direkt hinter die Task 'after'
+    (None: an den Spaltenanfang). Speichert nur position und status der Task; lediglich wenn
+    die Lücke aufgebraucht ist, wird die Zielspalte vorher neu durchnummeriert.
+    Muss innerhalb einer Transaktion aufgerufen werden. Gibt die IDs aller Tasks zurück, deren
+    Position sich geändert hat.
+    """
+    changed = [task.pk]
+    position = _position_after(task.board_id, status, after, task.pk)
+    if position is None:
+        changed += renumber_column(task.board_id, status)
+        after.refresh_from_db(fields=['position'])
+        position = _position_after(task.board_id, status, after, task.pk)
+    task.status = status
+    task.position = position
+    task.save(update_fields=['status', 'position'])
+    return list(dict.fromkeys(changed))
@@ -0,0 +1,218 @@
+"""
+Volltextsuche über Tasks (Titel, Beschreibung) und deren Kommentare.
+
+- get_search_backend: Liefert das konfigurierte Backend (settings.TASK_SEARCH['BACKEND']).
+- SearchBackend: Schnittstelle eines Backends (search, update, remove_boards, rebuild).
+- Fts5SearchBackend: SQLite-FTS5-Index in der virtuellen Tabelle 'tasks_app_task_search'.
+- DatabaseSearchBackend: Fallback ohne Index (icontains), für Datenbanken ohne eigenes Backend.
+
+Der FTS5-Index enthält pro Task eine Zeile (rowid = Task-ID) mit Titel, Beschreibung, allen
+Kommentaren und dem Token 'b<board_id>'. Die Einschränkung auf die Boards des Users ist Teil des
+MATCH-Ausdrucks, FTS5 schneidet also nur die Trefferlisten der Suchbegriffe mit denen der Boards,
+statt alle Treffer zu laden und danach zu filtern. Sortiert wird nach bm25 (Titel vor
+Beschreibung vor Kommentaren); bei sehr häufigen Begriffen stattdessen nach Aktualität, damit
+die Antwortzeit nicht mit der Größe des Index wächst (siehe Fts5SearchBackend._is_common).
+
+Synchron gehalten wird der Index über das Änderungsprotokoll (boards_app/changelog.py): jede
+protokollierte Task- oder Kommentaränderung indiziert die betroffenen Tasks in derselben
+Transaktion neu (siehe tasks_app/signals.py). Backfills erledigt 'rebuild_search_index'.
+
+Konfiguration (settings.TASK_SEARCH):
+    - BACKEND: Importpfad der Backend-Klasse (Standard: None, d.h. FTS5 unter SQLite,
+      sonst DatabaseSearchBackend)
+"""
+
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.utils.module_loading import import_string
+
+from boards_app.models import BoardChange
+from tasks_app.models import Comment, Task
+
+DEFAULTS = {
+    'BACKEND': None,
+}
+
+TERM_PATTERN = re.compile(r'\w+')
+MAX_TERMS = 8
+
+
+def _config(name):
+    return getattr(settings, 'TASK_SEARCH', {}).get(name, DEFAULTS[name])
+
+
+def search_terms(query):
+    """
+    Zerlegt die Eingabe in Suchbegriffe (Wortzeichen, höchstens MAX_TERMS).
+    Operatoren der FTS5-Syntax werden so nie aus der Eingabe übernommen.
+    """
+    return TERM_PATTERN.findall(query.lower())[:MAX_TERMS]
+
+
+class SearchBackend:
+    """
+    Schnittstelle eines Such-Backends.
+
+    search() gibt eine nach Relevanz sortierte Liste von Task-IDs zurück. update() und
+    remove_boards() halten einen Index aktuell und werden innerhalb der schreibenden
+    Transaktion aufgerufen; Backends ohne Index lassen sie leer.
+    """
+
+    def search(self, terms, board_ids, limit, offset=0):
+        raise NotImplementedError
+
+    def update(self, task_ids):
+        pass
+
+    def remove_boards(self, board_ids):
+        pass
+
+    def rebuild(self):
+        """
+        Baut den Index komplett neu auf. Gibt die Anzahl der indizierten Tasks zurück.
+        """
+        return 0
+
+
+
+class DatabaseSearchBackend(SearchBackend):
+    """
+    Sucht ohne Index per icontains; Tasks mit Treffer im Titel stehen vorn.
+    Nur für kleine Datenmengen bzw. als Fallback gedacht.
+    """
+
+    def search(self, terms, board_ids, limit, offset=0):
+        tasks = Task.objects.filter(board_id__in=board_ids)
+        for term in terms:
+            tasks = tasks.filter(
+                Q(title__icontains=term) | Q(description__icontains=term)
+                | Q(pk__in=Comment.objects.filter(content__icontains=term).values('task_id'))
+            )
+        in_title = Q()
+        for term in terms:
+            in_title &= Q(title__icontains=term)
+        ranked = tasks.alias(
+            in_title=Case(When(in_title, then=Value(1)), default=Value(0), output_field=IntegerField())
+        )
+        return list(ranked.order_by('-in_title', 'id').values_list('id', flat=True)[offset:offset + limit])
+
+
+
+class Fts5SearchBackend(SearchBackend):
+    """
+    SQLite-FTS5-Index (siehe Moduldokumentation). Die virtuelle Tabelle wird von der Migration
+    tasks_app.0008_task_search angelegt.
+    """
+    table = 'tasks_app_task_search'
+    # bm25-Gewichte der Spalten title, description, comments, board.
+    weights = (10.0, 4.0, 1.0, 0.0)
+    rank_limit = 20000
+
+    def search(self, terms, board_ids, limit, offset=0):
+        if not terms or not board_ids:
+            return []
+        # Nur der letzte Begriff zählt auch als Wortanfang (Suche während der Eingabe). Präfixe
+        # mit 2-8 Zeichen beantwortet der Präfix-Index der Tabelle, ohne Trefferlisten zu mischen.
+        text = ' AND '.join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+        text = f'{{title description comments}} : ({text})'
+        boards = ' OR '.join(f'b{int(board_id)}' for board_id in board_ids)
+        match = f'{text} AND board : ({boards})'
+        if self._is_common(text):
+            order_by = 'rowid DESC'
+        else:
+            weights = ', '.join(str(weight) for weight in self.weights)
+            order_by = f'bm25({self.table}, {weights}), rowid'
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s '
+                f'ORDER BY {order_by} LIMIT %s OFFSET %s',
+                [match, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _is_common(self, text):
+        """
+        bm25 liest für die Gewichtung die vollständige Trefferliste jedes Begriffs im gesamten
+        Index. Kommen die Begriffe in mehr als rank_limit Tasks vor, wird daher nach Aktualität
+        (neueste Tasks zuerst) sortiert; FTS5 kann dann nach 'limit' Treffern aufhören.
+        Die Prüfung liest höchstens rank_limit + 1 Treffer.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT count(*) FROM (SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s LIMIT %s)',
+                [text, self.rank_limit + 1],
+            )
+            return cursor.fetchone()[0] > self.rank_limit
+
+    def update(self, task_ids):
+        task_ids = [int(task_id) for task_id in set(task_ids)]
+        for start in range(0, len(task_ids), 500):
+            batch = task_ids[start:start + 500]
+            placeholders = ', '.join(['%s'] * len(batch))
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {self.table} WHERE rowid IN ({placeholders})', batch)
+                cursor.execute(self._insert_sql(f'WHERE t.id IN ({placeholders})'), batch)
+
+    def remove_boards(self, board_ids):
+        for board_id in board_ids:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM {self.table} WHERE rowid IN '
+                    f'(SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s)',
+                    [f'board : b{int(board_id)}'],
+                )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(self._insert_sql(''))
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('optimize')")
+        return Task.objects.count()
+
+    def _insert_sql(self, where):
+        # Eine Zeile pro Task; die Kommentare werden per Unterabfrage zusammengefügt.
+        return (
+            f'INSERT INTO {self.table} (rowid, title, description, comments, board) '
+            f"SELECT t.id, t.title, t.description, "
+            f"(SELECT group_concat(c.content, ' ') FROM {Comment._meta.db_table} c WHERE c.task_id = t.id), "
+            f"'b' || t.board_id FROM {Task._meta.db_table} t {where}"
+        )
+
+
+_backend = None
+
+
+def get_search_backend():
+    """
+    Gibt die (prozessweit einmal erzeugte) Backend-Instanz zurück.
+    """
+    global _backend
+    if _backend is None:
+        path = _config('BACKEND')
+        if path is None:
+            backend_class = Fts5SearchBackend if connection.vendor == 'sqlite' else DatabaseSearchBackend
+        else:
+            backend_class = import_string(path)
+        _backend = backend_class()
+    return _backend
+
+
+def index_changes(changes):
+    """
+    Überträgt protokollierte Änderungen [(board_id, kind, object_id, deleted), ...] in den Index:
+    geänderte Tasks und Tasks mit geänderten Kommentaren werden neu indiziert, gelöschte entfernt.
+    """
+    task_ids, comment_ids = set(), set()
+    for _, kind, object_id, deleted in changes:
+        if kind == BoardChange.KIND_TASK:
+            task_ids.add(object_id)
+        elif kind == BoardChange.KIND_COMMENT and not deleted:
+            comment_ids.add(object_id)
+    if comment_ids:
+        task_ids.update(Comment.objects.filter(pk__in=comment_ids).values_list('task_id', flat=True))
+    if task_ids:
+        # Gelöschte Tasks werden beim Neuindizieren nicht mehr gefunden und fallen so heraus.
+        get_search_backend().update(task_ids)
@@ -0,0 +1,23 @@
+"""
+Signal-Handler des tasks_app.
+
+Halten den Suchindex (tasks_app/search.py) aktuell: protokollierte Änderungen an Tasks und
+Kommentaren werden neu indiziert, gelöschte Boards samt ihrer Tasks aus dem Index entfernt.
+"""
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from boards_app.changelog import changes_recorded
+from boards_app.models import Board, BoardChange
+from tasks_app.search import get_search_backend, index_changes
+
+
+@receiver(changes_recorded, sender=BoardChange)
+def board_changes_recorded(sender, changes, **kwargs):
+    index_changes(changes)
+
+
+@receiver(post_delete, sender=Board)
+def board_deleted(sender, instance, **kwargs):
+    get_search_backend().remove_boards([instance.pk])
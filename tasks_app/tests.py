@@ -1,3 +1,541 @@
-from django.test import TestCase
+import datetime
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board, BoardChange, BoardStats
+from boards_app.stats import find_drift
+from tasks_app.api.pagination import TaskKeysetPagination
+from tasks_app.api.serializers import TaskListSerializer
+from tasks_app.api.views import AssignedTasksListView, ReviewingTasksListView, TaskBulkView, TaskDetailView, TaskMoveView
+from tasks_app.models import Comment, Task
+from tasks_app.search import Fts5SearchBackend
+
+
+class TaskPaginationTests(APITestCase):
+    """
+    Tests für die Keyset-Pagination von assigned-to-me und reviewing.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.url = reverse('assigned-to-me')
+        due_dates = [None, datetime.date(2025, 1, 1), datetime.date(2025, 3, 1), None, datetime.date(2025, 3, 1)]
+        for index, due_date in enumerate(due_dates * 2):
+            self._create_task(f'Task {index}', due_date, ['low', 'medium', 'high'][index % 3])
+
+    def _create_task(self, title, due_date=None, priority='medium'):
+        return Task.objects.create(
+            board=self.board, title=title, due_date=due_date, priority=priority,
+            assignee=self.user, created_by=self.user,
+        )
+
+    def _expected_ids(self):
+        tasks = Task.objects.filter(assignee=self.user)
+        ranks = {'low': 0, 'medium': 1, 'high': 2}
+        return [task.id for task in sorted(tasks, key=lambda t: (
+            t.due_date is None, -(t.due_date.toordinal() if t.due_date else 0), -ranks[t.priority], t.id
+        ))]
+
+    def _collect(self, url, on_page=None):
+        ids = []
+        while url:
+            data = self.client.get(url).json()
+            ids += [task['id'] for task in data['results']]
+            url = data['next']
+            if on_page:
+                on_page()
+        return ids
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get(self.url)
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), 10)
+
+    def test_pages_follow_ordering(self):
+        self.assertEqual(self._collect(f'{self.url}?page_size=3'), self._expected_ids())
+
+    def test_pages_stable_during_inserts(self):
+        expected = self._expected_ids()
+        ids = self._collect(f'{self.url}?page_size=4', on_page=lambda: self._create_task('Neu', datetime.date(2030, 1, 1)))
+        self.assertEqual(ids, expected)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f'{self.url}?cursor=kaputt')
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskCreateTests(APITestCase):
+    """
+    Tests für POST /api/tasks/.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.stranger = User.objects.create_user(username='eva', email='eva@example.com', password='pw')
+        self.board = Board.objects.create(title='Alpha', owner=self.owner)
+        self.board.members.set([self.member])
+        self.url = reverse('task-create')
+
+    def _post(self, user, **kwargs):
+        data = {'board': self.board.id, 'title': 'Task', 'status': 'to-do', 'priority': 'low'}
+        data.update(kwargs)
+        self.client.force_authenticate(user)
+        return self.client.post(self.url, data, format='json')
+
+    def test_member_creates_task(self):
+        response = self._post(self.member, assignee_id=self.owner.id, reviewer_id=self.member.id)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['assignee']['id'], self.owner.id)
+        self.assertEqual(response.json()['reviewer']['id'], self.member.id)
+
+    def test_stranger_is_forbidden(self):
+        self.assertEqual(self._post(self.stranger).status_code, 403)
+
+    def test_assignee_must_be_member(self):
+        self.assertEqual(self._post(self.member, assignee_id=self.stranger.id).status_code, 400)
+
+
+class TaskBulkTests(APITestCase):
+    """
+    Tests für POST /api/tasks/bulk/.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.member = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.stranger = User.objects.create_user(username='eva', email='eva@example.com', password='pw')
+        self.board = Board.objects.create(title='Alpha', owner=self.owner)
+        self.board.members.set([self.member])
+        self.foreign_board = Board.objects.create(title='Beta', owner=self.stranger)
+        self.url = reverse('task-bulk')
+        self.client.force_authenticate(self.owner)
+
+    def _create_items(self, count, **kwargs):
+        items = []
+        for index in range(count):
+            item = {'board': self.board.id, 'title': f'Task {index}', 'status': 'to-do', 'priority': 'high'}
+            item.update(kwargs)
+            items.append(item)
+        return items
+
+    def test_creates_and_updates_with_per_item_results(self):
+        task = Task.objects.create(board=self.board, title='Alt', created_by=self.owner)
+        response = self.client.post(self.url, {
+            'create': self._create_items(2, assignee_id=self.member.id) + [
+                {'board': self.board.id, 'title': 'X', 'status': 'kaputt', 'priority': 'low'},
+                {'board': self.foreign_board.id, 'title': 'X', 'status': 'to-do', 'priority': 'low'},
+                {'board': self.board.id, 'title': 'X', 'status': 'to-do', 'priority': 'low', 'reviewer_id': self.stranger.id},
+            ],
+            'update': [{'id': task.id, 'status': 'done'}, {'id': 999999, 'status': 'done'}],
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([item['status'] for item in data['create']], [201, 201, 400, 403, 400])
+        self.assertEqual(data['create'][0]['task']['assignee']['id'], self.member.id)
+        self.assertEqual([item['status'] for item in data['update']], [200, 404])
+        self.assertEqual(data['update'][0]['task']['status'], 'done')
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'done')
+        self.assertEqual(Task.objects.filter(board=self.board).count(), 3)
+        self.assertEqual(find_drift([self.board.id]), {})
+
+    def test_query_count_grows_only_with_insert_batches(self):
+        def post(count):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, {'create': self._create_items(count, reviewer_id=self.member.id)}, format='json')
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        def insert_batches(model, count):
+            # Django teilt INSERTs nach dem Parameterlimit des Backends auf.
+            fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+            return -(-count // connection.ops.bulk_batch_size(fields, []))
+
+        post(1)
+        base = post(5)
+        for count in [100, 500]:
+            extra = insert_batches(Task, count) - 1 + insert_batches(BoardChange, count) - 1
+            self.assertEqual(post(count), base + extra)
+
+    def test_update_writes_only_sent_fields(self):
+        tasks = [Task.objects.create(board=self.board, title=f'Task {i}', created_by=self.owner, position=1024 * (i + 1)) for i in range(2)]
+        # Zwischen Laden und Schreiben ändern andere Requests Position und Beschreibung.
+        Task.objects.filter(pk=tasks[0].pk).update(position=99, description='neu')
+        with mock.patch.object(TaskBulkView, '_load_tasks', return_value={task.pk: task for task in tasks}):
+            response = self.client.post(self.url, {'update': [
+                {'id': tasks[0].id, 'title': 'Umbenannt'},
+                {'id': tasks[1].id, 'status': 'done'},
+            ]}, format='json')
+
+        self.assertEqual([item['status'] for item in response.json()['update']], [200, 200])
+        first, second = Task.objects.get(pk=tasks[0].pk), Task.objects.get(pk=tasks[1].pk)
+        self.assertEqual((first.title, first.position, first.description), ('Umbenannt', 99, 'neu'))
+        self.assertEqual((second.status, second.title), ('done', 'Task 1'))
+
+    def test_update_rereads_state_changed_concurrently(self):
+        self.client.post(self.url, {'create': self._create_items(2)}, format='json')
+        tasks = list(Task.objects.filter(board=self.board).order_by('id'))
+        # Zwischen Validierung und Schreiben setzt ein Request den Status, ein anderer löscht die zweite Task.
+        self.client.patch(reverse('task-detail', args=[tasks[0].pk]), {'status': 'done'}, format='json')
+        self.client.delete(reverse('task-detail', args=[tasks[1].pk]))
+        with mock.patch.object(TaskBulkView, '_load_tasks', return_value={task.pk: task for task in tasks}):
+            response = self.client.post(self.url, {'update': [
+                {'id': tasks[0].id, 'priority': 'low'},
+                {'id': tasks[1].id, 'priority': 'low'},
+            ]}, format='json')
+
+        self.assertEqual([item['status'] for item in response.json()['update']], [200, 404])
+        self.assertEqual(response.json()['update'][0]['task']['status'], 'done')
+        self.assertEqual(find_drift([self.board.id]), {})
+
+    def test_rejects_malformed_body(self):
+        self.assertEqual(self.client.post(self.url, [], format='json').status_code, 400)
+        self.assertEqual(self.client.post(self.url, {'create': self._create_items(501)}, format='json').status_code, 400)
+
+
+class TaskMoveTests(APITestCase):
+    """
+    Tests für die Positionen innerhalb einer Spalte und POST /api/tasks/<id>/move/.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.tasks = [self._create(f'Task {index}') for index in range(4)]
+
+    def _create(self, title, status='to-do'):
+        data = {'board': self.board.id, 'title': title, 'status': status, 'priority': 'low'}
+        return self.client.post(reverse('task-create'), data, format='json').json()['id']
+
+    def _column(self, status='to-do'):
+        return list(Task.objects.filter(board=self.board, status=status).order_by('position').values_list('id', flat=True))
+
+    def _move(self, task_id, **data):
+        return self.client.post(reverse('task-move', args=[task_id]), data, format='json')
+
+    def test_new_tasks_are_appended(self):
+        self.assertEqual(self._column(), self.tasks)
+
+    def test_move_within_column_writes_only_moved_task(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._move(self.tasks[0], after_id=self.tasks[2])
+        self.assertEqual(response.status_code, 200)
+        task_writes = [q for q in queries if q['sql'].startswith('UPDATE "tasks_app_task"')]
+        self.assertEqual(len(task_writes), 1)
+        self.assertEqual(self._column(), [self.tasks[1], self.tasks[2], self.tasks[0], self.tasks[3]])
+
+        self._move(self.tasks[3])
+        self.assertEqual(self._column()[0], self.tasks[3])
+
+    def test_move_to_other_status(self):
+        done = self._create('Fertig', status='done')
+        response = self._move(self.tasks[1], status='done', after_id=done)
+        self.assertEqual(response.json()['status'], 'done')
+        self.assertEqual(self._column('done'), [done, self.tasks[1]])
+        self.assertEqual(BoardStats.objects.get(board=self.board).tasks_to_do_count, 3)
+
+    def test_renumbers_when_gap_is_exhausted(self):
+        for _ in range(12):
+            self.assertEqual(self._move(self.tasks[3], after_id=self.tasks[0]).status_code, 200)
+            self.assertEqual(self._move(self.tasks[2], after_id=self.tasks[0]).status_code, 200)
+        self.assertEqual(self._column()[:3], [self.tasks[0], self.tasks[2], self.tasks[3]])
+        positions = list(Task.objects.filter(board=self.board).order_by('position').values_list('position', flat=True))
+        self.assertEqual(len(set(positions)), 4)
+
+    def test_after_must_be_in_target_column(self):
+        self.assertEqual(self._move(self.tasks[0], status='done', after_id=self.tasks[1]).status_code, 400)
+
+    def test_concurrent_status_change_does_not_drift(self):
+        stale = Task.objects.get(pk=self.tasks[0])
+        self.client.patch(reverse('task-detail', args=[stale.pk]), {'status': 'done'}, format='json')
+
+        # Der Move-Request hat die Task vor dem Update geladen.
+        with mock.patch.object(TaskMoveView, 'get_object', return_value=stale):
+            self.assertEqual(self._move(stale.pk, status='review').status_code, 200)
+        self.assertEqual(Task.objects.get(pk=stale.pk).status, 'review')
+        self.assertEqual(BoardStats.objects.get(board=self.board).tasks_to_do_count, 3)
+        self.assertEqual(find_drift([self.board.id]), {})
+
+
+class CommentCountTests(APITestCase):
+    """
+    Tests für den denormalisierten Zähler Task.comments_count.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.task = Task.objects.create(board=self.board, title='Task', assignee=self.user, created_by=self.user)
+        self.url = reverse('task-comments-list-create', args=[self.task.id])
+
+    def test_create_and_delete_maintain_column(self):
+        ids = [self.client.post(self.url, {'content': f'Kommentar {i}'}, format='json').json()['id'] for i in range(3)]
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 3)
+
+        self.client.delete(reverse('task-comment-detail', args=[self.task.id, ids[0]]))
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 2)
+        self.assertEqual(self.client.get(reverse('assigned-to-me')).json()[0]['comments_count'], 2)
+
+    def test_task_update_keeps_concurrent_count(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        self.client.post(self.url, {'content': 'Hallo'}, format='json')
+        with mock.patch.object(TaskDetailView, 'get_object', return_value=stale):
+            response = self.client.patch(reverse('task-detail', args=[self.task.id]), {'title': 'Neu'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.comments_count), ('Neu', 1))
+
+    def test_list_does_not_count_comments(self):
+        self.client.post(self.url, {'content': 'Hallo'}, format='json')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('assigned-to-me'))
+        self.assertFalse(any('tasks_app_comment' in query['sql'] for query in queries))
+
+    def test_repair_command(self):
+        self.client.post(self.url, {'content': 'Hallo'}, format='json')
+        Task.objects.filter(pk=self.task.pk).update(comments_count=7)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_comment_counts', verify=True, stdout=StringIO())
+        call_command('rebuild_comment_counts', stdout=StringIO())
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 1)
+
+
+class FastRenderingTests(APITestCase):
+    """
+    Der schnelle Lesepfad muss byte-identisches JSON liefern.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.other = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        for index in range(6):
+            Task.objects.create(
+                board=self.board, title=f'Task {index}', description='Ä "zitiert"', created_by=self.user,
+                assignee=self.user, reviewer=self.other if index % 2 else None,
+                due_date=datetime.date(2025, 1, index + 1) if index % 3 else None, comments_count=index,
+            )
+
+    def _compare(self, view_class, url):
+        fast = self.client.get(url).content
+        with mock.patch.object(view_class, 'fast_rendering', False):
+            cache.clear()
+            slow = self.client.get(url).content
+        self.assertEqual(fast, slow)
+
+    def test_task_lists_are_byte_identical(self):
+        self._compare(AssignedTasksListView, reverse('assigned-to-me'))
+        self._compare(AssignedTasksListView, reverse('assigned-to-me') + '?page_size=4')
+        self.client.force_authenticate(self.other)
+        self._compare(ReviewingTasksListView, reverse('reviewing'))
+
+
+
+class TaskSearchTests(APITestCase):
+    """
+    Tests für /api/tasks/search/ und den FTS5-Index.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.other = User.objects.create_user(username='max', email='max@example.com', password='pw')
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.foreign = Board.objects.create(title='Fremd', owner=self.other)
+        self.client.force_authenticate(self.user)
+
+    def _create_task(self, board, title, description=''):
+        response = self.client.post(reverse('task-create'), {
+            'board': board.id, 'title': title, 'description': description, 'status': 'to-do', 'priority': 'low',
+        }, format='json')
+        return response.json()['id']
+
+    def _search(self, query, **params):
+        response = self.client.get(reverse('task-search'), {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def _ids(self, query):
+        return [task['id'] for task in self._search(query)['results']]
+
+    def test_ranking_and_prefix_match(self):
+        in_description = self._create_task(self.board, 'Aufräumen', 'Datenbank migrieren')
+        in_title = self._create_task(self.board, 'Datenbank sichern')
+        self.assertEqual(self._ids('datenb'), [in_title, in_description])
+        self.assertEqual(self._ids('datenbank sichern'), [in_title])
+
+        # Sehr häufige Begriffe werden nach Aktualität sortiert.
+        with mock.patch.object(Fts5SearchBackend, 'rank_limit', 1):
+            self.assertEqual(self._ids('datenb'), [in_title, in_description])
+            newest = self._create_task(self.board, 'Aufräumen', 'Datenbank löschen')
+            self.assertEqual(self._ids('datenb'), [newest, in_title, in_description])
+
+    def test_index_follows_writes(self):
+        task_id = self._create_task(self.board, 'Release')
+        comment = self.client.post(
+            reverse('task-comments-list-create', args=[task_id]), {'content': 'Changelog fehlt'}, format='json'
+        ).json()['id']
+        self.assertEqual(self._ids('changelog'), [task_id])
+
+        self.client.patch(reverse('task-comment-detail', args=[task_id, comment]), {'content': 'Doku fehlt'}, format='json')
+        self.assertEqual(self._ids('changelog'), [])
+        self.assertEqual(self._ids('doku'), [task_id])
+
+        self.client.patch(reverse('task-detail', args=[task_id]), {'title': 'Deployment'}, format='json')
+        self.assertEqual(self._ids('release'), [])
+        self.client.delete(reverse('task-detail', args=[task_id]))
+        self.assertEqual(self._ids('deployment'), [])
+
+    def test_only_accessible_boards(self):
+        own = self._create_task(self.board, 'Budget planen')
+        Task.objects.create(board=self.foreign, title='Budget fremd', created_by=self.other)
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(self._ids('budget'), [own])
+
+        self.foreign.members.add(self.user)
+        self.assertEqual(len(self._ids('budget')), 2)
+
+    def test_pagination(self):
+        ids = [self._create_task(self.board, f'Ticket {index}') for index in range(5)]
+        first = self._search('ticket', page_size=2)
+        self.assertEqual(len(first['results']), 2)
+        self.assertIsNone(first['previous'])
+        second = self.client.get(first['next']).json()
+        third = self.client.get(second['next']).json()
+        self.assertIsNone(third['next'])
+        found = [task['id'] for page in (first, second, third) for task in page['results']]
+        self.assertEqual(sorted(found), ids)
+
+    def test_board_delete_and_rebuild(self):
+        Task.objects.create(board=self.board, title='Nachträglich', created_by=self.user)
+        self.assertEqual(self._ids('nachträglich'), [])
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(len(self._ids('nachtraglich')), 1)
+
+        self.board.delete()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT count(*) FROM tasks_app_task_search')
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_missing_query(self):
+        self.assertEqual(self.client.get(reverse('task-search'), {'q': '  ** '}).status_code, 400)
+
+
+
+class QueryPlanTests(APITestCase):
+    """
+    Prüft per EXPLAIN QUERY PLAN, dass die häufigsten Abfragen auf Tasks und Kommentare über
+    Indizes laufen (kein SCAN der Tabelle) und ohne nachträgliche Sortierung (TEMP B-TREE).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.board = Board.objects.create(title='Projekt', owner=self.user)
+
+    def _plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def _keyset(self, queryset):
+        pagination = TaskKeysetPagination()
+        pagination.model = Task
+        pagination.ordering = pagination.get_ordering(Task)
+        return queryset.order_by(*pagination._order_by())[:51]
+
+    def assertIndexed(self, queryset, index, allow_sort=False):
+        plan = self._plan(queryset)
+        self.assertFalse([step for step in plan if step.startswith('SCAN')], plan)
+        self.assertTrue([step for step in plan if index in step], plan)
+        if not allow_sort:
+            self.assertFalse([step for step in plan if 'TEMP B-TREE' in step], plan)
+
+    def test_column_of_board(self):
+        tasks = Task.objects.filter(board=self.board, status='to-do').order_by('position')
+        self.assertIndexed(tasks, 'task_column_position_idx')
+
+    def test_board_and_priority(self):
+        self.assertIndexed(Task.objects.filter(board=self.board, priority='high').order_by(), 'task_board_priority_idx')
+
+    def test_reviewing_list(self):
+        tasks = TaskListSerializer.prepare_queryset(Task.objects.filter(reviewer=self.user))
+        self.assertIndexed(tasks, 'task_reviewer_due_idx')
+        self.assertIndexed(self._keyset(tasks), 'task_reviewer_due_idx')
+
+    def test_assigned_to_me_list(self):
+        # Für ein OR über zwei Indizes muss SQLite die Treffer sortieren; die Menge ist aber auf
+        # die Tasks des Users begrenzt. Geprüft wird, dass beide Zweige ihren Index nutzen.
+        tasks = TaskListSerializer.prepare_queryset(
+            Task.objects.filter(models.Q(assignee=self.user) | models.Q(reviewer=self.user))
+        )
+        self.assertIndexed(tasks, 'task_assignee_due_idx', allow_sort=True)
+        self.assertIndexed(tasks, 'task_reviewer_due_idx', allow_sort=True)
+
+    def test_board_detail_columns(self):
+        tasks = Task.objects.filter(board=self.board).order_by('status', 'position', 'id')
+        self.assertIndexed(tasks, 'task_column_position_idx')
+
+    def test_comments_of_task(self):
+        comments = Comment.objects.filter(task_id=1)
+        self.assertIndexed(comments.order_by('created_at'), 'comment_task_created_idx')
+        self.assertIndexed(comments, 'comment_task_created_idx')
+
+
+
+class RankedChoiceFieldTests(APITestCase):
+    """
+    Tests für status/priority als RankedChoiceField (tasks_app/fields.py).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='lisa', email='lisa@example.com', password='pw')
+        self.board = Board.objects.create(title='Projekt', owner=self.user)
+        for priority, status in [('medium', 'done'), ('high', 'to-do'), ('low', 'review')]:
+            Task.objects.create(board=self.board, title=priority, priority=priority, status=status, created_by=self.user)
+
+    def test_ranks_are_stored(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT priority, status FROM tasks_app_task ORDER BY id')
+            self.assertEqual(cursor.fetchall(), [(1, 3), (2, 0), (0, 2)])
+
+    def test_values_and_ordering_use_choice_order(self):
+        self.assertEqual(list(Task.objects.order_by('priority').values_list('priority', flat=True)), ['low', 'medium', 'high'])
+        self.assertEqual(list(Task.objects.values_list('priority', flat=True)), ['high', 'medium', 'low'])
+        self.assertEqual(list(Task.objects.order_by('status').values_list('status', flat=True)), ['to-do', 'review', 'done'])
+        self.assertEqual(Task.objects.filter(status__in=['to-do', 'done']).count(), 2)
+
+    def test_api_keeps_string_values(self):
+        self.client.force_authenticate(self.user)
+        task = Task.objects.get(priority='high')
+        response = self.client.patch(reverse('task-detail', args=[task.pk]), {'priority': 'low'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['priority'], 'low')
+        self.assertEqual(Task.objects.get(pk=task.pk).priority, 'low')
+
+        response = self.client.patch(reverse('task-detail', args=[task.pk]), {'priority': 'urgent'}, format='json')
+        self.assertEqual(response.status_code, 400)